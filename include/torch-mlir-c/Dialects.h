@@ -18,6 +18,12 @@ extern "C" {
 
 MLIR_DECLARE_CAPI_DIALECT_REGISTRATION(Torch, torch);
 
+/// Returns the number of abstract interpretation libraries that were loaded
+/// into the library cache of `context`, or 0 if the torch dialect is not
+/// loaded.
+MLIR_CAPI_EXPORTED intptr_t
+torchMlirContextGetNumLibraryLoads(MlirContext context);
+
 #ifdef __cplusplus
 }
 #endif
@@ -0,0 +1,54 @@
+/*===-- torch-mlir-c/PassReport.h - Pass timing and statistics ----*- C -*-===*\
+|*                                                                            *|
+|* Part of the LLVM Project, under the Apache License v2.0 with LLVM          *|
+|* Exceptions.                                                                *|
+|* See https://llvm.org/LICENSE.txt for license information.                  *|
+|* SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception                    *|
+|*                                                                            *|
+\*===----------------------------------------------------------------------===*/
+
+#ifndef TORCHMLIR_C_PASSREPORT_H
+#define TORCHMLIR_C_PASSREPORT_H
+
+#include "mlir-c/Pass.h"
+#include "mlir-c/Support.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/** Per-pass wall time and statistics collected from the runs of a pass
+ * manager. Unlike `-mlir-timing`, collection does not require disabling
+ * multithreading and the result is available as data rather than printed.
+ */
+typedef struct TorchMlirPassReport {
+  void *ptr;
+} TorchMlirPassReport;
+
+/** Instruments `passManager` to collect a report. Passes are recorded by
+ * argument (or name), in order of first execution, with the number of times
+ * they ran and, if `timing`, their cumulative (inclusive) wall time and, if
+ * `statistics`, the sum of each of their statistics. Note that statistics are
+ * only counted if LLVM was built with statistics enabled. The report remains
+ * valid after the pass manager is destroyed and must be destroyed with
+ * `torchMlirPassReportDestroy`.
+ */
+MLIR_CAPI_EXPORTED TorchMlirPassReport torchMlirPassManagerAddReport(
+    MlirPassManager passManager, bool timing, bool statistics);
+
+/** Prints the report as a JSON document of the form:
+ *   {"passes": [{"pass": <argument>, "name": <name>, "count": <int>,
+ *                "seconds": <float>, "statistics": {<name>: <int>}}]}
+ */
+MLIR_CAPI_EXPORTED void
+torchMlirPassReportPrintJson(TorchMlirPassReport report,
+                             MlirStringCallback callback, void *userData);
+
+/** Destroys a report. */
+MLIR_CAPI_EXPORTED void torchMlirPassReportDestroy(TorchMlirPassReport report);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // TORCHMLIR_C_PASSREPORT_H
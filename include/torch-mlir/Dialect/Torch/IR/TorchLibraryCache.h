@@ -0,0 +1,103 @@
+//===------------------------------------------------------------*- C++ -*-===//
+//
+// This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+// See https://llvm.org/LICENSE.txt for license information.
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+// Also available under a BSD-style license. See LICENSE.
+//
+//===----------------------------------------------------------------------===//
+
+#ifndef TORCHMLIR_DIALECT_TORCH_IR_TORCHLIBRARYCACHE_H
+#define TORCHMLIR_DIALECT_TORCH_IR_TORCHLIBRARYCACHE_H
+
+#include "mlir/Dialect/Func/IR/FuncOps.h"
+#include "mlir/IR/BuiltinOps.h"
+#include "mlir/IR/DialectInterface.h"
+#include "mlir/IR/OwningOpRef.h"
+#include "llvm/ADT/SmallVector.h"
+#include "llvm/ADT/StringMap.h"
+#include "llvm/ADT/StringRef.h"
+
+#include <memory>
+#include <mutex>
+
+namespace mlir {
+namespace torch {
+namespace Torch {
+
+/// The location of a function in the textual source of a library.
+struct TorchLibraryFunction {
+  llvm::StringLiteral name;
+  size_t offset;
+  size_t size;
+};
+
+/// A library of functions, such as the abstract interpretation library, that
+/// is shared by all the passes that use it in a context.
+///
+/// A library is built from the source of a module and an index of the
+/// functions in it. Functions are parsed when they are first looked up, so
+/// that using a library costs O(#functions used) rather than O(library size).
+/// Looked up functions are never modified (and may be used from several
+/// threads at once): users clone the functions that they need rather than
+/// moving them out of the library.
+class TorchLibrary {
+public:
+  /// `source` must outlive the library.
+  TorchLibrary(MLIRContext *context, StringRef source,
+               ArrayRef<TorchLibraryFunction> index);
+
+  /// Adds the functions of `module` (which are parsed already) to the
+  /// library. Functions of the indexed source take precedence over functions
+  /// of the same name in `module`.
+  void addModule(OwningOpRef<ModuleOp> module);
+
+  /// Returns the function named `name`, parsing it if needed, or null if
+  /// there is none. Callees of the function are not parsed until they are
+  /// looked up themselves.
+  func::FuncOp lookupFunction(StringRef name) const;
+
+private:
+  MLIRContext *context;
+  llvm::StringMap<StringRef> sources;
+  // Guards `functions` and `modules`, which cache the parsed functions.
+  mutable std::mutex mutex;
+  mutable llvm::StringMap<func::FuncOp> functions;
+  mutable SmallVector<OwningOpRef<ModuleOp>> modules;
+};
+
+/// Caches the libraries loaded into a context. The cache is a dialect
+/// interface of the torch dialect, so that the libraries are destroyed with
+/// their context.
+class TorchLibraryCacheInterface
+    : public DialectInterface::Base<TorchLibraryCacheInterface> {
+public:
+  TorchLibraryCacheInterface(Dialect *dialect) : Base(dialect) {}
+
+  /// Returns the library cached under `key`, first loading it with `load`
+  /// if it is not cached yet. Returns null (and caches nothing) if `load`
+  /// fails by returning null.
+  const TorchLibrary *
+  getOrLoad(StringRef key, function_ref<std::unique_ptr<TorchLibrary>()> load);
+
+  /// Returns the number of libraries that were loaded (rather than found in
+  /// the cache) so far.
+  uint64_t getNumLoads();
+
+  /// Returns the cache of `context`.
+  static TorchLibraryCacheInterface &get(MLIRContext *context);
+
+private:
+  // Guards `libraries` and `numLoads`. Libraries are loaded with the lock
+  // held, so that concurrent passes wait for a library rather than also
+  // loading it.
+  std::mutex mutex;
+  llvm::StringMap<std::unique_ptr<TorchLibrary>> libraries;
+  uint64_t numLoads = 0;
+};
+
+} // namespace Torch
+} // namespace torch
+} // namespace mlir
+
+#endif // TORCHMLIR_DIALECT_TORCH_IR_TORCHLIBRARYCACHE_H
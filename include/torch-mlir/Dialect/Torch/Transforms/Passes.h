@@ -12,6 +12,7 @@
 
 #include "mlir/Dialect/Func/IR/FuncOps.h"
 #include "mlir/Pass/Pass.h"
+#include "torch-mlir/Dialect/Torch/IR/TorchLibraryCache.h"
 
 #include <memory>
 
@@ -63,6 +64,14 @@ struct TorchLoweringPipelineOptions
       *this, "extra-library",
       llvm::cl::desc("Filename of MLIR module for splicing into the abstract "
                      "interpretation library.")};
+
+  // If this option is true, LowerToBackendContract re-runs the simplification
+  // pipeline only on the functions that still need it.
+  Option<bool> incremental{
+      *this, "incremental",
+      llvm::cl::desc("Only re-run the simplification pipeline on functions "
+                     "that violate the backend contract or changed."),
+      llvm::cl::init(false)};
 };
 
 /// Creates a pipeline that lowers the object graph IR that is produced by
@@ -130,16 +139,18 @@ createDropAbstractInterpCalculationsPass();
 
 std::unique_ptr<OperationPass<ModuleOp>> createEraseModuleInitializerPass();
 
-std::unique_ptr<OperationPass<ModuleOp>>
-createLowerToBackendContractPass(int maxIterations, bool decompose,
-                                 ArrayRef<std::string> backendLegalOps,
-                                 StringRef extraLibrary);
+std::unique_ptr<OperationPass<ModuleOp>> createLowerToBackendContractPass(
+    int maxIterations, bool decompose, ArrayRef<std::string> backendLegalOps,
+    StringRef extraLibrary, bool incremental = false);
 
 std::unique_ptr<OperationPass<ModuleOp>>
 createVerifyBackendContractNoDecompositionsPass();
 
 StringRef getAbstractInterpLibrary();
 
+/// Returns the location of each function in `getAbstractInterpLibrary()`.
+ArrayRef<TorchLibraryFunction> getAbstractInterpLibraryIndex();
+
 static const char kTorchOpPrefix[] = R"(torch.)";
 
 } // namespace Torch
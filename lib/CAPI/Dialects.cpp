@@ -9,8 +9,20 @@
 
 #include "torch-mlir-c/Dialects.h"
 
+#include "mlir/CAPI/IR.h"
 #include "mlir/CAPI/Registration.h"
 #include "torch-mlir/Dialect/Torch/IR/TorchDialect.h"
+#include "torch-mlir/Dialect/Torch/IR/TorchLibraryCache.h"
+
+using namespace mlir;
+using namespace mlir::torch::Torch;
 
 MLIR_DEFINE_CAPI_DIALECT_REGISTRATION(Torch, torch,
                                       mlir::torch::Torch::TorchDialect)
+
+intptr_t torchMlirContextGetNumLibraryLoads(MlirContext context) {
+  MLIRContext *ctx = unwrap(context);
+  if (!ctx->getLoadedDialect<TorchDialect>())
+    return 0;
+  return TorchLibraryCacheInterface::get(ctx).getNumLoads();
+}
@@ -0,0 +1,156 @@
+//===- PassReport.cpp - C Interface for pass timing and statistics --------===//
+//
+// Part of the LLVM Project, under the Apache License v2.0 with LLVM Exceptions.
+// See https://llvm.org/LICENSE.txt for license information.
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+// Also available under a BSD-style license. See LICENSE.
+//
+//===----------------------------------------------------------------------===//
+
+#include "torch-mlir-c/PassReport.h"
+
+#include "mlir/CAPI/Pass.h"
+#include "mlir/CAPI/Support.h"
+#include "mlir/CAPI/Utils.h"
+#include "mlir/Pass/PassInstrumentation.h"
+#include "mlir/Pass/PassManager.h"
+#include "llvm/ADT/DenseMap.h"
+#include "llvm/ADT/MapVector.h"
+#include "llvm/ADT/STLExtras.h"
+#include "llvm/Support/JSON.h"
+
+#include <chrono>
+#include <memory>
+#include <mutex>
+
+using namespace mlir;
+
+namespace {
+using Clock = std::chrono::steady_clock;
+
+struct PassReportEntry {
+  std::string name;
+  uint64_t count = 0;
+  double seconds = 0.0;
+  llvm::MapVector<StringRef, uint64_t> statistics;
+};
+
+struct PassReportState {
+  PassReportState(bool timing, bool statistics)
+      : timing(timing), statistics(statistics) {}
+
+  struct Activation {
+    Clock::time_point start;
+    // Values of the pass statistics when the pass started. Pass instances
+    // are cloned per thread, so only the deltas of each run are summed.
+    SmallVector<uint64_t> statistics;
+  };
+
+  const bool timing;
+  const bool statistics;
+  // Guards the fields below, which are updated from every pass manager
+  // thread.
+  std::mutex mutex;
+  // Keyed by pass argument (or name), in order of first execution.
+  llvm::MapVector<std::string, PassReportEntry> entries;
+  DenseMap<std::pair<Pass *, Operation *>, Activation> activations;
+};
+
+using PassReportStateRef = std::shared_ptr<PassReportState>;
+
+class PassReportInstrumentation : public PassInstrumentation {
+public:
+  PassReportInstrumentation(PassReportStateRef state)
+      : state(std::move(state)) {}
+
+  void runBeforePass(Pass *pass, Operation *op) override {
+    PassReportState::Activation activation;
+    if (state->statistics) {
+      for (Pass::Statistic *statistic : pass->getStatistics())
+        activation.statistics.push_back(statistic->getValue());
+    }
+    activation.start = Clock::now();
+    std::lock_guard<std::mutex> lock(state->mutex);
+    state->activations[{pass, op}] = std::move(activation);
+  }
+
+  void runAfterPass(Pass *pass, Operation *op) override { record(pass, op); }
+
+  void runAfterPassFailed(Pass *pass, Operation *op) override {
+    record(pass, op);
+  }
+
+private:
+  void record(Pass *pass, Operation *op) {
+    Clock::time_point end = Clock::now();
+    std::lock_guard<std::mutex> lock(state->mutex);
+    auto it = state->activations.find({pass, op});
+    if (it == state->activations.end())
+      return;
+    PassReportState::Activation activation = std::move(it->second);
+    state->activations.erase(it);
+
+    StringRef key = pass->getArgument();
+    if (key.empty())
+      key = pass->getName();
+    PassReportEntry &entry = state->entries[key.str()];
+    if (entry.name.empty())
+      entry.name = pass->getName().str();
+    ++entry.count;
+    if (state->timing)
+      entry.seconds +=
+          std::chrono::duration<double>(end - activation.start).count();
+    if (state->statistics) {
+      for (auto [statistic, before] :
+           llvm::zip(pass->getStatistics(), activation.statistics))
+        entry.statistics[statistic->getName()] +=
+            statistic->getValue() - before;
+    }
+  }
+
+  PassReportStateRef state;
+};
+} // namespace
+
+static PassReportStateRef &unwrap(TorchMlirPassReport report) {
+  return *static_cast<PassReportStateRef *>(report.ptr);
+}
+
+TorchMlirPassReport torchMlirPassManagerAddReport(MlirPassManager passManager,
+                                                  bool timing,
+                                                  bool statistics) {
+  auto state = std::make_shared<PassReportState>(timing, statistics);
+  unwrap(passManager)
+      ->addInstrumentation(std::make_unique<PassReportInstrumentation>(state));
+  return TorchMlirPassReport{new PassReportStateRef(std::move(state))};
+}
+
+void torchMlirPassReportPrintJson(TorchMlirPassReport report,
+                                  MlirStringCallback callback, void *userData) {
+  PassReportState &state = *unwrap(report);
+  llvm::json::Array passes;
+  {
+    std::lock_guard<std::mutex> lock(state.mutex);
+    for (auto &[key, entry] : state.entries) {
+      llvm::json::Object pass{
+          {"pass", key}, {"name", entry.name}, {"count", entry.count}};
+      if (state.timing)
+        pass["seconds"] = entry.seconds;
+      if (state.statistics) {
+        llvm::json::Object statistics;
+        for (auto &[name, value] : entry.statistics)
+          statistics[name] = value;
+        pass["statistics"] = std::move(statistics);
+      }
+      passes.push_back(std::move(pass));
+    }
+  }
+  llvm::json::Value json(llvm::json::Object{{"passes", std::move(passes)}});
+  mlir::detail::CallbackOstream stream(callback, userData);
+  stream << json;
+  stream.flush();
+}
+
+void torchMlirPassReportDestroy(TorchMlirPassReport report) {
+  delete static_cast<PassReportStateRef *>(report.ptr);
+}
@@ -13,6 +13,7 @@
 #include "mlir/IR/DialectImplementation.h"
 #include "mlir/IR/IRMapping.h"
 #include "mlir/Transforms/InliningUtils.h"
+#include "torch-mlir/Dialect/Torch/IR/TorchLibraryCache.h"
 #include "torch-mlir/Dialect/Torch/IR/TorchOps.h"
 #include "torch-mlir/Dialect/Torch/IR/TorchTypes.h"
 #include "llvm/ADT/StringExtras.h"
@@ -107,7 +108,7 @@ void TorchDialect::initialize() {
 #include "torch-mlir/Dialect/Torch/IR/TorchTypes.cpp.inc"
 
       >();
-  addInterfaces<TorchInlinerInterface>();
+  addInterfaces<TorchInlinerInterface, TorchLibraryCacheInterface>();
 }
 
 //===----------------------------------------------------------------------===//
@@ -0,0 +1,86 @@
+//===----------------------------------------------------------------------===//
+//
+// Part of the LLVM Project, under the Apache License v2.0 with LLVM Exceptions.
+// See https://llvm.org/LICENSE.txt for license information.
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+// Also available under a BSD-style license. See LICENSE.
+//
+//===----------------------------------------------------------------------===//
+
+#include "torch-mlir/Dialect/Torch/IR/TorchLibraryCache.h"
+#include "mlir/Parser/Parser.h"
+#include "torch-mlir/Dialect/Torch/IR/TorchDialect.h"
+
+using namespace mlir;
+using namespace mlir::torch;
+using namespace mlir::torch::Torch;
+
+TorchLibrary::TorchLibrary(MLIRContext *context, StringRef source,
+                           ArrayRef<TorchLibraryFunction> index)
+    : context(context) {
+  for (const TorchLibraryFunction &function : index) {
+    StringRef functionSource = source.substr(function.offset, function.size);
+    assert(functionSource.starts_with("  func.func") &&
+           "the index does not match the library");
+    sources[function.name] = functionSource;
+  }
+}
+
+void TorchLibrary::addModule(OwningOpRef<ModuleOp> module) {
+  std::lock_guard<std::mutex> lock(mutex);
+  for (auto func : module->getOps<func::FuncOp>())
+    if (!sources.count(func.getSymName()))
+      functions.try_emplace(func.getSymName(), func);
+  modules.push_back(std::move(module));
+}
+
+func::FuncOp TorchLibrary::lookupFunction(StringRef name) const {
+  std::lock_guard<std::mutex> lock(mutex);
+  if (func::FuncOp func = functions.lookup(name))
+    return func;
+  StringRef source = sources.lookup(name);
+  if (source.empty())
+    return nullptr;
+
+  // The callees of the function are not parsed yet, so its calls cannot be
+  // verified. The library is generated, and the functions are verified when
+  // they are imported into a program.
+  ParserConfig config(context, /*verifyAfterParse=*/false);
+  OwningOpRef<ModuleOp> module = parseSourceString<ModuleOp>(source, config);
+  assert(module && "broken library");
+  auto func = cast<func::FuncOp>(module->getBody()->front());
+  functions[name] = func;
+  modules.push_back(std::move(module));
+  return func;
+}
+
+const TorchLibrary *TorchLibraryCacheInterface::getOrLoad(
+    StringRef key, function_ref<std::unique_ptr<TorchLibrary>()> load) {
+  std::lock_guard<std::mutex> lock(mutex);
+  std::unique_ptr<TorchLibrary> &library = libraries[key];
+  if (!library) {
+    library = load();
+    if (!library) {
+      libraries.erase(key);
+      return nullptr;
+    }
+    ++numLoads;
+  }
+  return library.get();
+}
+
+uint64_t TorchLibraryCacheInterface::getNumLoads() {
+  std::lock_guard<std::mutex> lock(mutex);
+  return numLoads;
+}
+
+TorchLibraryCacheInterface &
+TorchLibraryCacheInterface::get(MLIRContext *context) {
+  // Dialects cannot be loaded while passes are running, so the torch dialect
+  // must already be loaded (i.e. as a dependent dialect of the pass).
+  auto *dialect = context->getLoadedDialect<TorchDialect>();
+  assert(dialect && "the torch dialect must be loaded");
+  auto *cache = dialect->getRegisteredInterface<TorchLibraryCacheInterface>();
+  assert(cache && "the torch dialect registers the library cache");
+  return *cache;
+}
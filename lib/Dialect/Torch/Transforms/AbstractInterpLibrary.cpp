@@ -15,6 +15,7 @@
 #include "torch-mlir/Dialect/Torch/Transforms/Passes.h"
 
 using namespace mlir;
+using namespace mlir::torch::Torch;
 
 StringRef mlir::torch::Torch::getAbstractInterpLibrary() {
 #if defined(__clang__)
@@ -13517,3 +13518,831 @@ StringRef mlir::torch::Torch::getAbstractInterpLibrary() {
 #pragma clang diagnostic pop
 #endif
 }
+
+ArrayRef<TorchLibraryFunction>
+mlir::torch::Torch::getAbstractInterpLibraryIndex() {
+  // clang-format off
+  static const TorchLibraryFunction index[] = {
+    {"__torch__.torch.jit._shape_functions.unary", 9, 640},
+    {"__torch__.torch.jit._shape_functions._copy", 649, 640},
+    {"__torch__.torch.jit._shape_functions.adaptive_avg_pool2d", 1289, 3341},
+    {"__torch__.torch.jit._shape_functions.zero_dim_tensor", 4630, 204},
+    {"__torch__.torch.jit._shape_functions.arange_end", 4834, 836},
+    {"__torch__.torch.jit._shape_functions.arange_start", 5670, 1253},
+    {"__torch__.torch.jit._shape_functions.arange_start_step", 6923, 1836},
+    {"__torch__.torch.jit._shape_functions.squeeze_nodim", 8759, 968},
+    {"__torch__.torch.jit._shape_functions.squeeze", 9727, 2784},
+    {"__torch__.torch.jit._shape_functions.maybe_wrap_dim", 12511, 1755},
+    {"__torch__.torch.jit._shape_functions.squeeze_dims", 14266, 4271},
+    {"__torch__.torch.jit._shape_functions.unsqueeze", 18537, 2258},
+    {"__torch__.torch.jit._shape_functions.slice", 20795, 6214},
+    {"__torch__.torch.jit._shape_functions.max_int", 27009, 197},
+    {"__torch__.torch.jit._shape_functions.select", 27206, 3190},
+    {"__torch__.torch.jit._shape_functions.index_select", 30396, 3745},
+    {"__torch__.torch.jit._shape_functions.multiply_integers", 34141, 667},
+    {"__torch__.torch.jit._shape_functions.embedding", 34808, 4350},
+    {"__torch__.torch.jit._shape_functions.mm", 39158, 1814},
+    {"__torch__.torch.jit._shape_functions.dot", 40972, 1449},
+    {"__torch__.torch.jit._shape_functions.mv", 42421, 1585},
+    {"__torch__.torch.jit._shape_functions.matmul", 44006, 18129},
+    {"__torch__.torch.jit._shape_functions.broadcast", 62135, 3374},
+    {"__torch__.torch.jit._shape_functions.linear", 65509, 23121},
+    {"__torch__.torch.jit._shape_functions.t", 88630, 1707},
+    {"__torch__.torch.jit._shape_functions.max_pool2d", 90337, 16634},
+    {"__torch__.torch.jit._shape_functions.pooling_output_shape", 106971, 854},
+    {"__torch__.torch.jit._shape_functions.pooling_output_shape_pad_lr", 107825, 2008},
+    {"__torch__.torch.jit._shape_functions.div_rtn", 109833, 228},
+    {"__torch__.torch.jit._shape_functions.pool2d_shape_check", 110061, 5391},
+    {"__torch__.torch.jit._shape_functions.max_pool2d_with_indices", 115452, 16803},
+    {"__torch__.torch.jit._shape_functions.transpose", 132255, 4843},
+    {"__torch__.torch.jit._shape_functions.conv1d", 137098, 9892},
+    {"__torch__.torch.jit._shape_functions.conv_output_size", 146990, 3312},
+    {"__torch__.torch.jit._shape_functions.check_shape_forward", 150302, 5568},
+    {"__torch__.torch.jit._shape_functions.check_non_negative", 155870, 880},
+    {"__torch__.torch.jit._shape_functions.conv2d", 156750, 9892},
+    {"__torch__.torch.jit._shape_functions.batch_norm", 166642, 867},
+    {"__torch__.torch.jit._shape_functions.conv3d", 167509, 9892},
+    {"__torch__.torch.jit._shape_functions.conv_backwards", 177401, 1602},
+    {"__torch__.torch.jit._shape_functions.conv_forwards", 179003, 5613},
+    {"__torch__.torch.jit._shape_functions._conv_forwards", 184616, 5699},
+    {"__torch__.torch.jit._shape_functions.conv_transpose2d_input", 190315, 5289},
+    {"__torch__.torch.jit._shape_functions.flatten", 195604, 6323},
+    {"__torch__.torch.jit._shape_functions.cat", 201927, 11140},
+    {"__torch__.torch.jit._shape_functions.check_cat_no_zero_dim", 213067, 963},
+    {"__torch__.torch.jit._shape_functions.legacy_cat_wrap_dim", 214030, 2540},
+    {"__torch__.torch.jit._shape_functions.should_skip", 216570, 718},
+    {"__torch__.torch.jit._shape_functions.numel", 217288, 655},
+    {"__torch__.torch.jit._shape_functions.check_cat_shape_except_dim", 217943, 1931},
+    {"__torch__.torch.jit._shape_functions.stack", 219874, 13634},
+    {"__torch__.torch.jit._shape_functions.permute", 233508, 3690},
+    {"__torch__.torch.jit._shape_functions.movedim", 237198, 11537},
+    {"__torch__.torch.jit._shape_functions.view", 248735, 5212},
+    {"__torch__.torch.jit._shape_functions.infer_size_impl", 253947, 4395},
+    {"__torch__.torch.jit._shape_functions.expand", 258342, 3794},
+    {"__torch__.torch.jit._shape_functions.expand_one_unused", 262136, 3824},
+    {"__torch__.torch.jit._shape_functions.sum_mean_dim", 265960, 4420},
+    {"__torch__.torch.jit._shape_functions.max_dim", 270380, 3413},
+    {"__torch__.torch.jit._shape_functions.addmm", 273793, 4821},
+    {"__torch__.torch.jit._shape_functions.upsample_nearest2d", 278614, 5101},
+    {"__torch__.torch.jit._shape_functions.argmax", 283715, 3282},
+    {"__torch__.torch.jit._shape_functions._reduce_along_dim", 286997, 1585},
+    {"__torch__.torch.jit._shape_functions.bmm", 288582, 2440},
+    {"__torch__.torch.jit._shape_functions._shape_as_tensor", 291022, 288},
+    {"__torch__.torch.jit._shape_functions.topk", 291310, 2177},
+    {"__torch__.torch.jit._shape_functions.nll_loss_forward", 293487, 4258},
+    {"__torch__.torch.jit._shape_functions.native_layer_norm", 297745, 2300},
+    {"__torch__.torch.jit._shape_functions.native_batch_norm", 300045, 1499},
+    {"__torch__.torch.jit._shape_functions._batch_norm_with_update", 301544, 1366},
+    {"__torch__.torch.jit._shape_functions.cross_entropy_loss", 302910, 4145},
+    {"__torch__.torch.jit._shape_functions.broadcast_three", 307055, 6276},
+    {"__torch__.torch.jit._shape_functions.broadcast_one_three", 313331, 3403},
+    {"__torch__.torch.jit._shape_functions.broadcast_inplace", 316734, 3098},
+    {"__torch__.torch.jit._shape_functions.nonzero_lower_bound", 319832, 343},
+    {"__torch__.torch.jit._shape_functions.nonzero_upper_bound", 320175, 834},
+    {"__torch__.torch_mlir.jit_ir_importer.build_tools.testing_framework._convert_dtype_to_int", 321009, 171},
+    {"__torch_mlir_shape_fn.aten.triu", 321180, 256},
+    {"__torch_mlir_shape_fn.aten.tril", 321436, 256},
+    {"__torch_mlir_shape_fn.aten.diagonal", 321692, 3788},
+    {"__torch_mlir_shape_fn.aten.fake_quantize_per_tensor_affine", 325480, 342},
+    {"__torch_mlir_shape_fn.aten.sin", 325822, 236},
+    {"__torch_mlir_shape_fn.aten.sinh", 326058, 237},
+    {"__torch_mlir_shape_fn.aten.asin", 326295, 237},
+    {"__torch_mlir_shape_fn.aten.asinh", 326532, 238},
+    {"__torch_mlir_shape_fn.aten.cos", 326770, 236},
+    {"__torch_mlir_shape_fn.aten.cosh", 327006, 237},
+    {"__torch_mlir_shape_fn.aten.acos", 327243, 237},
+    {"__torch_mlir_shape_fn.aten.acosh", 327480, 238},
+    {"__torch_mlir_shape_fn.aten.tan", 327718, 236},
+    {"__torch_mlir_shape_fn.aten.tanh", 327954, 237},
+    {"__torch_mlir_shape_fn.aten.atan", 328191, 237},
+    {"__torch_mlir_shape_fn.aten.atanh", 328428, 238},
+    {"__torch_mlir_shape_fn.aten.erf", 328666, 236},
+    {"__torch_mlir_shape_fn.aten.sigmoid", 328902, 240},
+    {"__torch_mlir_shape_fn.aten.hardsigmoid", 329142, 244},
+    {"__torch_mlir_shape_fn.aten.softplus", 329386, 283},
+    {"__torch_mlir_shape_fn.aten.square", 329669, 239},
+    {"__torch_mlir_shape_fn.aten.hardswish", 329908, 242},
+    {"__torch_mlir_shape_fn.aten.silu", 330150, 237},
+    {"__torch_mlir_shape_fn.aten.exp", 330387, 236},
+    {"__torch_mlir_shape_fn.aten.expm1", 330623, 238},
+    {"__torch_mlir_shape_fn.aten.cosine_similarity", 330861, 832},
+    {"__torch_mlir_shape_fn.aten.hardtanh", 331693, 283},
+    {"__torch_mlir_shape_fn.aten.sqrt", 331976, 237},
+    {"__torch_mlir_shape_fn.prims.sqrt", 332213, 238},
+    {"__torch_mlir_shape_fn.aten.neg", 332451, 236},
+    {"__torch_mlir_shape_fn.aten.floor", 332687, 238},
+    {"__torch_mlir_shape_fn.aten.sign", 332925, 237},
+    {"__torch_mlir_shape_fn.aten.sgn", 333162, 236},
+    {"__torch_mlir_shape_fn.aten.detach", 333398, 239},
+    {"__torch_mlir_shape_fn.aten.log2", 333637, 237},
+    {"__torch_mlir_shape_fn.aten.log10", 333874, 238},
+    {"__torch_mlir_shape_fn.aten.log1p", 334112, 238},
+    {"__torch_mlir_shape_fn.aten.logit", 334350, 269},
+    {"__torch_mlir_shape_fn.aten.rsqrt", 334619, 238},
+    {"__torch_mlir_shape_fn.aten.abs", 334857, 236},
+    {"__torch_mlir_shape_fn.aten.reciprocal", 335093, 243},
+    {"__torch_mlir_shape_fn.aten.tanh_backward", 335336, 271},
+    {"__torch_mlir_shape_fn.aten.gelu_backward", 335607, 290},
+    {"__torch_mlir_shape_fn.aten.leaky_relu_backward", 335897, 318},
+    {"__torch_mlir_shape_fn.aten.hardtanh_backward", 336215, 317},
+    {"__torch_mlir_shape_fn.aten.ceil", 336532, 237},
+    {"__torch_mlir_shape_fn.aten.trunc", 336769, 238},
+    {"__torch_mlir_shape_fn.aten.log", 337007, 236},
+    {"__torch_mlir_shape_fn.aten.log_sigmoid", 337243, 244},
+    {"__torch_mlir_shape_fn.aten.hardshrink", 337487, 264},
+    {"__torch_mlir_shape_fn.aten.softshrink", 337751, 264},
+    {"__torch_mlir_shape_fn.aten.mish", 338015, 237},
+    {"__torch_mlir_shape_fn.aten.relu", 338252, 237},
+    {"__torch_mlir_shape_fn.aten.relu6", 338489, 238},
+    {"__torch_mlir_shape_fn.aten.round", 338727, 238},
+    {"__torch_mlir_shape_fn.aten.glu", 338965, 1926},
+    {"__torch_mlir_shape_fn.aten._softmax", 340891, 280},
+    {"__torch_mlir_shape_fn.aten.softmax.int", 341171, 292},
+    {"__torch_mlir_shape_fn.aten._log_softmax", 341463, 284},
+    {"__torch_mlir_shape_fn.aten.log_softmax.int", 341747, 296},
+    {"__torch_mlir_shape_fn.aten.clamp", 342043, 300},
+    {"__torch_mlir_shape_fn.aten.clamp.Tensor", 342343, 315},
+    {"__torch_mlir_shape_fn.aten.clamp_min", 342658, 263},
+    {"__torch_mlir_shape_fn.aten.clamp_min.Tensor", 342921, 274},
+    {"__torch_mlir_shape_fn.aten.clamp_max", 343195, 263},
+    {"__torch_mlir_shape_fn.aten.rsub.Scalar", 343458, 286},
+    {"__torch_mlir_shape_fn.aten.quantize_per_channel", 343744, 341},
+    {"__torch_mlir_shape_fn.aten.quantize_per_tensor", 344085, 311},
+    {"__torch_mlir_shape_fn.aten.dequantize.self", 344396, 248},
+    {"__torch_mlir_shape_fn.aten.dequantize.tensor", 344644, 250},
+    {"__torch_mlir_shape_fn.aten.int_repr", 344894, 241},
+    {"__torch_mlir_shape_fn.aten._make_per_channel_quantized_tensor", 345135, 336},
+    {"__torch_mlir_shape_fn.aten._make_per_tensor_quantized_tensor", 345471, 306},
+    {"__torch_mlir_shape_fn.prims.convert_element_type", 345777, 273},
+    {"__torch_mlir_shape_fn.aten.grid_sampler", 346050, 809},
+    {"__torch_mlir_shape_fn.aten.__interpolate.size_list_scale_list", 346859, 4048},
+    {"__torch_mlir_shape_fn.prims.collapse", 350907, 3794},
+    {"__torch_mlir_shape_fn.prims.split_dim", 354701, 3370},
+    {"__torch_mlir_shape_fn.aten.to.dtype", 358071, 329},
+    {"__torch_mlir_shape_fn.aten.to.dtype_layout", 358400, 334},
+    {"__torch_mlir_shape_fn.aten.to.device", 358734, 352},
+    {"__torch_mlir_shape_fn.aten.to.other", 359086, 335},
+    {"__torch_mlir_shape_fn.aten._cast_Float", 359421, 264},
+    {"__torch_mlir_shape_fn.aten._cast_Long", 359685, 263},
+    {"__torch_mlir_shape_fn.aten.type_as", 359948, 265},
+    {"__torch_mlir_shape_fn.aten.dropout", 360213, 281},
+    {"__torch_mlir_shape_fn.aten.native_dropout", 360494, 451},
+    {"__torch_mlir_shape_fn.aten.gelu", 360945, 256},
+    {"__torch_mlir_shape_fn.aten.bucketize.Tensor", 361201, 314},
+    {"__torch_mlir_shape_fn.aten.contiguous", 361515, 262},
+    {"__torch_mlir_shape_fn.aten.clone", 361777, 267},
+    {"__torch_mlir_shape_fn.aten.lift_fresh_copy", 362044, 248},
+    {"__torch_mlir_shape_fn.aten.linalg_cross", 362292, 2813},
+    {"__torch_mlir_shape_fn.aten._log_softmax_backward_data", 365105, 322},
+    {"__torch_mlir_shape_fn.aten.isnan", 365427, 238},
+    {"__torch_mlir_shape_fn.aten.isinf", 365665, 238},
+    {"__torch_mlir_shape_fn.aten.isneginf", 365903, 241},
+    {"__torch_mlir_shape_fn.aten.isposinf", 366144, 241},
+    {"__torch_mlir_shape_fn.aten.ne.Tensor", 366385, 296},
+    {"__torch_mlir_shape_fn.aten.eq.Scalar", 366681, 263},
+    {"__torch_mlir_shape_fn.aten.ne.Scalar", 366944, 263},
+    {"__torch_mlir_shape_fn.aten.gt.Scalar", 367207, 263},
+    {"__torch_mlir_shape_fn.aten.ge.Scalar", 367470, 263},
+    {"__torch_mlir_shape_fn.aten.le.Scalar", 367733, 263},
+    {"__torch_mlir_shape_fn.aten.lt.Scalar", 367996, 263},
+    {"__torch_mlir_shape_fn.aten.add.Scalar", 368259, 285},
+    {"__torch_mlir_shape_fn.aten.sub.Scalar", 368544, 285},
+    {"__torch_mlir_shape_fn.aten.mul.Scalar", 368829, 264},
+    {"__torch_mlir_shape_fn.aten.div.Scalar", 369093, 264},
+    {"__torch_mlir_shape_fn.aten.remainder.Scalar", 369357, 270},
+    {"__torch_mlir_shape_fn.aten.__and__.Scalar", 369627, 268},
+    {"__torch_mlir_shape_fn.aten.remainder.Tensor", 369895, 274},
+    {"__torch_mlir_shape_fn.aten.fmod.Tensor", 370169, 269},
+    {"__torch_mlir_shape_fn.aten.floor_divide.Scalar", 370438, 273},
+    {"__torch_mlir_shape_fn.aten.pow.Scalar", 370711, 264},
+    {"__torch_mlir_shape_fn.aten.pow.Tensor_Scalar", 370975, 271},
+    {"__torch_mlir_shape_fn.aten.pow.Tensor_Tensor", 371246, 304},
+    {"__torch_mlir_shape_fn.aten.leaky_relu", 371550, 264},
+    {"__torch_mlir_shape_fn.aten.elu", 371814, 299},
+    {"__torch_mlir_shape_fn.aten.prelu", 372113, 263},
+    {"__torch_mlir_shape_fn.aten.celu", 372376, 258},
+    {"__torch_mlir_shape_fn.aten.selu", 372634, 237},
+    {"__torch_mlir_shape_fn.aten.gather", 372871, 303},
+    {"__torch_mlir_shape_fn.aten.layer_norm", 373174, 379},
+    {"__torch_mlir_shape_fn.aten._softmax_backward_data", 373553, 318},
+    {"__torch_mlir_shape_fn.aten.any", 373871, 190},
+    {"__torch_mlir_shape_fn.aten.all", 374061, 190},
+    {"__torch_mlir_shape_fn.aten.min", 374251, 190},
+    {"__torch_mlir_shape_fn.aten.min.other", 374441, 296},
+    {"__torch_mlir_shape_fn.aten.max", 374737, 190},
+    {"__torch_mlir_shape_fn.aten.max.other", 374927, 296},
+    {"__torch_mlir_shape_fn.aten.sum", 375223, 219},
+    {"__torch_mlir_shape_fn.aten.prod", 375442, 220},
+    {"__torch_mlir_shape_fn.aten.mean", 375662, 220},
+    {"__torch_mlir_shape_fn.aten.var", 375882, 210},
+    {"__torch_mlir_shape_fn.prims.var", 376092, 530},
+    {"__torch_mlir_shape_fn.aten.var.dim", 376622, 483},
+    {"__torch_mlir_shape_fn.aten.var.correction", 377105, 501},
+    {"__torch_mlir_shape_fn.aten.var_mean.correction", 377606, 659},
+    {"__torch_mlir_shape_fn.aten.var_mean.dim", 378265, 641},
+    {"__torch_mlir_dtype_fn.aten.var_mean.dim", 378906, 420},
+    {"__torch_mlir_shape_fn.aten.var_mean", 379326, 428},
+    {"__torch_mlir_shape_fn.aten.std", 379754, 210},
+    {"__torch_mlir_shape_fn.aten.std.dim", 379964, 483},
+    {"__torch_mlir_shape_fn.aten.std.correction", 380447, 501},
+    {"__torch_mlir_shape_fn.aten.trace", 380948, 640},
+    {"__torch_mlir_shape_fn.aten.argmax", 381588, 338},
+    {"__torch_mlir_shape_fn.aten.argmin", 381926, 338},
+    {"__torch_mlir_shape_fn.aten.one_hot", 382264, 745},
+    {"__torch_mlir_shape_fn.aten.any.dim", 383009, 393},
+    {"__torch_mlir_shape_fn.aten.all.dim", 383402, 393},
+    {"__torch_mlir_shape_fn.aten.max.dim", 383795, 546},
+    {"__torch_mlir_shape_fn.aten.min.dim", 384341, 546},
+    {"__torch_mlir_shape_fn.aten.amax", 384887, 526},
+    {"__torch_mlir_shape_fn.aten.mean.dim", 385413, 470},
+    {"__torch_mlir_shape_fn.aten.sum.dim_IntList", 385883, 477},
+    {"__torch_mlir_shape_fn.aten.prod.dim_int", 386360, 606},
+    {"__torch_mlir_shape_fn.aten.pixel_shuffle", 386966, 2349},
+    {"__torch_mlir_shape_fn.aten.permute", 389315, 292},
+    {"__torch_mlir_shape_fn.aten.movedim.int", 389607, 478},
+    {"__torch_mlir_dtype_fn.aten.movedim.int", 390085, 263},
+    {"__torch_mlir_shape_fn.aten.transpose.int", 390348, 326},
+    {"__torch_mlir_shape_fn.aten.t", 390674, 342},
+    {"__torch_mlir_shape_fn.aten.numpy_T", 391016, 661},
+    {"__torch_mlir_shape_fn.aten.matmul", 391677, 290},
+    {"__torch_mlir_shape_fn.aten.mv", 391967, 282},
+    {"__torch_mlir_shape_fn.aten.mm", 392249, 282},
+    {"__torch_mlir_shape_fn.aten.addmm", 392531, 530},
+    {"__torch_mlir_shape_fn.aten.bmm", 393061, 284},
+    {"__torch_mlir_shape_fn.aten.baddbmm", 393345, 355},
+    {"__torch_mlir_shape_fn.aten.embedding", 393700, 414},
+    {"__torch_mlir_shape_fn.aten.repeat", 394114, 2266},
+    {"__torch_mlir_shape_fn.aten.repeat_interleave.self_int", 396380, 1866},
+    {"__torch_mlir_shape_fn.aten.tile", 398246, 1036},
+    {"__torch_mlir_shape_fn.aten.roll", 399282, 287},
+    {"__torch_mlir_shape_fn.aten.expand", 399569, 310},
+    {"__torch_mlir_shape_fn.aten.expand_as", 399879, 267},
+    {"__torch_mlir_shape_fn.aten.broadcast_to", 400146, 296},
+    {"__torch_mlir_shape_fn.aten.view", 400442, 286},
+    {"__torch_mlir_shape_fn.aten.reshape", 400728, 289},
+    {"__torch_mlir_shape_fn.aten.reshape_as", 401017, 292},
+    {"__torch_mlir_shape_fn.aten._reshape_alias", 401309, 321},
+    {"__torch_mlir_shape_fn.aten._unsafe_view", 401630, 167},
+    {"__torch_mlir_shape_fn.aten.resize_", 401797, 191},
+    {"__torch_mlir_shape_fn.aten.max_pool2d", 401988, 488},
+    {"__torch_mlir_shape_fn.aten.max_pool3d", 402476, 462},
+    {"__torch__._max_pool3d", 402938, 12144},
+    {"__torch__._pool3d_shape_check", 415082, 8650},
+    {"__torch_mlir_shape_fn.aten.max_pool2d_with_indices", 423732, 654},
+    {"__torch_mlir_shape_fn.aten.max_pool2d_with_indices_backward", 424386, 332},
+    {"__torch_mlir_shape_fn.aten.upsample_nearest2d_backward", 424718, 269},
+    {"__torch_mlir_shape_fn.aten.avg_pool1d", 424987, 427},
+    {"__torch__.pool1d", 425414, 4581},
+    {"__torch_mlir_shape_fn.aten.max_pool1d", 429995, 432},
+    {"__torch_mlir_shape_fn.aten.adaptive_avg_pool1d", 430427, 289},
+    {"__torch__.adaptive_avg_pool1d", 430716, 2631},
+    {"__torch_mlir_shape_fn.aten.avg_pool2d", 433347, 509},
+    {"__torch__.avg_pool2d", 433856, 7862},
+    {"__torch_mlir_shape_fn.aten.adaptive_avg_pool2d", 441718, 316},
+    {"__torch_mlir_shape_fn.aten.adaptive_max_pool1d", 442034, 389},
+    {"__torch__.adaptive_pool", 442423, 3152},
+    {"__torch_mlir_shape_fn.aten.adaptive_max_pool2d", 445575, 389},
+    {"__torch_mlir_shape_fn.aten.adaptive_max_pool3d", 445964, 389},
+    {"__torch_mlir_shape_fn.aten.adaptive_avg_pool3d", 446353, 496},
+    {"__torch_mlir_shape_fn.aten.flatten.using_ints", 446849, 329},
+    {"__torch_mlir_shape_fn.aten.unflatten.int", 447178, 1463},
+    {"__torch_mlir_shape_fn.aten.linear", 448641, 360},
+    {"__torch_mlir_shape_fn.aten.scaled_dot_product_attention", 449001, 556},
+    {"__torch_mlir_shape_fn.aten.zeros", 449557, 255},
+    {"__torch_mlir_shape_fn.aten.eye", 449812, 338},
+    {"__torch_mlir_shape_fn.aten.eye.m", 450150, 359},
+    {"__torch_mlir_shape_fn.aten.ones", 450509, 254},
+    {"__torch_mlir_shape_fn.aten.empty.memory_format", 450763, 298},
+    {"__torch_mlir_shape_fn.aten.empty_strided", 451061, 288},
+    {"__torch_mlir_shape_fn.aten.full", 451349, 275},
+    {"__torch_mlir_shape_fn.aten.full_like", 451624, 309},
+    {"__torch_mlir_shape_fn.aten.new_full", 451933, 304},
+    {"__torch_mlir_shape_fn.aten.zeros_like", 452237, 392},
+    {"__torch_mlir_shape_fn.aten.ones_like", 452629, 391},
+    {"__torch_mlir_shape_fn.aten.empty_like", 453020, 392},
+    {"__torch_mlir_shape_fn.aten.new_zeros", 453412, 284},
+    {"__torch_mlir_shape_fn.aten.new_ones", 453696, 283},
+    {"__torch_mlir_shape_fn.aten.new_empty", 453979, 284},
+    {"__torch_mlir_shape_fn.aten.new_empty_strided", 454263, 317},
+    {"__torch_mlir_shape_fn.aten.diag_embed", 454580, 349},
+    {"__torch__._diag_embed_shape_helper", 454929, 3801},
+    {"__torch_mlir_shape_fn.aten._to_copy", 458730, 410},
+    {"__torch_mlir_shape_fn.aten.masked_fill.Scalar", 459140, 297},
+    {"__torch_mlir_shape_fn.aten.masked_fill.Tensor", 459437, 301},
+    {"__torch_mlir_shape_fn.aten.zero", 459738, 134},
+    {"__torch_mlir_shape_fn.aten.fill.Tensor", 459872, 166},
+    {"__torch_mlir_shape_fn.aten.fill.Scalar", 460038, 162},
+    {"__torch_mlir_shape_fn.aten.copy", 460200, 282},
+    {"__torch_mlir_shape_fn.aten.uniform", 460482, 198},
+    {"__torch_mlir_shape_fn.aten.exponential", 460680, 181},
+    {"__torch_mlir_shape_fn.aten.rand", 460861, 254},
+    {"__torch_mlir_shape_fn.aten.bernoulli.float", 461115, 185},
+    {"__torch_mlir_shape_fn.aten.bernoulli.Tensor", 461300, 190},
+    {"__torch_mlir_shape_fn.aten.bernoulli.p", 461490, 181},
+    {"__torch_mlir_shape_fn.aten._index_put_impl", 461671, 354},
+    {"__torch_mlir_shape_fn.aten.bernoulli", 462025, 158},
+    {"__torch_mlir_shape_fn.aten.cumsum", 462183, 184},
+    {"__torch_mlir_shape_fn.aten.rand_like", 462367, 288},
+    {"__torch_mlir_shape_fn.aten.randn_like", 462655, 289},
+    {"__torch_mlir_shape_fn.aten.randint.low", 462944, 299},
+    {"__torch_mlir_shape_fn.aten.randint", 463243, 276},
+    {"__torch_mlir_shape_fn.aten.randn", 463519, 255},
+    {"__torch_mlir_shape_fn.aten.randn.generator", 463774, 284},
+    {"__torch_mlir_shape_fn.aten.normal_functional", 464058, 208},
+    {"__torch_mlir_shape_fn.aten.arange.start_step", 464266, 1040},
+    {"__torch_mlir_shape_fn.aten.arange.start", 465306, 906},
+    {"__torch_mlir_shape_fn.aten.arange", 466212, 774},
+    {"__torch_mlir_shape_fn.aten.linspace", 466986, 366},
+    {"__torch_mlir_shape_fn.aten.add.Tensor", 467352, 318},
+    {"__torch_mlir_shape_fn.aten.sub.Tensor", 467670, 318},
+    {"__torch_mlir_shape_fn.aten.mul.Tensor", 467988, 297},
+    {"__torch_mlir_shape_fn.aten.div.Tensor", 468285, 297},
+    {"__torch_mlir_shape_fn.aten.div.Tensor_mode", 468582, 331},
+    {"__torch_mlir_shape_fn.aten.div.Scalar_mode", 468913, 298},
+    {"__torch_mlir_shape_fn.aten.floor_divide", 469211, 299},
+    {"__torch_mlir_shape_fn.aten.atan2", 469510, 292},
+    {"__torch_mlir_shape_fn.aten.__and__.Tensor", 469802, 301},
+    {"__torch_mlir_shape_fn.aten.__or__.Tensor", 470103, 300},
+    {"__torch_mlir_shape_fn.aten.minimum", 470403, 294},
+    {"__torch_mlir_shape_fn.aten.maximum", 470697, 294},
+    {"__torch_mlir_shape_fn.aten.bitwise_or.Tensor", 470991, 304},
+    {"__torch_mlir_shape_fn.aten.bitwise_and.Tensor", 471295, 305},
+    {"__torch_mlir_shape_fn.aten.bitwise_and.Scalar", 471600, 272},
+    {"__torch_mlir_shape_fn.aten.bitwise_xor.Tensor", 471872, 305},
+    {"__torch_mlir_shape_fn.aten.bitwise_right_shift.Tensor", 472177, 313},
+    {"__torch_mlir_shape_fn.aten.bitwise_left_shift.Tensor", 472490, 312},
+    {"__torch_mlir_shape_fn.aten.bitwise_not", 472802, 244},
+    {"__torch_mlir_shape_fn.aten.logical_or", 473046, 297},
+    {"__torch_mlir_shape_fn.aten.logical_and", 473343, 298},
+    {"__torch_mlir_shape_fn.aten.logical_xor", 473641, 298},
+    {"__torch_mlir_shape_fn.aten.logical_not", 473939, 244},
+    {"__torch_mlir_shape_fn.aten.threshold", 474183, 284},
+    {"__torch_mlir_shape_fn.aten.threshold_backward", 474467, 326},
+    {"__torch_mlir_shape_fn.aten.eq.Tensor", 474793, 296},
+    {"__torch_mlir_shape_fn.aten.gt.Tensor", 475089, 296},
+    {"__torch_mlir_shape_fn.aten.ge.Tensor", 475385, 296},
+    {"__torch_mlir_shape_fn.aten.lt.Tensor", 475681, 296},
+    {"__torch_mlir_shape_fn.aten.le.Tensor", 475977, 296},
+    {"__torch_mlir_shape_fn.aten.isclose", 476273, 356},
+    {"__torch_mlir_shape_fn.aten.unsqueeze", 476629, 284},
+    {"__torch_mlir_shape_fn.aten.squeeze", 476913, 248},
+    {"__torch_mlir_shape_fn.aten.squeeze.dim", 477161, 284},
+    {"__torch_mlir_shape_fn.prims.squeeze", 477445, 298},
+    {"__torch_mlir_shape_fn.prims.view_of", 477743, 138},
+    {"__torch_mlir_dtype_fn.prims.view_of", 477881, 222},
+    {"__torch_mlir_shape_fn.prims.iota", 478103, 300},
+    {"__torch_mlir_dtype_fn.prims.iota", 478403, 216},
+    {"__torch_mlir_shape_fn.prim.NumToTensor.Scalar", 478619, 201},
+    {"__torch_mlir_shape_fn.aten.tensor.float", 478820, 276},
+    {"__torch_mlir_shape_fn.aten.tensor.int", 479096, 272},
+    {"__torch_mlir_shape_fn.aten.tensor.bool", 479368, 274},
+    {"__torch_mlir_shape_fn.aten.scalar_tensor", 479642, 316},
+    {"__torch_mlir_dtype_fn.aten.scalar_tensor", 479958, 634},
+    {"__torch_mlir_shape_fn.aten._shape_as_tensor", 480592, 280},
+    {"__torch_mlir_shape_fn.aten.where.self", 480872, 454},
+    {"__torch_mlir_shape_fn.aten.where.Scalar", 481326, 287},
+    {"__torch_mlir_shape_fn.aten.where.ScalarOther", 481613, 325},
+    {"__torch_mlir_shape_fn.aten.where.ScalarSelf", 481938, 324},
+    {"__torch_mlir_shape_fn.aten.nan_to_num", 482262, 336},
+    {"__torch_mlir_shape_fn.aten.lerp.Tensor", 482598, 455},
+    {"__torch_mlir_shape_fn.aten.lerp.Scalar", 483053, 319},
+    {"__torch_mlir_shape_fn.aten.addcmul", 483372, 472},
+    {"__torch_mlir_shape_fn.aten.addcdiv", 483844, 472},
+    {"__torch_mlir_shape_fn.aten.topk", 484316, 406},
+    {"__torch_mlir_dtype_fn.aten.topk", 484722, 449},
+    {"__torch_mlir_shape_fn.aten.real", 485171, 237},
+    {"__torch_mlir_shape_fn.aten.imag", 485408, 237},
+    {"__torch_mlir_dtype_fn.aten.real", 485645, 328},
+    {"__torch__.complex_to_float", 485973, 1252},
+    {"__torch_mlir_dtype_fn.aten.imag", 487225, 328},
+    {"__torch_mlir_shape_fn.aten.view_as_complex", 487553, 752},
+    {"__torch_mlir_dtype_fn.aten.view_as_complex", 488305, 3245},
+    {"__torch_mlir_shape_fn.aten.view_as_real", 491550, 340},
+    {"__torch_mlir_dtype_fn.aten.view_as_real", 491890, 941},
+    {"__torch__.torch_mlir.jit_ir_importer.build_tools.library_generator.is_complex_dtype", 492831, 391},
+    {"__torch__.torch_mlir.jit_ir_importer.build_tools.library_generator.all_complex_dtypes", 493222, 323},
+    {"__torch_mlir_shape_fn.aten.conv2d", 493545, 548},
+    {"__torch_mlir_shape_fn.aten.conv3d", 494093, 548},
+    {"__torch_mlir_shape_fn.aten.conv_transpose2d.input", 494641, 974},
+    {"__torch_mlir_shape_fn.aten.conv_tbc", 495615, 2654},
+    {"__torch_mlir_shape_fn.aten.convolution", 498269, 650},
+    {"__torch_mlir_shape_fn.aten.conv1d", 498919, 730},
+    {"__torch_mlir_shape_fn.aten._convolution", 499649, 724},
+    {"__torch_mlir_shape_fn.aten._convolution.deprecated", 500373, 714},
+    {"__torch_mlir_shape_fn.aten.flip", 501087, 159},
+    {"__torch_mlir_shape_fn.aten.convolution_backward", 501246, 685},
+    {"__torch_mlir_shape_fn.aten.batch_norm", 501931, 692},
+    {"__torch_mlir_shape_fn.aten.group_norm", 502623, 373},
+    {"__torch_mlir_shape_fn.aten.native_group_norm", 502996, 813},
+    {"__torch_mlir_shape_fn.aten.instance_norm", 503809, 468},
+    {"__torch_mlir_shape_fn.aten.slice.Tensor", 504277, 437},
+    {"__torch_mlir_shape_fn.aten.sort", 504714, 329},
+    {"__torch_mlir_dtype_fn.aten.sort", 505043, 410},
+    {"__torch_mlir_shape_fn.aten.narrow", 505453, 630},
+    {"__torch_mlir_shape_fn.aten.narrow.Tensor", 506083, 321},
+    {"__torch_mlir_shape_fn.aten.slice_scatter", 506404, 264},
+    {"__torch_mlir_shape_fn.aten.masked_scatter", 506668, 194},
+    {"__torch_mlir_shape_fn.aten.select.int", 506862, 320},
+    {"__torch_mlir_shape_fn.aten.select_scatter", 507182, 207},
+    {"__torch_mlir_shape_fn.aten.scatter_reduce.two", 507389, 256},
+    {"__torch_mlir_shape_fn.aten.scatter.src", 507645, 210},
+    {"__torch_mlir_shape_fn.aten.scatter.value", 507855, 208},
+    {"__torch_mlir_shape_fn.aten.index_select", 508063, 340},
+    {"__torch_mlir_shape_fn.aten.index_put", 508403, 328},
+    {"__torch_mlir_shape_fn.aten.index_put.hacked_twin", 508731, 330},
+    {"__torch_mlir_shape_fn.aten.embedding_bag.padding_idx", 509061, 713},
+    {"__torch__._embedding_bag_helper", 509774, 4081},
+    {"__torch_mlir_shape_fn.aten._embedding_bag", 513855, 756},
+    {"__torch_mlir_shape_fn.aten.nll_loss_forward", 514611, 491},
+    {"__torch_mlir_shape_fn.aten.nll_loss_backward", 515102, 398},
+    {"__torch_mlir_shape_fn.aten.mse_loss", 515500, 632},
+    {"__torch_mlir_shape_fn.aten.cross_entropy_loss", 516132, 502},
+    {"__torch_mlir_shape_fn.aten.native_layer_norm", 516634, 490},
+    {"__torch_mlir_shape_fn.aten.native_batch_norm", 517124, 711},
+    {"__torch_mlir_shape_fn.aten.constant_pad_nd", 517835, 299},
+    {"__torch__.pad_shape_fn", 518134, 2632},
+    {"__torch_mlir_shape_fn.aten.replication_pad2d", 520766, 1133},
+    {"__torch_mlir_dtype_fn.aten.replication_pad2d", 521899, 256},
+    {"__torch_mlir_shape_fn.aten.pad", 522155, 316},
+    {"__torch_mlir_shape_fn.aten.reflection_pad1d", 522471, 1596},
+    {"__torch_mlir_shape_fn.aten.reflection_pad2d", 524067, 2860},
+    {"__torch_mlir_shape_fn.aten.index.Tensor", 526927, 312},
+    {"__torch__.index_tensor_like", 527239, 6760},
+    {"__torch_mlir_shape_fn.aten.index.Tensor_hacked_twin", 533999, 883},
+    {"__torch_mlir_shape_fn.aten.cat", 534882, 284},
+    {"__torch_mlir_shape_fn.aten.stack", 535166, 288},
+    {"__torch_mlir_shape_fn.aten.fft_fft", 535454, 214},
+    {"__torch_mlir_shape_fn.aten.bincount", 535668, 340},
+    {"__torch__.hacky_get_unknown_dimension_size", 536008, 400},
+    {"__torch__.DummyClassType.__init__", 536408, 184},
+    {"__torch_mlir_shape_fn.aten.nonzero", 536592, 366},
+    {"__torch_mlir_shape_fn.aten.masked_select", 536958, 316},
+    {"__torch_mlir_shape_fn.aten.nonzero_static", 537274, 335},
+    {"__torch_mlir_shape_fn.aten.linalg_vector_norm", 537609, 501},
+    {"__torch_mlir_shape_fn.aten.linalg_norm", 538110, 504},
+    {"__torch_mlir_shape_fn.aten.frobenius_norm.dim", 538614, 540},
+    {"__torch_mlir_shape_fn.aten.norm.Scalar", 539154, 544},
+    {"__torch_mlir_shape_fn.aten.norm.ScalarOpt_dim", 539698, 571},
+    {"__torch_mlir_shape_fn.aten.upsample_nearest2d", 540269, 786},
+    {"__torch_mlir_dtype_fn.prims.split_dim", 541055, 262},
+    {"__torch_mlir_dtype_fn.aten.fake_quantize_per_tensor_affine", 541317, 992},
+    {"__torch__.torch_mlir.jit_ir_importer.build_tools.library_generator.is_float_dtype", 542309, 387},
+    {"__torch__.torch_mlir.jit_ir_importer.build_tools.library_generator.all_float_dtypes", 542696, 425},
+    {"__torch_mlir_dtype_fn.aten.cosh", 543121, 308},
+    {"__torch__._get_dtype_of_floating_point_op", 543429, 1049},
+    {"__torch_mlir_dtype_fn.aten.acosh", 544478, 309},
+    {"__torch_mlir_dtype_fn.aten.tanh", 544787, 308},
+    {"__torch_mlir_dtype_fn.aten.exp", 545095, 307},
+    {"__torch_mlir_dtype_fn.aten.expm1", 545402, 309},
+    {"__torch_mlir_dtype_fn.aten.sin", 545711, 307},
+    {"__torch_mlir_dtype_fn.aten.sinh", 546018, 308},
+    {"__torch_mlir_dtype_fn.aten.asin", 546326, 308},
+    {"__torch_mlir_dtype_fn.aten.asinh", 546634, 309},
+    {"__torch_mlir_dtype_fn.aten.cos", 546943, 307},
+    {"__torch_mlir_dtype_fn.aten.acos", 547250, 308},
+    {"__torch_mlir_dtype_fn.aten.sigmoid", 547558, 311},
+    {"__torch_mlir_dtype_fn.aten.reciprocal", 547869, 314},
+    {"__torch_mlir_dtype_fn.aten.sqrt", 548183, 308},
+    {"__torch_mlir_dtype_fn.aten.log", 548491, 307},
+    {"__torch_mlir_dtype_fn.aten.log2", 548798, 308},
+    {"__torch_mlir_dtype_fn.aten.log10", 549106, 309},
+    {"__torch_mlir_dtype_fn.aten.log1p", 549415, 309},
+    {"__torch_mlir_dtype_fn.aten.log_sigmoid", 549724, 651},
+    {"__torch_mlir_dtype_fn.aten.hardshrink", 550375, 544},
+    {"__torch_mlir_dtype_fn.aten.softshrink", 550919, 336},
+    {"__torch_mlir_dtype_fn.aten.logit", 551255, 340},
+    {"__torch_mlir_dtype_fn.aten.rsqrt", 551595, 309},
+    {"__torch_mlir_dtype_fn.aten.erf", 551904, 307},
+    {"__torch_mlir_dtype_fn.aten.softplus", 552211, 647},
+    {"__torch__.torch_mlir.jit_ir_importer.build_tools.library_generator.is_integer_dtype", 552858, 391},
+    {"__torch__.torch_mlir.jit_ir_importer.build_tools.library_generator.all_integer_dtypes", 553249, 531},
+    {"__torch_mlir_dtype_fn.aten.frobenius_norm.dim", 553780, 1811},
+    {"__torch_mlir_dtype_fn.prims.sqrt", 555591, 600},
+    {"__torch_mlir_dtype_fn.aten.abs", 556191, 1208},
+    {"__torch_mlir_dtype_fn.aten.adaptive_avg_pool1d", 557399, 258},
+    {"__torch_mlir_dtype_fn.aten.pixel_shuffle", 557657, 246},
+    {"__torch_mlir_dtype_fn.aten.avg_pool1d", 557903, 339},
+    {"__torch_mlir_dtype_fn.aten.adaptive_avg_pool2d", 558242, 258},
+    {"__torch_mlir_dtype_fn.aten.adaptive_avg_pool3d", 558500, 258},
+    {"__torch_mlir_dtype_fn.aten.avg_pool2d", 558758, 368},
+    {"__torch_mlir_dtype_fn.aten.avg_pool3d", 559126, 368},
+    {"__torch_mlir_dtype_fn.aten.batch_norm", 559494, 470},
+    {"__torch_mlir_dtype_fn.aten.group_norm", 559964, 812},
+    {"__torch_mlir_dtype_fn.aten.native_group_norm", 560776, 1008},
+    {"__torch_mlir_dtype_fn.aten.instance_norm", 561784, 473},
+    {"__torch_mlir_dtype_fn.aten.bernoulli_.float", 562257, 270},
+    {"__torch_mlir_dtype_fn.aten.bernoulli", 562527, 242},
+    {"__torch_mlir_dtype_fn.aten.bernoulli.Tensor", 562769, 280},
+    {"__torch_mlir_dtype_fn.aten.bitwise_not", 563049, 225},
+    {"__torch_mlir_dtype_fn.aten.broadcast_to", 563274, 251},
+    {"__torch_mlir_dtype_fn.aten.cosine_similarity", 563525, 1376},
+    {"__torch_mlir_dtype_fn.aten.ceil", 564901, 218},
+    {"__torch_mlir_dtype_fn.aten.trunc", 565119, 219},
+    {"__torch_mlir_dtype_fn.aten.clamp_max", 565338, 543},
+    {"__torch_mlir_dtype_fn.aten.clamp_min", 565881, 543},
+    {"__torch_mlir_dtype_fn.aten.clamp_min.Tensor", 566424, 712},
+    {"__torch__.torch_mlir.jit_ir_importer.build_tools.library_generator.promote_dtypes", 567136, 308},
+    {"__torch_mlir_dtype_fn.aten.clamp", 567444, 581},
+    {"__torch_mlir_dtype_fn.aten.clamp.Tensor", 568025, 2210},
+    {"__torch_mlir_dtype_fn.aten.clone", 570235, 248},
+    {"__torch_mlir_dtype_fn.aten.constant_pad_nd", 570483, 276},
+    {"__torch_mlir_dtype_fn.aten.grid_sampler", 570759, 315},
+    {"__torch_mlir_dtype_fn.aten.__interpolate.size_list_scale_list", 571074, 419},
+    {"__torch_mlir_dtype_fn.aten.reflection_pad1d", 571493, 710},
+    {"__torch_mlir_dtype_fn.aten.reflection_pad2d", 572203, 255},
+    {"__torch_mlir_dtype_fn.aten.contiguous", 572458, 243},
+    {"__torch_mlir_dtype_fn.aten.copy", 572701, 269},
+    {"__torch_mlir_dtype_fn.aten.cpu", 572970, 217},
+    {"__torch_mlir_dtype_fn.aten.cumsum", 573187, 958},
+    {"__torch_mlir_dtype_fn.aten.detach", 574145, 220},
+    {"__torch_mlir_dtype_fn.aten.dropout", 574365, 262},
+    {"__torch_mlir_dtype_fn.aten.native_dropout", 574627, 435},
+    {"__torch_mlir_dtype_fn.aten.expand_as", 575062, 254},
+    {"__torch_mlir_dtype_fn.aten.expand", 575316, 265},
+    {"__torch_mlir_dtype_fn.aten.fill.Scalar", 575581, 247},
+    {"__torch_mlir_dtype_fn.aten.fill.Tensor", 575828, 256},
+    {"__torch_mlir_dtype_fn.aten.flatten.using_ints", 576084, 270},
+    {"__torch_mlir_dtype_fn.aten.unflatten.int", 576354, 271},
+    {"__torch_mlir_dtype_fn.aten.flip", 576625, 243},
+    {"__torch_mlir_dtype_fn.aten.sign", 576868, 218},
+    {"__torch_mlir_dtype_fn.aten.sgn", 577086, 217},
+    {"__torch_mlir_dtype_fn.aten.floor", 577303, 219},
+    {"__torch_mlir_dtype_fn.aten.gather", 577522, 290},
+    {"__torch_mlir_dtype_fn.aten.gelu_backward", 577812, 728},
+    {"__torch_mlir_dtype_fn.aten.gelu", 578540, 237},
+    {"__torch_mlir_dtype_fn.aten.hardsigmoid", 578777, 225},
+    {"__torch_mlir_dtype_fn.aten.hardswish", 579002, 223},
+    {"__torch_mlir_dtype_fn.aten.hardtanh_backward", 579225, 624},
+    {"__torch_mlir_dtype_fn.aten.hardtanh", 579849, 837},
+    {"__torch_mlir_dtype_fn.aten.index_put.hacked_twin", 580686, 323},
+    {"__torch_mlir_dtype_fn.aten._unsafe_index_put.hacked_twin", 581009, 331},
+    {"__torch_mlir_dtype_fn.aten._index_put_impl", 581340, 347},
+    {"__torch_mlir_dtype_fn.aten.index_put", 581687, 321},
+    {"__torch_mlir_dtype_fn.aten.index_select", 582008, 276},
+    {"__torch_mlir_dtype_fn.aten.index.Tensor_hacked_twin", 582284, 275},
+    {"__torch_mlir_dtype_fn.aten.index.Tensor", 582559, 273},
+    {"__torch_mlir_dtype_fn.aten.layer_norm", 582832, 818},
+    {"__torch_mlir_dtype_fn.aten.leaky_relu_backward", 583650, 757},
+    {"__torch_mlir_dtype_fn.aten.lift_fresh_copy", 584407, 229},
+    {"__torch_mlir_dtype_fn.aten.linalg_cross", 584636, 1341},
+    {"__torch_mlir_dtype_fn.aten._log_softmax_backward_data", 585977, 219},
+    {"__torch_mlir_dtype_fn.aten.masked_fill.Scalar", 586196, 285},
+    {"__torch_mlir_dtype_fn.aten.masked_fill_.Scalar", 586481, 286},
+    {"__torch_mlir_dtype_fn.aten.masked_fill.Tensor", 586767, 294},
+    {"__torch_mlir_dtype_fn.aten.masked_select", 587061, 258},
+    {"__torch_mlir_dtype_fn.aten.max_pool2d", 587319, 344},
+    {"__torch_mlir_dtype_fn.aten.max_pool3d", 587663, 344},
+    {"__torch_mlir_dtype_fn.aten.max_pool2d_with_indices", 588007, 510},
+    {"__torch_mlir_dtype_fn.aten.adaptive_max_pool1d", 588517, 411},
+    {"__torch_mlir_dtype_fn.aten.adaptive_max_pool2d", 588928, 411},
+    {"__torch_mlir_dtype_fn.aten.adaptive_max_pool3d", 589339, 411},
+    {"__torch_mlir_dtype_fn.aten.mish", 589750, 218},
+    {"__torch_mlir_dtype_fn.aten.narrow", 589968, 277},
+    {"__torch_mlir_dtype_fn.aten.narrow.Tensor", 590245, 296},
+    {"__torch_mlir_dtype_fn.aten.neg", 590541, 583},
+    {"__torch_mlir_dtype_fn.aten.numpy_T", 591124, 221},
+    {"__torch_mlir_dtype_fn.aten.pad", 591345, 292},
+    {"__torch_mlir_dtype_fn.aten.permute", 591637, 246},
+    {"__torch_mlir_dtype_fn.aten.pow.Tensor_Tensor", 591883, 1009},
+    {"__torch_mlir_dtype_fn.aten.prelu", 592892, 670},
+    {"__torch_mlir_dtype_fn.aten.celu", 593562, 240},
+    {"__torch_mlir_dtype_fn.aten.relu6", 593802, 585},
+    {"__torch_mlir_dtype_fn.aten.relu", 594387, 218},
+    {"__torch_mlir_dtype_fn.aten.repeat", 594605, 245},
+    {"__torch_mlir_dtype_fn.aten.repeat_interleave.self_int", 594850, 317},
+    {"__torch_mlir_dtype_fn.aten.tile", 595167, 243},
+    {"__torch_mlir_dtype_fn.aten._reshape_alias", 595410, 278},
+    {"__torch_mlir_dtype_fn.aten.reshape", 595688, 246},
+    {"__torch_mlir_dtype_fn.aten.reshape_as", 595934, 255},
+    {"__torch_mlir_dtype_fn.aten.resize_", 596189, 275},
+    {"__torch_mlir_dtype_fn.aten.roll", 596464, 268},
+    {"__torch_mlir_dtype_fn.aten.round", 596732, 219},
+    {"__torch_mlir_dtype_fn.aten.glu", 596951, 236},
+    {"__torch_mlir_dtype_fn.aten.scatter_reduce.two", 597187, 352},
+    {"__torch_mlir_dtype_fn.aten.select.int", 597539, 262},
+    {"__torch_mlir_dtype_fn.aten.select_scatter", 597801, 297},
+    {"__torch_mlir_dtype_fn.aten.scatter.src", 598098, 306},
+    {"__torch_mlir_dtype_fn.aten.scatter.value", 598404, 299},
+    {"__torch_mlir_dtype_fn.aten.masked_scatter", 598703, 290},
+    {"__torch_mlir_dtype_fn.aten.silu", 598993, 218},
+    {"__torch_mlir_dtype_fn.aten.slice_scatter", 599211, 354},
+    {"__torch_mlir_dtype_fn.aten.slice.Tensor", 599565, 322},
+    {"__torch_mlir_dtype_fn.aten._softmax_backward_data", 599887, 215},
+    {"__torch_mlir_dtype_fn.aten.square", 600102, 518},
+    {"__torch_mlir_dtype_fn.aten.squeeze.dim", 600620, 244},
+    {"__torch_mlir_dtype_fn.aten.squeeze", 600864, 221},
+    {"__torch_mlir_dtype_fn.aten.tanh_backward", 601085, 709},
+    {"__torch_mlir_dtype_fn.aten.threshold", 601794, 267},
+    {"__torch_mlir_dtype_fn.aten.t", 602061, 215},
+    {"__torch_mlir_dtype_fn.aten.to.prim_Device", 602276, 679},
+    {"__torch_mlir_dtype_fn.aten.transpose.int", 602955, 265},
+    {"__torch_mlir_dtype_fn.aten.triu", 603220, 237},
+    {"__torch_mlir_dtype_fn.aten.tril", 603457, 237},
+    {"__torch_mlir_dtype_fn.aten.diagonal", 603694, 279},
+    {"__torch_mlir_dtype_fn.aten.uniform", 603973, 282},
+    {"__torch_mlir_dtype_fn.aten.exponential", 604255, 265},
+    {"__torch_mlir_dtype_fn.aten.rand", 604520, 625},
+    {"__torch_mlir_dtype_fn.aten._unsafe_view", 605145, 251},
+    {"__torch_mlir_dtype_fn.aten.unsqueeze", 605396, 242},
+    {"__torch_mlir_dtype_fn.aten.upsample_nearest2d_backward", 605638, 353},
+    {"__torch_mlir_dtype_fn.aten.upsample_nearest2d", 605991, 319},
+    {"__torch_mlir_dtype_fn.aten.view", 606310, 243},
+    {"__torch_mlir_dtype_fn.aten.zero", 606553, 218},
+    {"__torch_mlir_dtype_fn.aten.zero_", 606771, 219},
+    {"__torch_mlir_dtype_fn.prim.abs.Scalar", 606990, 263},
+    {"__torch__.torch_mlir.jit_ir_importer.build_tools.library_generator.get_dtype_of_scalar", 607253, 306},
+    {"__torch_mlir_dtype_fn.aten.nll_loss_backward", 607559, 1150},
+    {"__torch_mlir_dtype_fn.aten.max_pool2d_with_indices_backward", 608709, 848},
+    {"__torch_mlir_dtype_fn.aten.all", 609557, 516},
+    {"__torch_mlir_dtype_fn.aten.any", 610073, 516},
+    {"__torch_mlir_dtype_fn.aten.eq.Scalar", 610589, 191},
+    {"__torch_mlir_dtype_fn.aten.eq.Tensor", 610780, 200},
+    {"__torch_mlir_dtype_fn.aten.ge.Scalar", 610980, 191},
+    {"__torch_mlir_dtype_fn.aten.gt.Scalar", 611171, 191},
+    {"__torch_mlir_dtype_fn.aten.gt.Tensor", 611362, 200},
+    {"__torch_mlir_dtype_fn.aten.ge.Tensor", 611562, 200},
+    {"__torch_mlir_dtype_fn.aten.le.Scalar", 611762, 191},
+    {"__torch_mlir_dtype_fn.aten.logical_and", 611953, 202},
+    {"__torch_mlir_dtype_fn.aten.logical_not", 612155, 171},
+    {"__torch_mlir_dtype_fn.aten.isclose", 612326, 260},
+    {"__torch_mlir_dtype_fn.aten.scaled_dot_product_attention", 612586, 417},
+    {"__torch_mlir_dtype_fn.aten.logical_or", 613003, 201},
+    {"__torch_mlir_dtype_fn.aten.logical_xor", 613204, 202},
+    {"__torch_mlir_dtype_fn.aten.lt.Scalar", 613406, 191},
+    {"__torch_mlir_dtype_fn.aten.lt.Tensor", 613597, 200},
+    {"__torch_mlir_dtype_fn.aten.le.Tensor", 613797, 200},
+    {"__torch_mlir_dtype_fn.aten.isnan", 613997, 165},
+    {"__torch_mlir_dtype_fn.aten.isinf", 614162, 165},
+    {"__torch_mlir_dtype_fn.aten.isneginf", 614327, 932},
+    {"__torch_mlir_dtype_fn.aten.isposinf", 615259, 932},
+    {"__torch_mlir_dtype_fn.aten.ne.Tensor", 616191, 200},
+    {"__torch_mlir_dtype_fn.aten.ne.Scalar", 616391, 191},
+    {"__torch_mlir_dtype_fn.aten.add", 616582, 813},
+    {"__torch_mlir_dtype_fn.aten.fft_fft", 617395, 2105},
+    {"__torch_mlir_dtype_fn.aten.rsub.Scalar", 619500, 802},
+    {"__torch_mlir_dtype_fn.aten.__and__.Scalar", 620302, 783},
+    {"__torch_mlir_dtype_fn.aten.__and__.Tensor", 621085, 710},
+    {"__torch_mlir_dtype_fn.aten.__or__.Tensor", 621795, 709},
+    {"__torch_mlir_dtype_fn.aten.add.Tensor", 622504, 728},
+    {"__torch_mlir_dtype_fn.aten.bitwise_and.Tensor", 623232, 714},
+    {"__torch_mlir_dtype_fn.aten.bitwise_and.Scalar", 623946, 787},
+    {"__torch_mlir_dtype_fn.aten.bitwise_or.Tensor", 624733, 713},
+    {"__torch_mlir_dtype_fn.aten.bitwise_xor.Tensor", 625446, 714},
+    {"__torch_mlir_dtype_fn.aten.bitwise_right_shift.Tensor", 626160, 722},
+    {"__torch_mlir_dtype_fn.aten.bitwise_left_shift.Tensor", 626882, 721},
+    {"__torch_mlir_dtype_fn.aten.bmm", 627603, 840},
+    {"__torch__.torch_mlir.jit_ir_importer.build_tools.library_generator.get_priority_of_dtype", 628443, 4444},
+    {"__torch_mlir_dtype_fn.aten.floor_divide", 632887, 1996},
+    {"__torch_mlir_dtype_fn.aten.div.Tensor", 634883, 1636},
+    {"__torch_mlir_dtype_fn.aten.div.Tensor_mode", 636519, 3151},
+    {"__torch_mlir_dtype_fn.aten.floor_divide.Scalar", 639670, 1202},
+    {"__torch_mlir_dtype_fn.aten.div.Scalar_mode", 640872, 3195},
+    {"__torch_mlir_dtype_fn.aten.matmul", 644067, 843},
+    {"__torch_mlir_dtype_fn.aten.maximum", 644910, 703},
+    {"__torch_mlir_dtype_fn.aten.minimum", 645613, 703},
+    {"__torch_mlir_dtype_fn.aten.mm", 646316, 1645},
+    {"__torch_mlir_dtype_fn.aten.mse_loss", 647961, 1167},
+    {"__torch_mlir_dtype_fn.aten.mul.Tensor", 649128, 706},
+    {"__torch_mlir_dtype_fn.aten.mv", 649834, 698},
+    {"__torch_mlir_dtype_fn.aten.sub.Tensor", 650532, 728},
+    {"__torch_mlir_dtype_fn.aten.threshold_backward", 651260, 2214},
+    {"__torch_mlir_dtype_fn.aten._convolution", 653474, 2590},
+    {"__torch_mlir_dtype_fn.aten.conv1d", 656064, 2456},
+    {"__torch_mlir_dtype_fn.aten.conv_tbc", 658520, 2373},
+    {"__torch_mlir_dtype_fn.aten._convolution.deprecated", 660893, 2580},
+    {"__torch_mlir_dtype_fn.aten.conv2d", 663473, 386},
+    {"__torch_mlir_dtype_fn.aten.conv3d", 663859, 386},
+    {"__torch_mlir_dtype_fn.aten.conv_transpose2d.input", 664245, 427},
+    {"__torch_mlir_dtype_fn.aten.convolution", 664672, 436},
+    {"__torch_mlir_dtype_fn.aten.convolution_backward", 665108, 649},
+    {"__torch_mlir_dtype_fn.aten.bincount", 665757, 1298},
+    {"__torch_mlir_dtype_fn.aten.nonzero", 667055, 164},
+    {"__torch_mlir_dtype_fn.aten.nonzero_static", 667219, 209},
+    {"__torch_mlir_dtype_fn.aten.addmm", 667428, 903},
+    {"__torch_mlir_dtype_fn.aten.lerp.Tensor", 668331, 865},
+    {"__torch_mlir_dtype_fn.aten.lerp.Scalar", 669196, 938},
+    {"__torch_mlir_dtype_fn.aten.addcmul", 670134, 1749},
+    {"__torch_mlir_dtype_fn.aten.addcdiv", 671883, 1199},
+    {"__torch_mlir_dtype_fn.aten.add.Scalar", 673082, 801},
+    {"__torch_mlir_dtype_fn.aten.sub.Scalar", 673883, 801},
+    {"__torch_mlir_dtype_fn.aten.mul.Scalar", 674684, 779},
+    {"__torch_mlir_dtype_fn.aten.div.Scalar", 675463, 1095},
+    {"__torch_mlir_dtype_fn.aten.fmod.Scalar", 676558, 780},
+    {"__torch_mlir_dtype_fn.aten.fmod.Tensor", 677338, 707},
+    {"__torch_mlir_dtype_fn.aten.pow.Scalar", 678045, 779},
+    {"__torch_mlir_dtype_fn.aten.pow.Tensor_Scalar", 678824, 786},
+    {"__torch_mlir_dtype_fn.aten.leaky_relu", 679610, 1730},
+    {"__torch_mlir_dtype_fn.aten.elu", 681340, 2545},
+    {"__torch_mlir_dtype_fn.aten.selu", 683885, 949},
+    {"__torch_mlir_dtype_fn.aten.remainder.Scalar", 684834, 785},
+    {"__torch_mlir_dtype_fn.aten.remainder.Tensor", 685619, 712},
+    {"__torch_mlir_dtype_fn.aten.baddbmm", 686331, 1648},
+    {"__torch_mlir_dtype_fn.aten.where.self", 687979, 737},
+    {"__torch_mlir_dtype_fn.aten.where.Scalar", 688716, 1151},
+    {"__torch_mlir_dtype_fn.aten.where.ScalarOther", 689867, 817},
+    {"__torch_mlir_dtype_fn.aten.where.ScalarSelf", 690684, 816},
+    {"__torch_mlir_dtype_fn.aten.nan_to_num", 691500, 317},
+    {"__torch_mlir_dtype_fn.aten.nll_loss_forward", 691817, 913},
+    {"__torch_mlir_dtype_fn.aten.native_layer_norm", 692730, 1550},
+    {"__torch_mlir_dtype_fn.aten.one_hot", 694280, 604},
+    {"__torch_mlir_dtype_fn.aten.native_batch_norm", 694884, 927},
+    {"__torch_mlir_dtype_fn.aten.arange", 695811, 1539},
+    {"__torch_mlir_dtype_fn.aten.arange.start", 697350, 2057},
+    {"__torch_mlir_dtype_fn.aten.arange.start_step", 699407, 2537},
+    {"__torch_mlir_dtype_fn.aten.sum", 701944, 936},
+    {"__torch_mlir_dtype_fn.aten.prod", 702880, 937},
+    {"__torch_mlir_dtype_fn.aten.sum.dim_IntList", 703817, 345},
+    {"__torch_mlir_dtype_fn.aten.prod.dim_int", 704162, 984},
+    {"__torch_mlir_dtype_fn.aten.mean.dim", 705146, 782},
+    {"__torch_mlir_dtype_fn.aten.argmax", 705928, 212},
+    {"__torch_mlir_dtype_fn.aten.argmin", 706140, 212},
+    {"__torch_mlir_dtype_fn.aten.any.dim", 706352, 558},
+    {"__torch_mlir_dtype_fn.aten.all.dim", 706910, 558},
+    {"__torch_mlir_dtype_fn.aten.min", 707468, 217},
+    {"__torch_mlir_dtype_fn.aten.min.other", 707685, 292},
+    {"__torch_mlir_dtype_fn.aten.max", 707977, 217},
+    {"__torch_mlir_dtype_fn.aten.max.other", 708194, 292},
+    {"__torch_mlir_dtype_fn.aten.amax", 708486, 266},
+    {"__torch_mlir_dtype_fn.aten.max.dim", 708752, 416},
+    {"__torch_mlir_dtype_fn.aten.min.dim", 709168, 416},
+    {"__torch_mlir_dtype_fn.aten.mean", 709584, 482},
+    {"__torch_mlir_dtype_fn.aten.std", 710066, 842},
+    {"__torch_mlir_dtype_fn.aten.std.dim", 710908, 356},
+    {"__torch_mlir_dtype_fn.aten.std.correction", 711264, 375},
+    {"__torch_mlir_dtype_fn.aten.var", 711639, 297},
+    {"__torch_mlir_dtype_fn.aten.var.dim", 711936, 356},
+    {"__torch_mlir_dtype_fn.aten.var.correction", 712292, 375},
+    {"__torch_mlir_dtype_fn.prims.var", 712667, 363},
+    {"__torch_mlir_dtype_fn.aten.linalg_vector_norm", 713030, 2913},
+    {"__torch_mlir_dtype_fn.aten.linalg_norm", 715943, 2916},
+    {"__torch_mlir_dtype_fn.aten.norm.Scalar", 718859, 1146},
+    {"__torch_mlir_dtype_fn.aten.tensor.float", 720005, 590},
+    {"__torch_mlir_dtype_fn.aten.tensor.int", 720595, 586},
+    {"__torch_mlir_dtype_fn.aten.tensor.bool", 721181, 591},
+    {"__torch_mlir_dtype_fn.aten.zeros", 721772, 626},
+    {"__torch_mlir_dtype_fn.aten.eye", 722398, 618},
+    {"__torch_mlir_dtype_fn.aten.eye.m", 723016, 639},
+    {"__torch_mlir_dtype_fn.aten.ones", 723655, 625},
+    {"__torch_mlir_dtype_fn.aten.empty.memory_format", 724280, 669},
+    {"__torch_mlir_dtype_fn.aten.full", 724949, 1093},
+    {"__torch_mlir_dtype_fn.aten.zeros_like", 726042, 723},
+    {"__torch_mlir_dtype_fn.aten.ones_like", 726765, 722},
+    {"__torch_mlir_dtype_fn.aten.empty_like", 727487, 723},
+    {"__torch_mlir_dtype_fn.aten.empty_strided", 728210, 659},
+    {"__torch_mlir_dtype_fn.aten.full_like", 728869, 744},
+    {"__torch_mlir_dtype_fn.aten.new_full", 729613, 739},
+    {"__torch_mlir_dtype_fn.aten.new_zeros", 730352, 718},
+    {"__torch_mlir_dtype_fn.aten.new_ones", 731070, 717},
+    {"__torch_mlir_dtype_fn.aten.new_empty", 731787, 718},
+    {"__torch_mlir_dtype_fn.aten.new_empty_strided", 732505, 751},
+    {"__torch_mlir_dtype_fn.aten.diag_embed", 733256, 281},
+    {"__torch_mlir_dtype_fn.aten.rand_like", 733537, 722},
+    {"__torch_mlir_dtype_fn.aten.randn_like", 734259, 1135},
+    {"__torch_mlir_dtype_fn.aten._to_copy", 735394, 741},
+    {"__torch_mlir_dtype_fn.aten.to.dtype", 736135, 220},
+    {"__torch_mlir_dtype_fn.prims.convert_element_type", 736355, 164},
+    {"__torch_mlir_dtype_fn.aten.to.dtype_layout", 736519, 768},
+    {"__torch_mlir_dtype_fn.aten.to.device", 737287, 243},
+    {"__torch_mlir_dtype_fn.aten.to.other", 737530, 322},
+    {"__torch_mlir_dtype_fn.aten._cast_Float", 737852, 188},
+    {"__torch_mlir_dtype_fn.aten._cast_Long", 738040, 187},
+    {"__torch_mlir_dtype_fn.aten.type_as", 738227, 252},
+    {"__torch_mlir_dtype_fn.aten.randint.low", 738479, 1103},
+    {"__torch_mlir_dtype_fn.aten.randn", 739582, 1059},
+    {"__torch_mlir_dtype_fn.aten.linspace", 740641, 667},
+    {"__torch_mlir_dtype_fn.aten.normal_functional", 741308, 738},
+    {"__torch_mlir_dtype_fn.aten.randn.generator", 742046, 1088},
+    {"__torch_mlir_dtype_fn.aten.var_mean.correction", 743134, 1762},
+    {"__torch_mlir_dtype_fn.aten.var_mean", 744896, 1684},
+    {"__torch_mlir_dtype_fn.aten.tan", 746580, 535},
+    {"__torch_mlir_dtype_fn.aten.atan2", 747115, 1017},
+    {"__torch_mlir_dtype_fn.aten.atan", 748132, 536},
+    {"__torch_mlir_dtype_fn.aten.atanh", 748668, 537},
+    {"__torch_mlir_dtype_fn.aten.linear", 749205, 743},
+    {"__torch_mlir_dtype_fn.aten.cat", 749948, 1564},
+    {"__torch_mlir_dtype_fn.aten.einsum", 751512, 1602},
+    {"__torch_mlir_dtype_fn.aten.trace", 753114, 537},
+    {"__torch_mlir_dtype_fn.aten._shape_as_tensor", 753651, 173},
+    {"__torch_mlir_dtype_fn.aten.ScalarImplicit", 753824, 2093},
+    {"__torch_mlir_dtype_fn.prim.NumToTensor.Scalar", 755917, 271},
+    {"__torch_mlir_dtype_fn.aten.softmax.int", 756188, 623},
+    {"__torch_mlir_dtype_fn.aten._softmax", 756811, 824},
+    {"__torch_mlir_dtype_fn.aten._log_softmax", 757635, 828},
+    {"__torch_mlir_dtype_fn.aten.log_softmax.int", 758463, 627},
+    {"__torch_mlir_dtype_fn.aten.embedding", 759090, 313},
+    {"__torch_mlir_dtype_fn.aten._embedding_bag", 759403, 650},
+    {"__torch_mlir_dtype_fn.aten.embedding_bag.padding_idx", 760053, 671},
+    {"__torch_mlir_dtype_fn.aten.bucketize.Tensor", 760724, 430},
+    {"__torch_mlir_dtype_fn.prims.squeeze", 761154, 247},
+    {"__torch_mlir_dtype_fn.prims.collapse", 761401, 261},
+    {"__torch_mlir_dtype_fn.aten.quantize_per_channel", 761662, 244},
+    {"__torch_mlir_dtype_fn.aten.quantize_per_tensor", 761906, 202},
+    {"__torch_mlir_dtype_fn.aten.dequantize.self", 762108, 172},
+    {"__torch_mlir_dtype_fn.aten.dequantize.tensor", 762280, 174},
+    {"__torch_mlir_dtype_fn.aten.int_repr", 762454, 864},
+    {"__torch_mlir_dtype_fn.aten._make_per_channel_quantized_tensor", 763318, 974},
+    {"__torch_mlir_dtype_fn.aten._make_per_tensor_quantized_tensor", 764292, 932},
+  };
+  // clang-format on
+  return index;
+}
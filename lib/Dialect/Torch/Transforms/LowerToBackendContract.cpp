@@ -20,6 +20,9 @@
 #include "llvm/ADT/StringSet.h"
 #include "llvm/Support/Debug.h"
 
+#include <chrono>
+#include <optional>
+
 #define DEBUG_TYPE "torch-lower-to-backend-contract"
 
 using namespace mlir;
@@ -173,7 +176,9 @@ static LogicalResult checkOpIsBackendLegal(Operation *op,
   }
 }
 
-static bool satisfiesBackendContract(ModuleOp module,
+// Checks the backend contract on `root`, which is either the module or one of
+// its functions.
+static bool satisfiesBackendContract(Operation *root,
                                      const ConversionTarget &target,
                                      bool actuallyEmitDiagnostics = false) {
   // We do not permit `torch.global_slot`'s in the backend contract, since
@@ -183,7 +188,7 @@ static bool satisfiesBackendContract(ModuleOp module,
   // We just check for the GlobalSlotModuleInitializerOp since its verifier
   // ensures that the set of global slots matches those initialized by the
   // module initializer.
-  auto walkResult0 = module.walk([&](Torch::GlobalSlotModuleInitializerOp op) {
+  auto walkResult0 = root->walk([&](Torch::GlobalSlotModuleInitializerOp op) {
     if (actuallyEmitDiagnostics) {
       // Report the error on the terminator to avoid dumping the whole
       // initializer itself, which can have pages of ops in it.
@@ -200,7 +205,7 @@ static bool satisfiesBackendContract(ModuleOp module,
     return false;
 
   // Check for unimplemented operators first to give more direct diagnostics.
-  walkResult0 = module.walk([&](Torch::OperatorOp op) {
+  walkResult0 = root->walk([&](Torch::OperatorOp op) {
     if (llvm::all_of(op.getResults(), [&op](auto res) {
           return succeeded(checkType(op.getOperation(), res.getType(),
                                      /*actuallyEmitDiagnostics=*/false));
@@ -224,7 +229,7 @@ static bool satisfiesBackendContract(ModuleOp module,
   // A pre-order walk gives a more intuitive "first error".
   // TODO: Should we report more than the first error?
   // How do we avoid making it too spammy?
-  auto walkResult1 = module.walk<WalkOrder::PreOrder>([&](Block *block) {
+  auto walkResult1 = root->walk<WalkOrder::PreOrder>([&](Block *block) {
     for (BlockArgument arg : block->getArguments())
       if (failed(checkType(block->getParentOp(), arg.getType(),
                            actuallyEmitDiagnostics))) {
@@ -264,11 +269,12 @@ public:
   LowerToBackendContractPass() = default;
   LowerToBackendContractPass(int maxIterations, bool decompose,
                              ArrayRef<std::string> backendLegalOps,
-                             StringRef extraLibrary) {
+                             StringRef extraLibrary, bool incremental) {
     this->maxIterations = maxIterations;
     this->decompose = decompose;
     this->backendLegalOps = backendLegalOps;
     this->extraLibrary = extraLibrary.str();
+    this->incremental = incremental;
   }
   void runOnOperation() override {
     ModuleOp module = getOperation();
@@ -286,6 +292,11 @@ public:
     options.extraLibrary = extraLibrary;
     createTorchSimplificationPipeline(pm, options);
 
+    // The functions to simplify in this iteration, or std::nullopt to
+    // simplify the whole module, and the functions that the previous
+    // iteration changed.
+    std::optional<llvm::StringSet<>> worklist;
+    llvm::StringSet<> changed;
     int i = 0;
     do {
       if (i++ == maxIterations) {
@@ -301,8 +312,25 @@ public:
         return signalPassFailure();
       }
 
-      if (failed(runPipeline(pm, module)))
+      if (incremental && i > 1)
+        worklist = getWorklist(module, target, changed);
+      changed.clear();
+      auto start = std::chrono::steady_clock::now();
+      if (failed(worklist
+                     ? runPipelineOnFunctions(pm, module, *worklist, changed)
+                     : runPipelineOnModule(pm, module, changed)))
         return signalPassFailure();
+      auto elapsed = std::chrono::duration_cast<std::chrono::microseconds>(
+          std::chrono::steady_clock::now() - start);
+      ++numIterations;
+      iterationTimeUs += elapsed.count();
+      LLVM_DEBUG({
+        llvm::dbgs() << "LowerToBackendContractPass: iteration " << i
+                     << " simplified "
+                     << (worklist ? std::to_string(worklist->size())
+                                  : std::string("all"))
+                     << " functions in " << elapsed.count() << "us\n";
+      });
     } while (!satisfiesBackendContract(module, target));
     LLVM_DEBUG({
       llvm::dbgs() << "LowerToBackendContractPass: " << "succeeded after " << i
@@ -311,6 +339,112 @@ public:
   }
 
 private:
+  // Runs `pm` on the whole module. In incremental mode, also adds the names of
+  // the functions that it changed to `changed`.
+  LogicalResult runPipelineOnModule(OpPassManager &pm, ModuleOp module,
+                                    llvm::StringSet<> &changed) {
+    if (!incremental) {
+      numFunctionsSimplified += llvm::range_size(module.getOps<func::FuncOp>());
+      return runPipeline(pm, module);
+    }
+
+    llvm::StringMap<OperationFingerPrint> before;
+    for (auto func : module.getOps<func::FuncOp>())
+      before.try_emplace(func.getSymName(), func);
+    numFunctionsSimplified += before.size();
+    if (failed(runPipeline(pm, module)))
+      return failure();
+    for (auto func : module.getOps<func::FuncOp>()) {
+      auto it = before.find(func.getSymName());
+      if (it == before.end() || it->second != OperationFingerPrint(func))
+        changed.insert(func.getSymName());
+    }
+    return success();
+  }
+
+  // Runs `pm` on only the functions in `worklist`, which must not reference or
+  // be referenced by any other function. The functions are moved into a
+  // nested module for the duration of the pipeline, so that the module passes
+  // of the pipeline only see them.
+  LogicalResult runPipelineOnFunctions(OpPassManager &pm, ModuleOp module,
+                                       const llvm::StringSet<> &worklist,
+                                       llvm::StringSet<> &changed) {
+    SmallVector<StringAttr> order;
+    for (auto func : module.getOps<func::FuncOp>())
+      order.push_back(func.getSymNameAttr());
+
+    OpBuilder builder = OpBuilder::atBlockEnd(module.getBody());
+    auto scratch = builder.create<ModuleOp>(module.getLoc());
+    for (auto func : llvm::make_early_inc_range(module.getOps<func::FuncOp>()))
+      if (worklist.contains(func.getSymName()))
+        func->moveBefore(scratch.getBody(), scratch.getBody()->end());
+
+    LogicalResult result = runPipelineOnModule(pm, scratch, changed);
+
+    // Move the functions back in their original order. Functions that were
+    // erased by the pipeline are skipped, and functions that it created are
+    // placed last.
+    Block *body = module.getBody();
+    for (Operation &op :
+         llvm::make_early_inc_range(scratch.getBody()->getOperations()))
+      op.moveBefore(body, body->end());
+    scratch.erase();
+    SymbolTable symbolTable(module);
+    DenseSet<Operation *> ordered;
+    for (StringAttr name : order) {
+      if (Operation *op = symbolTable.lookup(name)) {
+        op->moveBefore(body, body->end());
+        ordered.insert(op);
+      }
+    }
+    for (Operation &op : llvm::make_early_inc_range(*body))
+      if (!ordered.contains(&op))
+        op.moveBefore(body, body->end());
+    return result;
+  }
+
+  // Returns the functions to simplify in the next iteration: those that do not
+  // satisfy the backend contract yet or that changed in the previous
+  // iteration, together with all the functions that they reference or are
+  // referenced by. Returns std::nullopt if the whole module needs to be
+  // simplified.
+  std::optional<llvm::StringSet<>>
+  getWorklist(ModuleOp module, const ConversionTarget &target,
+              const llvm::StringSet<> &changed) {
+    // Global slots and module initializers are simplified together with the
+    // functions that use them, so only modules of functions are simplified
+    // incrementally.
+    if (!llvm::all_of(module.getOps(),
+                      [](Operation &op) { return isa<func::FuncOp>(op); }))
+      return std::nullopt;
+
+    llvm::StringSet<> worklist;
+    llvm::StringMap<SmallVector<StringRef>> references;
+    for (auto func : module.getOps<func::FuncOp>()) {
+      if (changed.contains(func.getSymName()) ||
+          !satisfiesBackendContract(func, target))
+        worklist.insert(func.getSymName());
+      if (auto uses = SymbolTable::getSymbolUses(func)) {
+        for (const SymbolTable::SymbolUse &use : *uses) {
+          StringRef callee = use.getSymbolRef().getRootReference().getValue();
+          references[func.getSymName()].push_back(callee);
+          references[callee].push_back(func.getSymName());
+        }
+      }
+    }
+
+    SmallVector<StringRef> stack;
+    for (const auto &entry : worklist)
+      stack.push_back(entry.getKey());
+    while (!stack.empty())
+      for (StringRef reference : references.lookup(stack.pop_back_val()))
+        if (worklist.insert(reference).second)
+          stack.push_back(reference);
+    if (worklist.size() == llvm::range_size(module.getOps<func::FuncOp>()))
+      return std::nullopt;
+    return worklist;
+  }
+
   llvm::StringSet<> backendLegalOpsSet;
 };
 
@@ -337,9 +471,9 @@ public:
 std::unique_ptr<OperationPass<ModuleOp>>
 mlir::torch::Torch::createLowerToBackendContractPass(
     int maxIterations, bool decompose, ArrayRef<std::string> backendLegalOps,
-    StringRef extraLibrary) {
+    StringRef extraLibrary, bool incremental) {
   return std::make_unique<LowerToBackendContractPass>(
-      maxIterations, decompose, backendLegalOps, extraLibrary);
+      maxIterations, decompose, backendLegalOps, extraLibrary, incremental);
 }
 
 std::unique_ptr<OperationPass<ModuleOp>>
@@ -67,7 +67,7 @@ void mlir::torch::Torch::createTorchFunctionToTorchBackendPipeline(
   // See the pass documentation for more information.
   pm.addPass(createLowerToBackendContractPass(
       options.maxIterations, options.decompose, options.backendLegalOps,
-      options.extraLibrary));
+      options.extraLibrary, options.incremental));
 }
 
 // A simplification pipeline to establish the invariants of the backend
@@ -10,10 +10,13 @@
 #include "ReifyAbstractInterpCalculationsUtils.h"
 #include "mlir/Parser/Parser.h"
 #include "torch-mlir/Dialect/Torch/IR/TorchOps.h"
+#include "torch-mlir/Dialect/Torch/Transforms/Passes.h"
+#include "llvm/ADT/StringExtras.h"
 #include "llvm/ADT/StringSet.h"
 #include "llvm/Support/ErrorOr.h"
 #include "llvm/Support/MemoryBuffer.h"
 #include "llvm/Support/SourceMgr.h"
+#include "llvm/Support/xxhash.h"
 
 using namespace mlir;
 using namespace mlir::torch;
@@ -66,7 +69,7 @@ createCalculateYieldCalculationOp(OpBuilder &b, Location loc,
 }
 
 LogicalResult Torch::wrapWithCalculateOpIfLibraryFunctionAvailable(
-    Operation *op, ModuleOp library, LibraryFunctionKind libFuncKind,
+    Operation *op, const TorchLibrary &library, LibraryFunctionKind libFuncKind,
     SmallVector<std::string> &libFuncNamesUsed,
     function_ref<FailureOr<SmallVector<Value>>(OpBuilder &, Location,
                                                ValueRange, func::FuncOp)>
@@ -84,7 +87,7 @@ LogicalResult Torch::wrapWithCalculateOpIfLibraryFunctionAvailable(
     name = cast<OperatorOp>(op)->getAttr("name").cast<StringAttr>().getValue();
   std::string libFuncName =
       (getLibraryFunctionPrefix(libFuncKind) + Twine(name)).str();
-  auto libFunc = library.lookupSymbol<func::FuncOp>(libFuncName);
+  auto libFunc = library.lookupFunction(libFuncName);
   if (!libFunc)
     return success();
   libFuncNamesUsed.push_back(libFuncName);
@@ -132,7 +135,7 @@ LogicalResult Torch::wrapWithCalculateOpIfLibraryFunctionAvailable(
   return success();
 }
 
-void Torch::importLibraryFunctions(ModuleOp module, ModuleOp library,
+void Torch::importLibraryFunctions(ModuleOp module, const TorchLibrary &library,
                                    SmallVector<std::string> functionsNeeded) {
   // Import just the functions we need. This includes transitive callees,
   // so we use a worklist algorithm.
@@ -141,18 +144,19 @@ void Torch::importLibraryFunctions(ModuleOp module, ModuleOp library,
     std::string symName = functionsNeeded.pop_back_val();
     if (importedFunctions.contains(symName))
       continue;
-    auto func = library.lookupSymbol<func::FuncOp>(symName);
-    assert(func && "broken library");
-    // Move the function from the library to the module this pass
-    // is running on. (this mutates the library, but we re-parse it each time
-    // so this is safe to do).
-    func->moveBefore(&module.getBody()->front());
+    auto libFunc = library.lookupFunction(symName);
+    assert(libFunc && "broken library");
+    // Clone the function into the module this pass is running on. The
+    // library is shared by all the passes running on this context, so it
+    // must not be modified.
+    auto func = cast<func::FuncOp>(libFunc->clone());
+    module.getBody()->push_front(func);
     // Set the visibility to private so that the functions go away
     // nicely after we are done with them.
     func.setVisibility(SymbolTable::Visibility::Private);
     // Continue the DFS.
     importedFunctions.insert(symName);
-    func.walk([&](func::CallOp op) {
+    libFunc.walk([&](func::CallOp op) {
       functionsNeeded.push_back(op.getCallee().str());
     });
   }
@@ -320,21 +324,14 @@ Torch::adjustFunctionArg(OpBuilder &b, Location loc, Value operand,
   return operand;
 }
 
-LogicalResult
-mlir::torch::Torch::loadExtraLibrary(const std::string &filename,
-                                     OwningOpRef<ModuleOp> &moduleToAppendTo) {
+static LogicalResult appendLibrary(const std::string &filename,
+                                   std::unique_ptr<llvm::MemoryBuffer> buffer,
+                                   OwningOpRef<ModuleOp> &moduleToAppendTo) {
   auto ctx = moduleToAppendTo->getContext();
   assert(ctx && "Module should be fully initialized.");
 
-  llvm::ErrorOr<std::unique_ptr<llvm::MemoryBuffer>> fileOrErr =
-      llvm::MemoryBuffer::getFileOrSTDIN(filename);
-  if (std::error_code ec = fileOrErr.getError()) {
-    llvm::errs() << "Could not open input file: " << ec.message() << "\n";
-    return failure();
-  }
-
   llvm::SourceMgr sourceMgr;
-  sourceMgr.AddNewSourceBuffer(std::move(*fileOrErr), llvm::SMLoc());
+  sourceMgr.AddNewSourceBuffer(std::move(buffer), llvm::SMLoc());
   OwningOpRef<ModuleOp> module_ =
       mlir::parseSourceFile<mlir::ModuleOp>(sourceMgr, ctx);
   if (!module_) {
@@ -355,3 +352,53 @@ mlir::torch::Torch::loadExtraLibrary(const std::string &filename,
 
   return success();
 }
+
+static llvm::ErrorOr<std::unique_ptr<llvm::MemoryBuffer>>
+readExtraLibrary(const std::string &filename) {
+  llvm::ErrorOr<std::unique_ptr<llvm::MemoryBuffer>> fileOrErr =
+      llvm::MemoryBuffer::getFileOrSTDIN(filename);
+  if (std::error_code ec = fileOrErr.getError())
+    llvm::errs() << "Could not open input file: " << ec.message() << "\n";
+  return fileOrErr;
+}
+
+LogicalResult
+mlir::torch::Torch::loadExtraLibrary(const std::string &filename,
+                                     OwningOpRef<ModuleOp> &moduleToAppendTo) {
+  llvm::ErrorOr<std::unique_ptr<llvm::MemoryBuffer>> fileOrErr =
+      readExtraLibrary(filename);
+  if (!fileOrErr)
+    return failure();
+  return appendLibrary(filename, std::move(*fileOrErr), moduleToAppendTo);
+}
+
+const TorchLibrary *mlir::torch::Torch::getCachedAbstractInterpLibrary(
+    MLIRContext *context, const std::string &extraLibrary) {
+  auto loadLibrary = [&]() {
+    return std::make_unique<TorchLibrary>(context, getAbstractInterpLibrary(),
+                                          getAbstractInterpLibraryIndex());
+  };
+  TorchLibraryCacheInterface &cache = TorchLibraryCacheInterface::get(context);
+  if (extraLibrary.empty())
+    return cache.getOrLoad("abstract_interp_library", loadLibrary);
+
+  // The file is read on every call (which is cheap compared to parsing it),
+  // so that changes to it are picked up.
+  llvm::ErrorOr<std::unique_ptr<llvm::MemoryBuffer>> fileOrErr =
+      readExtraLibrary(extraLibrary);
+  if (!fileOrErr)
+    return nullptr;
+  std::unique_ptr<llvm::MemoryBuffer> buffer = std::move(*fileOrErr);
+  std::string key = "abstract_interp_library+" + extraLibrary + "@" +
+                    llvm::utohexstr(llvm::xxh3_64bits(buffer->getBuffer()));
+  return cache.getOrLoad(key, [&]() -> std::unique_ptr<TorchLibrary> {
+    OwningOpRef<ModuleOp> extraLibraryModule =
+        ModuleOp::create(UnknownLoc::get(context));
+    if (failed(
+            appendLibrary(extraLibrary, std::move(buffer), extraLibraryModule)))
+      return nullptr;
+    std::unique_ptr<TorchLibrary> library = loadLibrary();
+    library->addModule(std::move(extraLibraryModule));
+    return library;
+  });
+}
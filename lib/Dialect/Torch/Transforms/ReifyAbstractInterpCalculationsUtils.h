@@ -16,6 +16,7 @@
 #include "mlir/IR/Operation.h"
 #include "mlir/IR/OperationSupport.h"
 #include "mlir/Support/LogicalResult.h"
+#include "torch-mlir/Dialect/Torch/IR/TorchLibraryCache.h"
 #include "torch-mlir/Dialect/Torch/IR/TorchOps.h"
 
 namespace mlir {
@@ -41,7 +42,7 @@ enum class LibraryFunctionKind {
 // Note: This function does *not* import the abstract interpretation function
 // from the library into the IR.
 LogicalResult wrapWithCalculateOpIfLibraryFunctionAvailable(
-    Operation *op, ModuleOp library, LibraryFunctionKind funcKind,
+    Operation *op, const TorchLibrary &library, LibraryFunctionKind funcKind,
     SmallVector<std::string> &libFuncNamesUsed,
     function_ref<FailureOr<SmallVector<Value>>(OpBuilder &, Location,
                                                ValueRange, func::FuncOp)>
@@ -50,10 +51,21 @@ LogicalResult wrapWithCalculateOpIfLibraryFunctionAvailable(
 // Imports the functions in `functionsNeeded` from the library into the module.
 // This function assumes that all functions needed exist in the library.
 //
-// Note: This function modifies the library.
-void importLibraryFunctions(ModuleOp module, ModuleOp library,
+// Note: The functions are cloned, so the library is left unmodified.
+void importLibraryFunctions(ModuleOp module, const TorchLibrary &library,
                             SmallVector<std::string> functionsNeeded);
 
+// Returns the abstract interpretation library with the functions of the
+// `extraLibrary` file (if not empty) added to it.
+//
+// The library is cached per context by the path and content hash of
+// `extraLibrary`, so a changed file is reloaded. Functions of the built-in
+// library are parsed when first looked up. Returns null if the extra library
+// cannot be loaded.
+const TorchLibrary *
+getCachedAbstractInterpLibrary(MLIRContext *context,
+                               const std::string &extraLibrary);
+
 // Recursively adjust `operand` to match `desiredType`.
 //
 // This function by default handles a few types such as `UnionType`,
@@ -70,14 +70,13 @@ struct ReifyDtypeCalculationsPass
   void runOnOperation() override {
     MLIRContext *context = &getContext();
     ModuleOp module = getOperation();
-    OwningOpRef<ModuleOp> library =
-        parseSourceString<ModuleOp>(getAbstractInterpLibrary(), context);
-    if (!extraLibrary.empty())
-      if (failed(mlir::torch::Torch::loadExtraLibrary(extraLibrary, library))) {
-        emitError(module->getLoc(),
-                  "Failed to load extra-library file at " + extraLibrary);
-        return signalPassFailure();
-      }
+    const TorchLibrary *library =
+        getCachedAbstractInterpLibrary(context, extraLibrary);
+    if (!library) {
+      emitError(module->getLoc(),
+                "Failed to load extra-library file at " + extraLibrary);
+      return signalPassFailure();
+    }
 
     // Walk all the operations, and if we have a dtype function, wrap the op
     // in a `torch.dtype.calculate` op.
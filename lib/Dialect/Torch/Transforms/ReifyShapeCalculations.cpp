@@ -66,17 +66,13 @@ struct ReifyShapeCalculationsPass
     MLIRContext *context = &getContext();
     ModuleOp module = getOperation();
 
-    // TODO: Find a way to not have to parse this every time.
-    // The library is O(#ops we know about), and this pass should be
-    // O(#ops in the program) ideally.
-    OwningOpRef<ModuleOp> library =
-        parseSourceString<ModuleOp>(getAbstractInterpLibrary(), context);
-    if (!extraLibrary.empty())
-      if (failed(mlir::torch::Torch::loadExtraLibrary(extraLibrary, library))) {
-        emitError(module->getLoc(),
-                  "Failed to load extra-library file at " + extraLibrary);
-        return signalPassFailure();
-      }
+    const TorchLibrary *library =
+        getCachedAbstractInterpLibrary(context, extraLibrary);
+    if (!library) {
+      emitError(module->getLoc(),
+                "Failed to load extra-library file at " + extraLibrary);
+      return signalPassFailure();
+    }
 
     // Walk all the operations, and if we have a shape function, wrap the op
     // in a `torch.shape.calculate` op.
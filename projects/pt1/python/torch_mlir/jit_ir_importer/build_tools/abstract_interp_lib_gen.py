@@ -6,6 +6,7 @@
 from typing import List, Optional, Any, Tuple, Union, Dict, Set
 import argparse
 import os
+import re
 
 import torch
 from torch import device
@@ -4790,9 +4791,22 @@ def _maybe_import_op_extensions(args: argparse.Namespace):
             # importing these modules, so we don't need the return value.
             importlib.import_module(name)
 
+def _function_index(asm: str) -> List[Tuple[str, int, int]]:
+    """Returns the name, offset and size of each function in `asm`.
+
+    The index is emitted along with the library, so that the compiler can
+    parse only the functions used by a program rather than the whole library.
+    """
+    pattern = re.compile(r'^  func\.func (?:private )?@(?:"([^"]*)"|([^(]+))\(.*?^  }\n',
+                         re.MULTILINE | re.DOTALL)
+    return [(m.group(1) or m.group(2), m.start(), m.end() - m.start())
+            for m in pattern.finditer(asm)]
+
 def main(args):
     _maybe_import_op_extensions(args)
     asm = generate_library(globals())
+    index = "\n".join(f"    {{\"{name}\", {offset}, {size}}},"
+                      for name, offset, size in _function_index(asm))
     # We're about to put quotes around the string, so escape the `"` characters.
     asm = asm.replace("\"", "\\\"")
 
@@ -4827,6 +4841,7 @@ f"""//===-------------------------------------------------------------*- C++-*-=
 #include "torch-mlir/Dialect/Torch/Transforms/Passes.h"
 
 using namespace mlir;
+using namespace mlir::torch::Torch;
 
 StringRef mlir::torch::Torch::getAbstractInterpLibrary() {{
 #if defined(__clang__)
@@ -4839,6 +4854,16 @@ StringRef mlir::torch::Torch::getAbstractInterpLibrary() {{
 #if defined(__clang__)
 #pragma clang diagnostic pop
 #endif
+}}
+
+ArrayRef<TorchLibraryFunction>
+mlir::torch::Torch::getAbstractInterpLibraryIndex() {{
+  // clang-format off
+  static const TorchLibraryFunction index[] = {{
+{index}
+  }};
+  // clang-format on
+  return index;
 }}""")
 
 def _create_argparse() -> argparse.ArgumentParser:
@@ -6,10 +6,12 @@
 from typing import Optional, Sequence, Union, List, Dict, Tuple, Callable, Iterable
 from enum import Enum
 
-import sys
-from io import StringIO
+import collections
+import io
+import itertools
 import tempfile
 import os
+import weakref
 
 from torch._functorch.compile_utils import strip_overloads
 import torch
@@ -17,11 +19,18 @@ import torch.fx
 from torch_mlir.dynamo import _get_decomposition_table
 from torch.fx.experimental.proxy_tensor import make_fx
 
+from torch_mlir import ir
+from torch_mlir.compile_cache import code_and_state, fingerprint
 from torch_mlir.compiler_utils import (
+    capture_diagnostics,
     run_pipeline_with_repro_report,
+    OutputFile,
     OutputType,
+    PassReport,
     lower_mlir_module,
+    write_bytecode,
 )
+from torch_mlir.dialects import torch as torch_d
 from torch_mlir.jit_ir_importer import ClassAnnotator, ImportOptions, ModuleBuilder
 from torch_mlir.jit_ir_importer.build_tools.library_generator import generate_library
 
@@ -223,18 +232,205 @@ def _canon_extra_library(
         extra_library_dict = {}
         for library_func in extra_library:
             extra_library_dict[library_func.__name__] = library_func
-        mlir_library = generate_library(extra_library_dict)
-
+        stem, ext = os.path.splitext(extra_library_file_name)
+
+        # Generating the library scripts and imports every function, so the
+        # file is named by a key of the code of the functions (and the code
+        # and globals that it uses) and the compiler versions, and reused
+        # across processes. Libraries whose code cannot be described are
+        # generated on every call and named by their content.
+        code = code_and_state(*extra_library_dict.values())
+        mlir_library = None
+        if code is not None:
+            digest = fingerprint("extra_library", list(extra_library_dict), code)
+        else:
+            mlir_library = generate_library(extra_library_dict)
+            digest = fingerprint("extra_library", mlir_library)
         extra_library_file = os.path.join(
-            tempfile.gettempdir(), extra_library_file_name
+            tempfile.gettempdir(), f"{stem}.{digest[:16]}{ext}"
+        )
+        if os.path.exists(extra_library_file):
+            return extra_library_file
+        if mlir_library is None:
+            mlir_library = generate_library(extra_library_dict)
+        # Write atomically, since another process may be reading it.
+        fd, temp_file = tempfile.mkstemp(
+            prefix=f"{stem}.", suffix=".tmp", dir=tempfile.gettempdir()
         )
-        with open(extra_library_file, "w") as f:
+        with os.fdopen(fd, "w") as f:
             f.write(mlir_library)
+        os.replace(temp_file, extra_library_file)
         return extra_library_file
     else:
         return ""
 
 
+def _script(
+    model: torch.nn.Module,
+    example_args: ExampleArgs,
+    use_tracing: bool,
+    ignore_traced_shapes: bool,
+) -> torch.jit.ScriptModule:
+    """Returns `model` as JIT IR (TorchScript), for import."""
+    if isinstance(model, torch.jit.ScriptModule):
+        # If the user already converted the model to JIT IR themselves, just
+        # do some basic error checking, but take the model as-is.
+        for method_name in example_args._get_methods():
+            if not hasattr(model, method_name):
+                raise Exception(
+                    f"Model does not have exported method '{method_name}', "
+                    f"requested in `example_args`. Consider adding "
+                    f"`@torch.jit.export` to the method definition."
+                )
+        return model
+    elif use_tracing:
+        return torch.jit.trace_module(
+            model, example_args._get_for_tracing(use_tracing, ignore_traced_shapes)
+        )
+    else:
+        # Make sure that all the methods that the user requested get scripted.
+        # By default, PyTorch only scripts the `forward` method and transitive
+        # callees.
+        for method_name in example_args._get_methods():
+            torch.jit.export(getattr(model, method_name).__func__)
+        return torch.jit.script(model)
+
+
+def _import_scripted(
+    scripted: torch.jit.ScriptModule,
+    example_args: ExampleArgs,
+    ignore_traced_shapes: bool,
+) -> ir.Module:
+    """Imports `scripted` to the torch dialect, annotating the arguments of
+    its methods with the shapes and dtypes of `example_args`."""
+    class_annotator = ClassAnnotator()
+    class_annotator.exportNone(scripted._c._type())
+    for method_name, placeholders in example_args._get_for_annotation().items():
+        class_annotator.exportPath(scripted._c._type(), [method_name])
+        annotation = [None]  # `None` is always the annotation for "self".
+        for arg in placeholders:
+            annotation.append((arg.shape, arg.dtype, True))
+        class_annotator.annotateArgs(scripted._c._type(), [method_name], annotation)
+
+    mb = ModuleBuilder()
+    import_options = ImportOptions()
+    import_options.ignoreExistingTensorShapesAndDtypes = ignore_traced_shapes
+    with capture_diagnostics(mb.module.context) as diagnostics:
+        try:
+            # Import the TorchScript module to MLIR
+            mb.import_module(scripted._c, class_annotator, import_options)
+        except Exception as e:
+            diagnostics_text = "\n".join(diagnostics)
+            raise Exception(
+                f"""
+PyTorch TorchScript module -> torch-mlir Object Graph IR import failed with:
+### Importer C++ Exception:
+{e}
+### Importer Diagnostics:
+{diagnostics_text}
+"""
+            ) from None
+    return mb.module
+
+
+def _model_signature(model: torch.nn.Module) -> tuple:
+    # The version of a tensor is bumped by in-place updates.
+    tensors = itertools.chain(model.named_parameters(), model.named_buffers())
+    return (
+        type(model),
+        tuple((name, id(tensor), tensor._version) for name, tensor in tensors),
+    )
+
+
+class _ImportCacheEntry:
+    __slots__ = ["signature", "scripted", "modules"]
+
+    def __init__(self, signature: tuple):
+        self.signature = signature
+        # The scripted or traced model, by how it was scripted or traced.
+        # Models that are already ScriptModules are not stored, since that
+        # would keep them (the keys of the cache) alive.
+        self.scripted: Dict[tuple, torch.jit.ScriptModule] = {}
+        # The imported modules as bytecode, by the key of the scripted model,
+        # the annotations and the import options.
+        self.modules: "collections.OrderedDict[tuple, bytes]" = (
+            collections.OrderedDict()
+        )
+
+
+class ImportCache:
+    """An in-process cache of scripted and imported models for `compile`.
+
+    Scripting (or tracing) and importing a model are repeated by every call
+    of `compile`. With a cache, a model is scripted once, and imported once
+    per annotation signature (the shapes and dtypes of the example args) and
+    import options, so that compiles of the same model that only change the
+    output type or the lowering options only rerun the lowering, and
+    compiles that change shapes skip scripting.
+
+    Models are identified by object, class and the identity and version of
+    their parameters and buffers, so in-place updates of the weights are
+    picked up. Other changes to a model, such as to its plain Python
+    attributes, are not detected. Imported modules are kept as MLIR bytecode,
+    at most `max_modules` (least recently used first evicted) per model, for
+    as long as the model is alive. Models traced with `use_make_fx` are not
+    cached.
+    """
+
+    def __init__(self, *, max_modules: int = 8):
+        self.max_modules = max_modules
+        self.hits = 0
+        self.misses = 0
+        # The `_ImportCacheEntry` of each model.
+        self._entries = weakref.WeakKeyDictionary()
+
+    def _import(
+        self,
+        model: torch.nn.Module,
+        example_args: ExampleArgs,
+        use_tracing: bool,
+        ignore_traced_shapes: bool,
+    ) -> ir.Module:
+        signature = _model_signature(model)
+        entry = self._entries.get(model)
+        if entry is None or entry.signature != signature:
+            entry = _ImportCacheEntry(signature)
+            self._entries[model] = entry
+
+        annotations = tuple(
+            (method_name, tuple((tuple(arg.shape), arg.dtype) for arg in args))
+            for method_name, args in example_args._get_for_annotation().items()
+        )
+        # Traces depend on the example args, scripts only on the methods.
+        if use_tracing:
+            script_key = ("trace", annotations, ignore_traced_shapes)
+        else:
+            script_key = ("script", tuple(example_args._get_methods()))
+        module_key = (script_key, annotations, ignore_traced_shapes)
+
+        bytecode = entry.modules.get(module_key)
+        if bytecode is not None:
+            self.hits += 1
+            entry.modules.move_to_end(module_key)
+            context = ir.Context()
+            torch_d.register_dialect(context)
+            return ir.Module.parse(bytecode, context)
+
+        self.misses += 1
+        scripted = entry.scripted.get(script_key)
+        if scripted is None:
+            scripted = _script(model, example_args, use_tracing, ignore_traced_shapes)
+            if scripted is not model:
+                entry.scripted[script_key] = scripted
+        module = _import_scripted(scripted, example_args, ignore_traced_shapes)
+        buffer = io.BytesIO()
+        module.operation.write_bytecode(buffer)
+        entry.modules[module_key] = buffer.getvalue()
+        while len(entry.modules) > self.max_modules:
+            entry.modules.popitem(last=False)
+        return module
+
+
 def compile(
     model: torch.nn.Module,
     example_args: _example_args,
@@ -246,6 +442,9 @@ def compile(
     verbose: bool = False,
     use_make_fx: bool = False,
     enable_ir_printing: bool = False,
+    pass_report: Optional[PassReport] = None,
+    output_file: Optional[OutputFile] = None,
+    import_cache: Optional[ImportCache] = None,
 ):
     """Convert a PyTorch model to MLIR.
 
@@ -282,6 +481,16 @@ def compile(
             flag. Note that this can easily generate many gigabytes of text,
             so make sure to pipe stderr to a file (for example, run
             `python tinymodel.py 2> tinymodel.stderr` on Linux).
+        pass_report: If given, the per-pass timing and statistics of each
+            lowering pipeline are recorded in it. See `PassReport`.
+        output_file: If given, a path or binary stream that the resulting
+            module is also written to as MLIR bytecode. Unlike printing the
+            module, this streams resource blobs and so does not build the
+            whole serialized module in memory.
+        import_cache: If given, the scripted and imported model are looked up
+            in and added to it, so that repeated compiles of the same model
+            only rerun the stages that depend on what changed. See
+            `ImportCache`.
 
     Returns:
         An MLIR module that contains the converted model in the specified
@@ -326,59 +535,17 @@ def compile(
     # backend. This separation should be visible at the Python API level, and
     # we can implement a deliberately simplified API like `torchscript.compile`
     # on top of those building blocks.
-    if isinstance(model, torch.jit.ScriptModule):
-        # If the user already converted the model to JIT IR themselves, just
-        # do some basic error checking, but take the model as-is.
-        for method_name in example_args._get_methods():
-            if not hasattr(model, method_name):
-                raise Exception(
-                    f"Model does not have exported method '{method_name}', "
-                    f"requested in `example_args`. Consider adding "
-                    f"`@torch.jit.export` to the method definition."
-                )
-        scripted = model
-    elif use_tracing:
-        scripted = torch.jit.trace_module(
-            model, example_args._get_for_tracing(use_tracing, ignore_traced_shapes)
+    if import_cache is not None and not use_make_fx:
+        module = import_cache._import(
+            model, example_args, use_tracing, ignore_traced_shapes
         )
     else:
-        # Make sure that all the methods that the user requested get scripted.
-        # By default, PyTorch only scripts the `forward` method and transitive
-        # callees.
-        for method_name in example_args._get_methods():
-            torch.jit.export(getattr(model, method_name).__func__)
-        scripted = torch.jit.script(model)
-    class_annotator = ClassAnnotator()
-    class_annotator.exportNone(scripted._c._type())
-    for method_name, example_args in example_args._get_for_annotation().items():
-        class_annotator.exportPath(scripted._c._type(), [method_name])
-        annotation = [None]  # `None` is always the annotation for "self".
-        for arg in example_args:
-            annotation.append((arg.shape, arg.dtype, True))
-        class_annotator.annotateArgs(scripted._c._type(), [method_name], annotation)
-
-    mb = ModuleBuilder()
-    import_options = ImportOptions()
-    import_options.ignoreExistingTensorShapesAndDtypes = ignore_traced_shapes
-    try:
-        original_stderr = sys.stderr
-        sys.stderr = StringIO()
-        # Import the TorchScript module to MLIR
-        mb.import_module(scripted._c, class_annotator, import_options)
-    except Exception as e:
-        raise Exception(
-            f"""
-PyTorch TorchScript module -> torch-mlir Object Graph IR import failed with:
-### Importer C++ Exception:
-{e}
-### Importer Diagnostics:
-{sys.stderr.getvalue()}
-"""
-        ) from None
-    finally:
-        sys.stderr = original_stderr
+        scripted = _script(model, example_args, use_tracing, ignore_traced_shapes)
+        module = _import_scripted(scripted, example_args, ignore_traced_shapes)
     if output_type == OutputType.RAW:
-        return mb.module
+        if output_file is not None:
+            write_bytecode(module, output_file)
+        return module
 
     option_string = (
         "{backend-legal-ops="
@@ -388,10 +555,17 @@ PyTorch TorchScript module -> torch-mlir Object Graph IR import failed with:
         + "}"
     )
     run_pipeline_with_repro_report(
-        mb.module,
+        module,
         f"builtin.module(torchscript-module-to-torch-backend-pipeline{option_string})",
         "Lowering TorchScript IR -> Torch Backend IR",
         enable_ir_printing=enable_ir_printing,
+        pass_report=pass_report,
     )
 
-    return lower_mlir_module(verbose, output_type, mb.module)
+    return lower_mlir_module(
+        verbose,
+        output_type,
+        module,
+        pass_report=pass_report,
+        output_file=output_file,
+    )
@@ -4,7 +4,7 @@
 # Also available under a BSD-style license. See LICENSE.
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import io
 import onnx
@@ -19,20 +19,23 @@ from .utils import (
     recursively_convert_from_numpy,
 )
 
+from torch_mlir.context_pool import ContextPool
 from torch_mlir.extras import onnx_importer
-from torch_mlir.dialects import torch as torch_d
 from torch_mlir.ir import Context, Module
 
+# Imports of consecutive tests share a context per thread.
+_CONTEXT_POOL = ContextPool()
 
-def import_onnx(contents):
+
+def import_onnx(contents, context: Optional[Context] = None):
     # Import the ONNX model proto from the file contents:
     raw_model = onnx.load_from_string(contents)
     # since it does not affect current e2e tests, data_prop is left false here
     model_proto = onnx.shape_inference.infer_shapes(raw_model)
 
     # Import the ONNX module into an MLIR module:
-    context = Context()
-    torch_d.register_dialect(context)
+    if context is None:
+        context = _CONTEXT_POOL.thread_context()
     model_info = onnx_importer.ModelInfo(model_proto)
     m = model_info.create_module(context=context)
     imp = onnx_importer.NodeImporter.define_function(model_info.main_graph, m.operation)
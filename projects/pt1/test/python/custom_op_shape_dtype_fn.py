@@ -21,10 +21,14 @@ goofy_lib.define("identity(Tensor t) -> Tensor")
 goofy_lib.impl("identity", identity)
 
 
-def goofy〇identity〡shape(t: List[int]) -> List[int]:
+def _identity_shape(t: List[int]) -> List[int]:
     return t
 
 
+def goofy〇identity〡shape(t: List[int]) -> List[int]:
+    return _identity_shape(t)
+
+
 def goofy〇identity〡dtype(t_rank_dtype: Tuple[int, int]) -> int:
     t_rank, t_dtype = t_rank_dtype
     return t_dtype
@@ -87,6 +91,41 @@ run()
 # CHECK:      }
 # CHECK:    }
 
+
+def test_extra_library_cache():
+    global _identity_shape
+    library_file = torchscript._canon_extra_library(extra_library)
+    # Later compiles (in this or another process) find the library on disk,
+    # without generating it again.
+    generate_library = torchscript.generate_library
+    torchscript.generate_library = None
+    try:
+        print(
+            "reused:", torchscript._canon_extra_library(extra_library) == library_file
+        )
+    finally:
+        torchscript.generate_library = generate_library
+
+    # Changing a helper of a library function changes the library.
+    original = _identity_shape
+
+    def _identity_shape(t: List[int]) -> List[int]:
+        return t[:]
+
+    try:
+        print(
+            "regenerated:",
+            torchscript._canon_extra_library(extra_library) != library_file,
+        )
+    finally:
+        _identity_shape = original
+
+
+test_extra_library_cache()
+
+# CHECK: reused: True
+# CHECK: regenerated: True
+
 # Using `torch.multiprocessing` adds extra namespaces to the abstract
 # interpretation functions when they are imported into MLIR:
 #   `func @"__torch__.__mp_main__.{name}...`
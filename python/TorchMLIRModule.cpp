@@ -9,10 +9,38 @@
 
 #include "mlir/Bindings/Python/PybindAdaptors.h"
 #include "torch-mlir-c/Dialects.h"
+#include "torch-mlir-c/PassReport.h"
 #include "torch-mlir-c/Registration.h"
+#include "torch-mlir-c/TorchTypes.h"
+
+#include <pybind11/stl.h>
 
 namespace py = pybind11;
 
+namespace {
+/// Owns a TorchMlirPassReport.
+class PyPassReportCollector {
+public:
+  PyPassReportCollector(TorchMlirPassReport report) : report(report) {}
+  PyPassReportCollector(const PyPassReportCollector &) = delete;
+  ~PyPassReportCollector() { torchMlirPassReportDestroy(report); }
+
+  std::string toJson() {
+    std::string json;
+    torchMlirPassReportPrintJson(
+        report,
+        [](MlirStringRef part, void *userData) {
+          static_cast<std::string *>(userData)->append(part.data, part.length);
+        },
+        &json);
+    return json;
+  }
+
+private:
+  TorchMlirPassReport report;
+};
+} // namespace
+
 PYBIND11_MODULE(_torchMlir, m) {
   torchMlirRegisterAllPasses();
 
@@ -28,4 +56,43 @@ PYBIND11_MODULE(_torchMlir, m) {
         }
       },
       py::arg("context"), py::arg("load") = true);
+
+  // Structured type builders. These avoid round-tripping through the type
+  // parser for the (very frequent) tensor types produced by the importers.
+  // A size of -1 denotes a dynamic dimension.
+  m.def(
+      "get_value_tensor_type",
+      [](MlirContext context, std::vector<int64_t> sizes, MlirType dtype) {
+        return torchMlirTorchValueTensorTypeGet(context, sizes.size(),
+                                                sizes.data(), dtype);
+      },
+      py::arg("context"), py::arg("sizes"), py::arg("dtype"));
+  m.def(
+      "get_non_value_tensor_type",
+      [](MlirContext context, std::vector<int64_t> sizes, MlirType dtype) {
+        return torchMlirTorchNonValueTensorTypeGet(context, sizes.size(),
+                                                   sizes.data(), dtype);
+      },
+      py::arg("context"), py::arg("sizes"), py::arg("dtype"));
+
+  // The number of abstract interpretation libraries parsed in a context,
+  // which are otherwise cached across pass runs.
+  m.def(
+      "get_num_library_loads",
+      [](MlirContext context) {
+        return torchMlirContextGetNumLibraryLoads(context);
+      },
+      py::arg("context"));
+
+  // Per-pass timing and statistics.
+  py::class_<PyPassReportCollector>(m, "PassReportCollector")
+      .def("to_json", &PyPassReportCollector::toJson);
+  m.def(
+      "add_pass_report",
+      [](MlirPassManager passManager, bool timing, bool statistics) {
+        return std::make_unique<PyPassReportCollector>(
+            torchMlirPassManagerAddReport(passManager, timing, statistics));
+      },
+      py::arg("pass_manager"), py::arg("timing") = true,
+      py::arg("statistics") = true);
 }
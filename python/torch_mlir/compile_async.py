@@ -0,0 +1,118 @@
+# Part of the LLVM Project, under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+# Also available under a BSD-style license. See LICENSE.
+
+"""Background compilation in worker processes.
+
+`compile_async` runs a compile API (such as `fx.export_and_import` or
+`torchscript.compile`) in a process pool and returns a future of the compiled
+module. Modules are transferred as MLIR bytecode and parsed in the context of
+the caller, so several models can be imported and lowered in parallel without
+holding up the calling thread.
+"""
+
+import concurrent.futures
+import io
+import multiprocessing
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from torch_mlir import ir
+from torch_mlir.dialects import torch as torch_d
+
+__all__ = [
+    "compile_async",
+    "new_executor",
+]
+
+_default_executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def new_executor(
+    max_workers: Optional[int] = None,
+) -> concurrent.futures.ProcessPoolExecutor:
+    """Returns a process pool suitable for `compile_async`.
+
+    Workers are spawned rather than forked, since forking a process that has
+    started MLIR or PyTorch threads is unsafe.
+    """
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def _get_default_executor() -> concurrent.futures.ProcessPoolExecutor:
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = new_executor()
+        return _default_executor
+
+
+def _compile_to_bytecode(
+    compile_fn: Callable, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Tuple[bytes, Optional[list]]:
+    module = compile_fn(*args, **kwargs)
+    buffer = io.BytesIO()
+    module.operation.write_bytecode(buffer)
+    pass_report = kwargs.get("pass_report")
+    return buffer.getvalue(), None if pass_report is None else pass_report.stages
+
+
+def compile_async(
+    compile_fn: Callable,
+    *args,
+    executor: Optional[concurrent.futures.Executor] = None,
+    context: Optional[ir.Context] = None,
+    **kwargs,
+) -> concurrent.futures.Future:
+    """Runs `compile_fn(*args, **kwargs)` in `executor`.
+
+    `compile_fn` and its arguments must be picklable: models are pickled by
+    reference to their class, so they must be defined in an importable module.
+    If no executor is given, a shared pool with one worker per core is used.
+
+    Returns a future of the compiled module, which is parsed in `context` (or
+    a new context) once compilation completes. Parsing happens on an executor
+    thread, so `context` must not be used concurrently until the future is
+    done. Failures of `compile_fn` are raised by the future's `result()`. If a
+    `pass_report` is given, the stages recorded by the worker are added to it.
+
+    The future can be cancelled until compilation completes: compilation is
+    cancelled if it has not started yet, and otherwise its result is discarded
+    without being parsed.
+    """
+    if executor is None:
+        executor = _get_default_executor()
+    pass_report = kwargs.get("pass_report")
+    result = concurrent.futures.Future()
+
+    def on_done(compiled: concurrent.futures.Future):
+        # Once running, `result` can no longer be cancelled.
+        if not result.set_running_or_notify_cancel():
+            return
+        try:
+            bytecode, stages = compiled.result()
+            if stages is not None:
+                pass_report.stages.extend(stages)
+            target = context
+            if target is None:
+                target = ir.Context()
+                torch_d.register_dialect(target)
+            result.set_result(ir.Module.parse(bytecode, target))
+        except BaseException as e:
+            result.set_exception(e)
+
+    compiled = executor.submit(_compile_to_bytecode, compile_fn, args, kwargs)
+
+    def on_result_done(future: concurrent.futures.Future):
+        if future.cancelled():
+            compiled.cancel()
+
+    result.add_done_callback(on_result_done)
+    compiled.add_done_callback(on_done)
+    return result
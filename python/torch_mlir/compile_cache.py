@@ -0,0 +1,392 @@
+# Part of the LLVM Project, under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+# Also available under a BSD-style license. See LICENSE.
+
+"""Persistent, content-addressed cache of compiled modules.
+
+Entries are MLIR bytecode files named by the hex digest of a key that
+captures everything that the compiled module depends on (see `fingerprint`).
+Writes are atomic (write to a temporary file, then rename), so several
+processes can share one cache directory. The directory is bounded in size by
+evicting the least recently used entries.
+"""
+
+import functools
+import hashlib
+import importlib.metadata
+import os
+import platform
+import sys
+import tempfile
+import types
+from typing import Any, Dict, FrozenSet, List, Optional
+
+import torch
+
+from torch_mlir import ir
+from torch_mlir._mlir_libs import _torchMlir
+from torch_mlir.dialects import torch as torch_d
+
+__all__ = [
+    "CompileCache",
+    "code_and_state",
+    "fingerprint",
+]
+
+_ENTRY_SUFFIX = ".mlirbc"
+
+
+def _torch_mlir_version() -> str:
+    try:
+        return importlib.metadata.version("torch-mlir")
+    except importlib.metadata.PackageNotFoundError:
+        # Development builds are not installed as a distribution: identify the
+        # build by its native extension.
+        stat = os.stat(_torchMlir.__file__)
+        return f"dev-{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def _update(h, obj: Any):
+    """Feeds a canonical, type-tagged encoding of `obj` to the hash `h`."""
+    if isinstance(obj, torch.Tensor):
+        # Tensors are hashed by content. Fake (and other storage-less) tensors
+        # are hashed by their metadata only.
+        h.update(f"T{obj.dtype}{tuple(obj.shape)}".encode())
+        if (
+            type(obj) in (torch.Tensor, torch.nn.Parameter)
+            and obj.device.type != "meta"
+        ):
+            data = obj.detach().cpu().contiguous().reshape(-1).view(torch.uint8)
+            h.update(data.numpy().tobytes())
+    elif isinstance(obj, dict):
+        h.update(f"D{len(obj)}".encode())
+        for key in sorted(obj, key=repr):
+            _update(h, key)
+            _update(h, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"L{len(obj)}".encode())
+        for item in obj:
+            _update(h, item)
+    elif isinstance(obj, (str, bytes)):
+        data = obj.encode() if isinstance(obj, str) else obj
+        h.update(f"S{len(data)}:".encode())
+        h.update(data)
+    elif isinstance(obj, type) and hasattr(obj, "min") and hasattr(obj, "max"):
+        # torch.export.Dim, whose repr does not include its bounds.
+        _update(h, ("Dim", obj.__name__, obj.min, obj.max))
+    else:
+        _update(h, repr(obj))
+
+
+def fingerprint(*parts: Any) -> str:
+    """Returns a hex digest identifying `parts` (and the compiler versions).
+
+    Parts may be (nested) dicts, lists and tuples of tensors, strings and
+    other values with a deterministic repr.
+    """
+    h = hashlib.sha256()
+    _update(h, (torch.__version__, _torch_mlir_version(), parts))
+    return h.hexdigest()
+
+
+# Code in these packages (and in the standard library) is identified by name,
+# since it is covered by the versions in every key.
+_VERSIONED_PACKAGES = frozenset(["builtins", "torch", "torch_mlir"])
+
+# Attributes of classes that do not affect their behavior.
+_CLASS_BOOKKEEPING = frozenset(
+    ["__dict__", "__doc__", "__module__", "__qualname__", "__weakref__", "_abc_impl"]
+)
+
+
+def _is_versioned(module_name: Optional[str]) -> bool:
+    if not module_name:
+        return False
+    package = module_name.partition(".")[0]
+    return package in _VERSIONED_PACKAGES or package in getattr(
+        sys, "stdlib_module_names", ()
+    )
+
+
+def _is_complete_repr(description: str) -> bool:
+    # Default reprs hold the address of the object, and the reprs of large
+    # containers (i.e. ndarrays) elide their elements.
+    return "0x" not in description and "..." not in description
+
+
+class _Indescribable(Exception):
+    pass
+
+
+class _CodeAndStateDescriber:
+    """Builds a deterministic description of objects, following the code that
+    they run and the state that it reads."""
+
+    def __init__(self):
+        # The index of each object with identity that was already described,
+        # to describe shared objects (and cycles) by reference.
+        self._seen: Dict[int, int] = {}
+        # Keeps the described objects alive, so that their ids are not reused.
+        self._alive: List[Any] = []
+        self._active_modules: List[types.ModuleType] = []
+
+    def describe(self, obj: Any, names: FrozenSet[str] = frozenset()) -> Any:
+        # `names` are the names used by the code that refers to `obj`, which
+        # are the attributes that it may read if `obj` is a Python module.
+        if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+            return obj
+        if isinstance(obj, (list, tuple)):
+            return (type(obj).__name__, [self.describe(v, names) for v in obj])
+        if isinstance(obj, (set, frozenset)):
+            return ("set", sorted((self.describe(v, names) for v in obj), key=repr))
+        if isinstance(obj, dict):
+            return (
+                "dict",
+                [(self.describe(k), self.describe(v, names)) for k, v in obj.items()],
+            )
+        if isinstance(obj, types.ModuleType):
+            return self._describe_module(obj, names)
+
+        index = self._seen.get(id(obj))
+        if index is not None:
+            return ("ref", index)
+        self._seen[id(obj)] = len(self._seen)
+        self._alive.append(obj)
+
+        if isinstance(obj, torch.Tensor):
+            if type(obj) not in (torch.Tensor, torch.nn.Parameter):
+                raise _Indescribable(f"tensor subclass {type(obj)}")
+            return ("tensor", obj, obj.requires_grad)
+        if isinstance(obj, types.FunctionType):
+            return self._describe_function(obj)
+        if isinstance(obj, types.MethodType):
+            return ("method", self.describe(obj.__func__), self.describe(obj.__self__))
+        if isinstance(obj, (staticmethod, classmethod)):
+            return (type(obj).__name__, self.describe(obj.__func__))
+        if isinstance(obj, property):
+            return ("property", [self.describe(f) for f in (obj.fget, obj.fset)])
+        if isinstance(obj, functools.partial):
+            return (
+                "partial",
+                self.describe(obj.func),
+                self.describe(obj.args),
+                self.describe(obj.keywords),
+            )
+        if isinstance(obj, types.BuiltinFunctionType):
+            bound = obj.__self__
+            if bound is None or isinstance(bound, types.ModuleType):
+                return ("builtin", obj.__module__, obj.__qualname__)
+            return ("builtin", obj.__qualname__, self.describe(bound))
+        if isinstance(obj, type):
+            return self._describe_class(obj)
+
+        cls = type(obj)
+        if not isinstance(obj, torch.nn.Module) and _is_versioned(cls.__module__):
+            # Operators, dtypes, devices and the like.
+            description = repr(obj)
+            if _is_complete_repr(description):
+                return ("object", cls.__module__, cls.__qualname__, description)
+        if hasattr(obj, "__dict__"):
+            return ("object", self.describe(cls), self.describe(vars(obj)))
+        description = repr(obj)
+        if not _is_complete_repr(description):
+            raise _Indescribable(f"object of type {cls}")
+        return ("object", self.describe(cls), description)
+
+    def _describe_module(self, module: types.ModuleType, names: FrozenSet[str]):
+        if _is_versioned(module.__name__) or module in self._active_modules:
+            return ("module", module.__name__)
+        self._active_modules.append(module)
+        try:
+            attributes = [
+                (name, self.describe(getattr(module, name), names))
+                for name in sorted(names)
+                if hasattr(module, name)
+            ]
+        finally:
+            self._active_modules.pop()
+        return ("module", module.__name__, attributes)
+
+    def _describe_code(self, code: types.CodeType, names: set):
+        names.update(code.co_names)
+        return (
+            code.co_code,
+            code.co_argcount,
+            code.co_kwonlyargcount,
+            code.co_flags,
+            code.co_varnames,
+            code.co_names,
+            [
+                (
+                    self._describe_code(const, names)
+                    if isinstance(const, types.CodeType)
+                    else self.describe(const)
+                )
+                for const in code.co_consts
+            ],
+        )
+
+    def _describe_function(self, func: types.FunctionType):
+        if _is_versioned(func.__module__):
+            return ("function", func.__module__, func.__qualname__)
+        names = set()
+        code = self._describe_code(func.__code__, names)
+        names = frozenset(names)
+        closure = []
+        for cell in func.__closure__ or ():
+            try:
+                closure.append(self.describe(cell.cell_contents, names))
+            except ValueError:
+                # An empty cell.
+                closure.append(("empty",))
+        return (
+            "function",
+            func.__module__,
+            func.__qualname__,
+            code,
+            self.describe(func.__defaults__),
+            self.describe(func.__kwdefaults__),
+            # Used by TorchScript.
+            self.describe(func.__annotations__),
+            closure,
+            # The globals that the code (including nested functions) may read.
+            [
+                (name, self.describe(func.__globals__[name], names))
+                for name in sorted(names)
+                if name in func.__globals__
+            ],
+        )
+
+    def _describe_class(self, cls: type):
+        if _is_versioned(cls.__module__):
+            return ("class", cls.__module__, cls.__qualname__)
+        return (
+            "class",
+            cls.__module__,
+            cls.__qualname__,
+            [self.describe(base) for base in cls.__bases__],
+            [
+                (name, self.describe(value))
+                for name, value in vars(cls).items()
+                if name not in _CLASS_BOOKKEEPING
+            ],
+        )
+
+
+def code_and_state(*objs: Any) -> Optional[Any]:
+    """Returns a description of `objs` for `fingerprint`, or None if one of
+    them depends on an object that cannot be described deterministically.
+
+    Functions, classes and objects (such as `nn.Module`s) are described by
+    their code and state, following the functions and the globals that
+    their code uses, their closures and defaults and the attributes of Python
+    modules that they access. Tensors are described by their contents. Code
+    in torch, torch-mlir and the standard library is described by name, since
+    the versions are part of every key. Lookups by computed names (i.e.
+    `getattr(obj, name)` or `globals()[name]`) are not followed.
+    """
+    describer = _CodeAndStateDescriber()
+    try:
+        return (
+            platform.python_version(),
+            [describer.describe(obj) for obj in objs],
+        )
+    except (_Indescribable, RecursionError):
+        return None
+
+
+class CompileCache:
+    """A directory of compiled modules, keyed by `fingerprint`.
+
+    The directory is bounded to `max_bytes` by evicting the least recently
+    used (read or written) entries after each write. The entry just written is
+    never evicted.
+    """
+
+    def __init__(self, directory: str, *, max_bytes: int = 4 << 30):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _ENTRY_SUFFIX)
+
+    def get(
+        self, key: str, context: Optional[ir.Context] = None
+    ) -> Optional[ir.Module]:
+        """Loads the module for `key` into `context`, or returns None."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # Mark as recently used.
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        if context is None:
+            context = ir.Context()
+            torch_d.register_dialect(context)
+        try:
+            module = ir.Module.parse(data, context)
+        except ir.MLIRError:
+            # A corrupt entry (i.e. from an incompatible build) is a miss.
+            self._remove(path)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return module
+
+    def put(self, key: str, module: ir.Module):
+        """Stores `module` as the entry for `key`."""
+        fd, temp_path = tempfile.mkstemp(
+            prefix=f".{key}.", suffix=".tmp", dir=self.directory
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                module.operation.write_bytecode(f)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            self._remove(temp_path)
+            raise
+        self._evict(keep=self._path(key))
+
+    def _entries(self) -> List[os.DirEntry]:
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(_ENTRY_SUFFIX):
+                    entries.append(entry)
+        return entries
+
+    def _evict(self, keep: str):
+        sized = []
+        for entry in self._entries():
+            if entry.path == keep:
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # Concurrently evicted.
+                continue
+            sized.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        try:
+            total = os.stat(keep).st_size
+        except FileNotFoundError:
+            total = 0
+        total += sum(size for _, size, _ in sized)
+        for _, size, path in sorted(sized):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
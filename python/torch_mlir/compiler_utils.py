@@ -2,15 +2,18 @@
 # See https://llvm.org/LICENSE.txt for license information.
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 # Also available under a BSD-style license. See LICENSE.
+import contextlib
 from enum import Enum
-from io import StringIO
+import json
 import os
-import sys
 import tempfile
-from typing import Union
+import time
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Union
 
 from torch_mlir.passmanager import PassManager
-from torch_mlir.ir import StringAttr
+from torch_mlir.ir import Context, Diagnostic, DiagnosticSeverity, StringAttr
+from torch_mlir._mlir_libs._torchMlir import add_pass_report
+from torch_mlir.context_pool import pass_manager_cache
 
 
 def get_module_name_for_debug_dump(module):
@@ -27,54 +30,208 @@ class TorchMlirCompilerError(Exception):
     pass
 
 
+def _format_diagnostic(diagnostic: Diagnostic, indent: str = "") -> str:
+    lines = [
+        f"{indent}{diagnostic.location}: {diagnostic.severity.name.lower()}: "
+        f"{diagnostic.message}"
+    ]
+    for note in diagnostic.notes:
+        lines.append(_format_diagnostic(note, indent + "  "))
+    return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def capture_diagnostics(context: Context) -> Iterator[List[str]]:
+    """Collects the diagnostics emitted on `context`.
+
+    Yields the list that the formatted diagnostics are appended to. Errors are
+    only collected, while other diagnostics are also printed as usual. Unlike
+    redirecting `sys.stderr`, this only captures the diagnostics of `context`,
+    so it is safe with concurrent compilations on other threads.
+    """
+    diagnostics = []
+
+    def handler(diagnostic: Diagnostic) -> bool:
+        diagnostics.append(_format_diagnostic(diagnostic))
+        return diagnostic.severity == DiagnosticSeverity.ERROR
+
+    diagnostic_handler = context.attach_diagnostic_handler(handler)
+    try:
+        yield diagnostics
+    finally:
+        diagnostic_handler.detach()
+
+
+class PassReport:
+    """Per-pass timing and statistics of the pipelines run by a compilation.
+
+    Pass an instance as `pass_report` to the compile APIs (or to
+    `run_pipeline_with_repro_report`) to record one stage per pipeline run.
+    Unlike IR printing, this does not disable multithreading. Times are wall
+    times, inclusive of nested passes (including the dynamic pipelines run by
+    passes such as LowerToBackendContract) and summed over threads. Pass
+    statistics are only counted if LLVM was built with statistics enabled.
+    """
+
+    def __init__(self, *, timing: bool = True, pass_statistics: bool = True):
+        self.timing = timing
+        self.pass_statistics = pass_statistics
+        self.stages: List[Dict[str, Any]] = []
+
+    def add_stage(self, description: str, pipeline: str, seconds: float, collector):
+        self.stages.append(
+            {
+                "description": description,
+                "pipeline": pipeline,
+                "seconds": seconds,
+                "passes": json.loads(collector.to_json())["passes"],
+            }
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"stages": self.stages}
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.as_dict(), indent=indent)
+
+    def format_table(self, limit: Optional[int] = 25) -> str:
+        """Formats each stage as a table of its `limit` slowest passes."""
+        lines = []
+        for stage in self.stages:
+            lines.append(f"{stage['description']}: {stage['seconds'] * 1e3:.3f} ms")
+            lines.append(f"  {'pass':<56} {'count':>8} {'ms':>10}")
+            passes = sorted(
+                stage["passes"], key=lambda p: p.get("seconds", 0.0), reverse=True
+            )
+            shown = passes if limit is None else passes[:limit]
+            for p in shown:
+                lines.append(
+                    f"  {p['pass']:<56} {p['count']:>8} "
+                    f"{p.get('seconds', 0.0) * 1e3:>10.3f}"
+                )
+                for name, value in p.get("statistics", {}).items():
+                    lines.append(f"    {name}: {value}")
+            if len(shown) < len(passes):
+                lines.append(f"  ... ({len(passes) - len(shown)} more passes)")
+        return "\n".join(lines)
+
+
+# Supported values of the `repro_mode` option of run_pipeline_with_repro_report.
+REPRO_MODES = ("eager", "lazy", "off")
+
+
+def _get_repro_asm(operation) -> str:
+    return operation.get_asm(large_elements_limit=10, enable_debug_info=True)
+
+
 def run_pipeline_with_repro_report(
-    module, pipeline: str, description: str, enable_ir_printing: bool = False
+    module,
+    pipeline: str,
+    description: str,
+    enable_ir_printing: bool = False,
+    repro_mode: str = "lazy",
+    pass_report: Optional[PassReport] = None,
 ):
-    """Runs `pipeline` on `module`, with a nice repro report if it fails."""
-    module_name = get_module_name_for_debug_dump(module)
-    original_stderr = sys.stderr
-    try:
-        sys.stderr = StringIO()
-        asm_for_error_report = module.operation.get_asm(
-            large_elements_limit=10, enable_debug_info=True
+    """Runs `pipeline` on `module`, with a nice repro report if it fails.
+
+    `repro_mode` controls how the input of the pipeline is captured for the
+    report:
+      * "lazy" (the default): the module is cloned before the pipeline runs and
+        the clone is only printed if it fails. Attributes (and therefore
+        large resources) are shared with the original, so this is much
+        cheaper than printing.
+      * "eager": the module is printed before the pipeline runs.
+      * "off": the module is not captured and the report has no reproducer.
+
+    If `pass_report` is given, the timing and statistics of the pipeline's
+    passes are added to it as a stage.
+
+    For modules in a pooled context (see `ContextPool`), the parsed pipeline
+    is cached with the context and reused by later runs, unless it has to be
+    instrumented for IR printing or a pass report.
+    """
+    if repro_mode not in REPRO_MODES:
+        raise ValueError(
+            f"Unknown repro_mode '{repro_mode}' (expected one of "
+            f"{', '.join(REPRO_MODES)})"
         )
-        # Lower module in place to make it ready for compiler backends.
-        with module.context as ctx:
-            pm = PassManager.parse(pipeline)
-            if enable_ir_printing:
-                ctx.enable_multithreading(False)
-                pm.enable_ir_printing()
-            pm.run(module.operation)
-    except Exception as e:
-        # TODO: More robust.
-        # - don't arbitrarily clutter up /tmp. When a test suite has many
-        #   tests, this can be a big disk cost (also, /tmp/ is frequently a
-        #   RAM fs, which increases worries about capacity).
-        # - don't have colliding filenames (hard to do without cluttering
-        #   up /tmp)
-        # - if we do have have colliding filenames, writes should at least
-        #   avoid being racy.
-        filename = os.path.join(tempfile.gettempdir(), module_name + ".mlir")
-        with open(filename, "w") as f:
-            f.write(asm_for_error_report)
-        debug_options = "-mlir-print-ir-after-all -mlir-disable-threading"
-        # Put something descriptive here even if description is empty.
-        description = description or f"{module_name} compile"
-
-        message = f"""\
-            {description} failed with the following diagnostics:
-            {sys.stderr.getvalue()}
-
-            python exception: {e}
-
-            For Torch-MLIR developers, the error can be reproduced with:
-            $ torch-mlir-opt -pass-pipeline='{pipeline}' {filename}
-            Add '{debug_options}' to get the IR dump for debugging purpose.
-            """
-        trimmed_message = "\n".join([m.lstrip() for m in message.split("\n")])
-        raise TorchMlirCompilerError(trimmed_message) from None
-    finally:
-        sys.stderr = original_stderr
+    module_name = get_module_name_for_debug_dump(module)
+    asm_for_error_report = None
+    repro_snapshot = None
+    collector = None
+    with capture_diagnostics(module.context) as diagnostics:
+        try:
+            if repro_mode == "eager":
+                asm_for_error_report = _get_repro_asm(module.operation)
+            elif repro_mode == "lazy":
+                repro_snapshot = module.operation.clone().operation
+            # Lower module in place to make it ready for compiler backends.
+            with module.context as ctx:
+                cache = None
+                if not enable_ir_printing and pass_report is None:
+                    cache = pass_manager_cache(ctx)
+                pm = cache.get(pipeline) if cache is not None else None
+                if pm is None:
+                    pm = PassManager.parse(pipeline)
+                    if cache is not None:
+                        cache[pipeline] = pm
+                if enable_ir_printing:
+                    ctx.enable_multithreading(False)
+                    pm.enable_ir_printing()
+                if pass_report is not None:
+                    collector = add_pass_report(
+                        pm,
+                        timing=pass_report.timing,
+                        statistics=pass_report.pass_statistics,
+                    )
+                    start = time.perf_counter()
+                pm.run(module.operation)
+                if collector is not None:
+                    pass_report.add_stage(
+                        description, pipeline, time.perf_counter() - start, collector
+                    )
+        except Exception as e:
+            # Put something descriptive here even if description is empty.
+            description = description or f"{module_name} compile"
+            diagnostics_text = "\n".join(diagnostics)
+            if repro_snapshot is not None:
+                asm_for_error_report = _get_repro_asm(repro_snapshot)
+            if asm_for_error_report is None:
+                repro_message = (
+                    "No reproducer was captured (repro_mode='off'). Rerun with "
+                    "repro_mode='lazy' to get one."
+                )
+            else:
+                # TODO: More robust.
+                # - don't arbitrarily clutter up /tmp. When a test suite has many
+                #   tests, this can be a big disk cost (also, /tmp/ is frequently a
+                #   RAM fs, which increases worries about capacity).
+                # - don't have colliding filenames (hard to do without cluttering
+                #   up /tmp)
+                # - if we do have have colliding filenames, writes should at least
+                #   avoid being racy.
+                filename = os.path.join(tempfile.gettempdir(), module_name + ".mlir")
+                with open(filename, "w") as f:
+                    f.write(asm_for_error_report)
+                debug_options = "-mlir-print-ir-after-all -mlir-disable-threading"
+                repro_message = f"""\
+                    For Torch-MLIR developers, the error can be reproduced with:
+                    $ torch-mlir-opt -pass-pipeline='{pipeline}' {filename}
+                    Add '{debug_options}' to get the IR dump for debugging purpose."""
+
+            message = f"""\
+                {description} failed with the following diagnostics:
+                {diagnostics_text}
+
+                python exception: {e}
+
+                {repro_message}
+                """
+            trimmed_message = "\n".join([m.lstrip() for m in message.split("\n")])
+            raise TorchMlirCompilerError(trimmed_message) from None
+        finally:
+            if repro_snapshot is not None:
+                repro_snapshot.erase()
 
 
 class OutputType(Enum):
@@ -126,48 +283,79 @@ class OutputType(Enum):
         return OutputType[spec]
 
 
-def lower_mlir_module(verbose, output_type, module):
+# For each backend output type: the pipeline lowering Torch backend IR to it,
+# the name of the backend IR (for diagnostics) and the heading under which the
+# backend IR is printed.
+BACKEND_PIPELINES = {
+    OutputType.TOSA: (
+        "torch-backend-to-tosa-backend-pipeline",
+        "TOSA Backend IR",
+        "TOSA Backend IR",
+    ),
+    OutputType.LINALG_ON_TENSORS: (
+        "torch-backend-to-linalg-on-tensors-backend-pipeline",
+        "Linalg-on-Tensors Backend IR",
+        "LINALG Backend IR",
+    ),
+    OutputType.STABLEHLO: (
+        "torch-backend-to-stablehlo-backend-pipeline",
+        "StableHLO Backend IR",
+        "StableHLO Backend IR",
+    ),
+}
+
+
+# A path, or a binary stream, to write a module to.
+OutputFile = Union[str, os.PathLike, BinaryIO]
+
+
+def write_bytecode(module, output_file: OutputFile):
+    """Writes `module` as MLIR bytecode to `output_file`.
+
+    The bytecode (including resource blobs such as weights) is streamed to the
+    file in chunks, so unlike printing the module, memory use does not grow
+    with its size.
+    """
+    if isinstance(output_file, (str, os.PathLike)):
+        with open(output_file, "wb") as f:
+            module.operation.write_bytecode(f)
+    else:
+        module.operation.write_bytecode(output_file)
+
+
+def lower_mlir_module(
+    verbose,
+    output_type,
+    module,
+    repro_mode: str = "lazy",
+    pass_report: Optional[PassReport] = None,
+    output_file: Optional[OutputFile] = None,
+):
+    """Lowers a module in the torch backend contract to `output_type`.
+
+    If `output_file` is given, the lowered module is also written to it as
+    bytecode (see `write_bytecode`).
+    """
     if verbose:
         print("\n====================")
         print("Torch Backend IR")
         print(module)
 
-    if output_type == OutputType.TORCH:
-        return module
-
-    if output_type == OutputType.TOSA:
-        run_pipeline_with_repro_report(
-            module,
-            "builtin.module(torch-backend-to-tosa-backend-pipeline)",
-            "Lowering Torch Backend IR -> TOSA Backend IR",
-        )
-        if verbose:
-            print("\n====================")
-            print("TOSA Backend IR")
-            print(module)
-        return module
-
-    if output_type == OutputType.LINALG_ON_TENSORS:
-        run_pipeline_with_repro_report(
-            module,
-            "builtin.module(torch-backend-to-linalg-on-tensors-backend-pipeline)",
-            "Lowering Torch Backend IR -> Linalg-on-Tensors Backend IR",
-        )
-        if verbose:
-            print("\n====================")
-            print("LINALG Backend IR")
-            print(module)
-        return module
-
-    elif output_type == OutputType.STABLEHLO:
+    if output_type != OutputType.TORCH:
+        if output_type not in BACKEND_PIPELINES:
+            raise Exception(f"Unknown OutputType: {output_type}")
+        pipeline, backend_ir_name, heading = BACKEND_PIPELINES[output_type]
         run_pipeline_with_repro_report(
             module,
-            "builtin.module(torch-backend-to-stablehlo-backend-pipeline)",
-            "Lowering Torch Backend IR -> StableHLO Backend IR",
+            f"builtin.module({pipeline})",
+            f"Lowering Torch Backend IR -> {backend_ir_name}",
+            repro_mode=repro_mode,
+            pass_report=pass_report,
         )
         if verbose:
             print("\n====================")
-            print("StableHLO Backend IR")
+            print(heading)
             print(module)
-        return module
-    raise Exception(f"Unknown OutputType: {output_type}")
+    if output_file is not None:
+        write_bytecode(module, output_file)
+    return module
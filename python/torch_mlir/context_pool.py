@@ -0,0 +1,185 @@
+# Part of the LLVM Project, under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+# Also available under a BSD-style license. See LICENSE.
+
+"""Reusable MLIR contexts with the torch dialect registered.
+
+Creating a context and loading its dialects costs far more than importing a
+small graph. A `ContextPool` amortizes that over many imports, either by
+giving each thread its own context (`thread_context`) or by handing out
+contexts exclusively (`checkout`).
+
+A context is never destroyed by the pool: it is freed once the pool and every
+module created in it have been released. A context that is `release`d while
+modules created in it are still alive is only handed out again once those
+modules are gone, so that modules never alias the context of the next owner. Since attributes and types are never
+freed while a context is alive, each context is retired after `max_uses`
+checkouts, which bounds the growth of long-running processes.
+
+Pooled contexts also cache the pass managers parsed for them (see
+`pass_manager_cache`), so that repeated compiles skip pipeline parsing and
+pass construction.
+"""
+
+import contextlib
+import threading
+import weakref
+from typing import Dict, Iterator, List, Optional
+
+from torch_mlir import ir
+from torch_mlir.dialects import torch as torch_d
+from torch_mlir.passmanager import PassManager
+
+__all__ = [
+    "ContextPool",
+    "pass_manager_cache",
+]
+
+
+class _PooledContext:
+    # The pass managers are declared (and so released) before the context
+    # that they belong to.
+    __slots__ = ["pass_managers", "context", "uses", "__weakref__"]
+
+    def __init__(self, context: ir.Context):
+        self.pass_managers: Dict[str, PassManager] = {}
+        self.context = context
+        self.uses = 0
+
+
+# Live pooled contexts, by id of their context.
+_pooled_contexts: "weakref.WeakValueDictionary[int, _PooledContext]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def pass_manager_cache(context: ir.Context) -> Optional[Dict[str, PassManager]]:
+    """Returns the pass managers cached for `context`, by pipeline.
+
+    Only contexts from a `ContextPool` have a cache (for other contexts, None
+    is returned): its lifetime is bound to the pool's use of the context, so
+    that cached pass managers never outlive it. Pass managers with
+    instrumentation (such as IR printing) must not be cached, since
+    instrumentation cannot be removed.
+    """
+    pooled = _pooled_contexts.get(id(context))
+    if pooled is None or pooled.context is not context:
+        return None
+    return pooled.pass_managers
+
+
+def _has_live_modules(context: ir.Context) -> bool:
+    return context._get_live_module_count() > 0
+
+
+class ContextPool:
+    """A pool of contexts with the torch dialect registered.
+
+    Args:
+      max_size: Maximum number of released contexts retained for `checkout`.
+      max_uses: Number of checkouts after which a context is retired, or None
+        to reuse contexts indefinitely.
+      enable_multithreading: Whether pass managers run on pooled contexts may
+        use multiple threads. This is re-applied on every checkout, since
+        running a pipeline with IR printing disables multithreading.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 8,
+        max_uses: Optional[int] = 64,
+        enable_multithreading: bool = True,
+    ):
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.enable_multithreading = enable_multithreading
+        self.created = 0
+        self._lock = threading.Lock()
+        self._idle: List[_PooledContext] = []
+        # Released contexts that still have live modules.
+        self._parked: List[_PooledContext] = []
+        # Contexts that are checked out, by id.
+        self._acquired: Dict[int, _PooledContext] = {}
+        self._local = threading.local()
+
+    def _create(self) -> _PooledContext:
+        context = ir.Context()
+        torch_d.register_dialect(context)
+        pooled = _PooledContext(context)
+        with self._lock:
+            self.created += 1
+            _pooled_contexts[id(context)] = pooled
+        return pooled
+
+    def _use(self, pooled: _PooledContext) -> ir.Context:
+        pooled.uses += 1
+        pooled.context.enable_multithreading(self.enable_multithreading)
+        return pooled.context
+
+    def _retired(self, pooled: _PooledContext) -> bool:
+        return self.max_uses is not None and pooled.uses >= self.max_uses
+
+    def thread_context(self) -> ir.Context:
+        """Returns the context of the calling thread.
+
+        Every call counts as a use. The returned context must only be used
+        from the calling thread.
+        """
+        pooled = getattr(self._local, "pooled", None)
+        if pooled is None or self._retired(pooled):
+            pooled = self._create()
+            self._local.pooled = pooled
+        return self._use(pooled)
+
+    def _unpark(self):
+        # Called with the lock held.
+        parked = []
+        for pooled in self._parked:
+            if _has_live_modules(pooled.context):
+                parked.append(pooled)
+            else:
+                self._idle.append(pooled)
+        self._parked = parked
+
+    def acquire(self) -> ir.Context:
+        """Takes exclusive ownership of a context until it is `release`d."""
+        with self._lock:
+            if self._parked:
+                self._unpark()
+            pooled = self._idle.pop() if self._idle else None
+        if pooled is None:
+            pooled = self._create()
+        context = self._use(pooled)
+        with self._lock:
+            self._acquired[id(context)] = pooled
+        return context
+
+    def release(self, context: ir.Context):
+        """Returns a context obtained from `acquire` to the pool.
+
+        Modules created in the context remain valid. The context is not
+        handed out again while any of them is alive.
+        """
+        with self._lock:
+            pooled = self._acquired.pop(id(context), None)
+            if pooled is None:
+                raise ValueError("Context was not acquired from this pool")
+            if self._retired(pooled):
+                return
+            if len(self._idle) + len(self._parked) >= self.max_size:
+                return
+            if _has_live_modules(context):
+                self._parked.append(pooled)
+            else:
+                self._idle.append(pooled)
+
+    @contextlib.contextmanager
+    def checkout(self) -> Iterator[ir.Context]:
+        """Acquires a context for the duration of a `with` block."""
+        context = self.acquire()
+        try:
+            yield context
+        finally:
+            self.release(context)
@@ -4,4 +4,8 @@
 # Also available under a BSD-style license. See LICENSE.
 
 from .._torch_ops_gen import *
-from ..._mlir_libs._torchMlir import register_dialect
+from ..._mlir_libs._torchMlir import (
+    register_dialect,
+    get_value_tensor_type,
+    get_non_value_tensor_type,
+)
@@ -0,0 +1,318 @@
+# Part of the LLVM Project, under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+# Also available under a BSD-style license. See LICENSE.
+
+"""Imports parameters as references into an on-disk weight archive.
+
+By default, the FxImporter inlines every parameter, buffer and captured
+tensor as a dense resource in the module, which makes the module as large
+as the model. `ExternalParametersHooks` instead streams each such tensor into
+an archive file as it is imported and emits a `torch.vtensor.literal` of a
+`dense_resource<key>` handle with no attached blob. Such a module prints (and
+serializes) without its weights.
+
+The archive uses the safetensors layout: an 8 byte little-endian header size,
+a JSON header mapping each key to its dtype, shape and data offsets, and then
+the data section. With the default `alignment` of 1, the file is a valid
+safetensors file. With a larger alignment, each entry is padded so that it can
+be mapped without copies, which the strict safetensors readers reject as
+"holes" (but `load_external_parameters` accepts).
+
+Weights are loaded back zero-copy through `mmap`, either as numpy arrays
+(`load_external_parameters`) or by attaching them to the dense resource
+handles of an imported module (`attach_external_parameters`). Several
+compile jobs can therefore share one weight file.
+"""
+
+import json
+import os
+import re
+import shutil
+import struct
+import tempfile
+import weakref
+from typing import Any, Dict, Optional
+
+import numpy as np
+import torch
+
+from .fx_importer import (
+    FxImporterHooks,
+    GraphNodeImporter,
+    InputInfo,
+    RefTracker,
+    TORCH_DTYPE_TO_NPY_TYPE,
+    create_mlir_tensor_type,
+    _tensor_to_ndarray,
+)
+
+from ..ir import (
+    Attribute,
+    DenseResourceElementsAttr,
+    Module,
+    Operation,
+    StringAttr,
+    Value,
+)
+
+__all__ = [
+    "ExternalParametersHooks",
+    "attach_external_parameters",
+    "load_external_parameters",
+]
+
+# Name of the module attribute recording the archive that the module's dense
+# resource handles refer to.
+ARCHIVE_ATTR_NAME = "torch.external_parameter_archive"
+
+TORCH_DTYPE_TO_SAFETENSORS_DTYPE = {
+    torch.float64: "F64",
+    torch.float32: "F32",
+    torch.float16: "F16",
+    torch.bfloat16: "BF16",
+    torch.int64: "I64",
+    torch.int32: "I32",
+    torch.int16: "I16",
+    torch.int8: "I8",
+    torch.uint8: "U8",
+    torch.bool: "BOOL",
+}
+
+SAFETENSORS_DTYPE_TO_NPY_TYPE = {
+    st_dtype: TORCH_DTYPE_TO_NPY_TYPE[torch_dtype]
+    for torch_dtype, st_dtype in TORCH_DTYPE_TO_SAFETENSORS_DTYPE.items()
+    if torch_dtype in TORCH_DTYPE_TO_NPY_TYPE
+}
+
+_RESOURCE_KEY_RE = re.compile(r"dense_resource<([^>]+)>")
+
+
+def _sanitize_key(name: str) -> str:
+    # Resource keys are printed as bare identifiers.
+    key = re.sub(r"[^A-Za-z0-9_$.]", "_", name)
+    if not key or not (key[0].isalpha() or key[0] == "_"):
+        key = f"_{key}"
+    return key
+
+
+def _remove_spill(spill, spill_path: str):
+    spill.close()
+    try:
+        os.remove(spill_path)
+    except FileNotFoundError:
+        pass
+
+
+class ExternalParametersHooks(FxImporterHooks):
+    """FxImporterHooks that externalize tensors to an on-disk archive.
+
+    Parameters and buffers (via `resolve_input`, as used by `import_program`)
+    and tensor literals (via `resolve_literal`, as used by
+    `import_frozen_program`) of at least `min_bytes` are written to `path` and
+    referenced from the IR by key. Single element tensors are always left
+    inline, as they are more optimizable as splats.
+
+    The archive is only complete once `close()` has been called. Used as a
+    context manager, the hooks are closed on exit, or discarded (without
+    writing the archive) if an exception is raised. The temporary data file
+    is removed in any case, at the latest when the hooks are garbage
+    collected.
+    """
+
+    def __init__(self, path: str, *, alignment: int = 1, min_bytes: int = 0):
+        if alignment < 1:
+            raise ValueError(f"Archive alignment must be positive: {alignment}")
+        self.path = path
+        self.alignment = alignment
+        self.min_bytes = min_bytes
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._tracker = RefTracker()
+        self._data_size = 0
+        # The header size is only known once all entries are written, so the
+        # data section is spilled next to the archive and appended on close.
+        fd, self._spill_path = tempfile.mkstemp(
+            prefix=os.path.basename(path) + ".",
+            suffix=".data",
+            dir=os.path.dirname(os.path.abspath(path)),
+        )
+        self._spill = os.fdopen(fd, "wb")
+        # Removes the spill file if the hooks are neither closed nor discarded
+        # (e.g. because the import raised).
+        self._remove_spill = weakref.finalize(
+            self, _remove_spill, self._spill, self._spill_path
+        )
+
+    def __enter__(self) -> "ExternalParametersHooks":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def prepare_module(self, module_op: Operation):
+        module_op.attributes[ARCHIVE_ATTR_NAME] = StringAttr.get(
+            os.path.abspath(self.path), context=module_op.context
+        )
+
+    def resolve_input(
+        self, gni: GraphNodeImporter, value: Any, info: InputInfo
+    ) -> Optional[Value]:
+        # Mutable inputs require a !torch.tensor, which cannot be a literal.
+        if info.mutable_producer_node_name is not None:
+            return None
+        return self._externalize(gni, value, info.input_spec.target)
+
+    def resolve_literal(self, gni: GraphNodeImporter, literal: Any) -> Optional[Value]:
+        return self._externalize(gni, literal, None)
+
+    def close(self):
+        """Finalizes the archive. No further tensors can be externalized."""
+        if self._spill is None:
+            return
+        self._spill.close()
+        self._spill = None
+        try:
+            self._write_archive()
+        finally:
+            self._remove_spill()
+
+    def discard(self):
+        """Removes the partially written data without writing the archive."""
+        self._spill = None
+        self._remove_spill()
+
+    def _write_archive(self):
+        header = json.dumps(
+            {"__metadata__": {"format": "pt"}, **self._index},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        # Pad the header with spaces (as permitted by the format) so that the
+        # data section starts at an aligned offset.
+        data_alignment = max(self.alignment, 8)
+        padding = -(8 + len(header)) % data_alignment
+        header += b" " * padding
+        with open(self.path, "wb") as f:
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            with open(self._spill_path, "rb") as spill:
+                shutil.copyfileobj(spill, f, 16 * 1024 * 1024)
+
+    @property
+    def num_bytes(self) -> int:
+        """Size of the data section written so far."""
+        return self._data_size
+
+    def _externalize(
+        self, gni: GraphNodeImporter, value: Any, name: Optional[str]
+    ) -> Optional[Value]:
+        if not isinstance(value, torch.Tensor):
+            return None
+        st_dtype = TORCH_DTYPE_TO_SAFETENSORS_DTYPE.get(value.dtype)
+        npy_dtype = TORCH_DTYPE_TO_NPY_TYPE.get(value.dtype)
+        if st_dtype is None or npy_dtype is None:
+            return None
+        if value.numel() <= 1 or value.numel() * value.element_size() < self.min_bytes:
+            return None
+
+        mapping = self._tracker.track(value)
+        if mapping.is_empty:
+            if self._spill is None:
+                raise RuntimeError(
+                    "Cannot externalize a tensor after the archive was closed"
+                )
+            if name is None:
+                name = f"constant_{len(self._index)}"
+            key = _sanitize_key(name)
+            # Parsing the handle declares a (blob-less) resource. If the key is
+            # already in use in the context, it is renamed, so we adopt the key
+            # that was actually declared.
+            tensor_type = create_mlir_tensor_type(value)
+            attr = Attribute.parse(
+                f"dense_resource<{key}> : {tensor_type}", context=gni._c
+            )
+            key = _RESOURCE_KEY_RE.search(str(attr)).group(1)
+            self._write_entry(key, st_dtype, value, npy_dtype)
+            mapping.value = attr
+        return Operation.create(
+            name="torch.vtensor.literal",
+            results=[gni._cc.tensor_to_vtensor_type(value)],
+            attributes={"value": mapping.value},
+        ).result
+
+    def _write_entry(self, key: str, st_dtype: str, tensor: torch.Tensor, npy_dtype):
+        array = _tensor_to_ndarray(tensor, npy_dtype)
+        padding = -self._data_size % self.alignment
+        if padding:
+            self._spill.write(b"\0" * padding)
+            self._data_size += padding
+        begin = self._data_size
+        self._spill.write(array.reshape(-1).view(np.uint8))
+        self._data_size += array.nbytes
+        self._index[key] = {
+            "dtype": st_dtype,
+            "shape": list(tensor.shape),
+            "data_offsets": [begin, self._data_size],
+        }
+
+
+def load_external_parameters(path: str) -> Dict[str, np.ndarray]:
+    """Maps an archive, returning read-only arrays that alias the file."""
+    with open(path, "rb") as f:
+        (header_size,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_size))
+    data_start = 8 + header_size
+    mapped = np.memmap(path, dtype=np.uint8, mode="r")
+    arrays: Dict[str, np.ndarray] = {}
+    for key, entry in header.items():
+        if key == "__metadata__":
+            continue
+        npy_dtype = SAFETENSORS_DTYPE_TO_NPY_TYPE.get(entry["dtype"])
+        if npy_dtype is None:
+            raise ValueError(f"Unsupported archive dtype {entry['dtype']} for {key}")
+        begin, end = entry["data_offsets"]
+        raw = mapped[data_start + begin : data_start + end]
+        arrays[key] = raw.view(npy_dtype).reshape(entry["shape"])
+    return arrays
+
+
+def attach_external_parameters(module: Module, path: Optional[str] = None) -> int:
+    """Attaches archive data to the blob-less dense resources of a module.
+
+    If `path` is not given, the archive recorded on the module by
+    `ExternalParametersHooks` is used. The data is not copied: the attached
+    resources borrow the mapped file. Returns the number of resources attached.
+    """
+    module_op = module.operation
+    if path is None:
+        path = StringAttr(module_op.attributes[ARCHIVE_ATTR_NAME]).value
+    arrays = load_external_parameters(path)
+    attached = 0
+
+    def visit(op):
+        nonlocal attached
+        for region in op.regions:
+            for block in region.blocks:
+                for child in block.operations:
+                    visit(child.operation)
+        if op.name != "torch.vtensor.literal":
+            return
+        attr = op.attributes["value"]
+        m = _RESOURCE_KEY_RE.match(str(attr))
+        if m is None or m.group(1) not in arrays:
+            return
+        key = m.group(1)
+        # The resource borrows the buffer and requires it to be aligned to
+        # its element size. Only unaligned (i.e. packed safetensors) entries
+        # are copied.
+        array = np.require(arrays[key], requirements=["ALIGNED"])
+        op.attributes["value"] = DenseResourceElementsAttr.get_from_buffer(
+            array, key, attr.type, alignment=array.itemsize
+        )
+        attached += 1
+
+    with module.context:
+        visit(module_op)
+    return attached
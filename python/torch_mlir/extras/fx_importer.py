@@ -11,9 +11,13 @@ except ImportError:
     # python less than 3.10 doesn't have NoneType
     NoneType = type(None)
 
+import contextlib
+import hashlib
+import json
 import logging
 import operator
 import re
+import time
 from dataclasses import dataclass
 from types import BuiltinMethodType, BuiltinFunctionType
 from typing import (
@@ -28,8 +32,10 @@ from typing import (
     TYPE_CHECKING,
     Union,
     Iterable,
+    Mapping,
 )
 import weakref
+from collections import OrderedDict
 
 import numpy as np
 
@@ -80,6 +86,8 @@ from torch.fx.node import (
     Argument as NodeArgument,
 )
 
+from torch.utils._mode_utils import no_dispatch
+
 from ..ir import (
     Attribute,
     Block,
@@ -108,6 +116,7 @@ from ..ir import (
 
 from ..dialects import (
     func as func_dialect,
+    torch as torch_d,
 )
 
 __all__ = [
@@ -257,6 +266,12 @@ else:
     SYMBOLIC_TORCH_OPS = {key for key in SYMBOLIC_OP_TO_TORCH_OP}
 
 
+# Supported values of the `location_mode` option of the FxImporter.
+LOCATION_MODES = ("full", "first_frame", "none")
+
+_STACK_FRAME_RE = re.compile(r"""File "([^"]+)", line ([0-9]+),""")
+
+
 @dataclass(frozen=True)
 class SparsityMeta:
     """
@@ -338,6 +353,12 @@ def is_symbolic(obj: Any) -> bool:
     return isinstance(obj, (torch.SymInt, torch.SymFloat, torch.SymBool))
 
 
+def _raise_unimplemented_call_function(node: Node):
+    raise NotImplementedError(
+        f"FIX ME: Unimplemented call_function: target={node.target}, {node.meta}"
+    )
+
+
 def is_builtin_function_or_method(obj: Any) -> bool:
     return isinstance(obj, (BuiltinMethodType, BuiltinFunctionType))
 
@@ -415,6 +436,32 @@ class FxImporter:
       be one reference tracker per import, but this can be injected to share
       the same uniqueing across imports (i.e. if building multiple functions
       into the same context or module).
+    * deduplicate_literals: If True, tensor literals are additionally uniqued
+      by content: distinct tensors with byte-identical payloads (i.e. cloned
+      tied weights, zero/one buffers) share a single dense resource across
+      every function imported into the module. This requires hashing every
+      literal payload and is therefore opt-in. The number of bytes saved is
+      available as `deduplicated_literal_bytes`.
+    * unique_literals: If True (the default), scalar and constant list
+      literals (i.e. `dim=1`, `False`, `None`, `[0, 1]`) are materialized once
+      per function and hoisted to the top of its entry block rather than
+      emitted at every use. `literal_op_counts` reports how many literal ops
+      were requested vs emitted.
+    * location_mode: How source locations are derived from each node's stack
+      trace. "first_frame" (the default) uses the first frame of the trace,
+      "full" emits a call-site location for the whole trace and "none" skips
+      location extraction entirely (all ops get an unknown location).
+    * collect_stats: If True, the importer records where import time goes
+      (node counts and cumulative time per call target, literal bytes
+      materialized and cache hit rates) in an `ImportStats` available as
+      `stats`. This adds a timer read per node and is therefore opt-in.
+
+    Tensor literals are not copied: the dense resource of a contiguous CPU
+    tensor borrows the tensor's storage, so that large weights are not held
+    twice. The imported module therefore aliases those tensors, and updating
+    them in place after import also changes the module's constants. Clone
+    the tensors first (or print or serialize the module before updating
+    them) if the module must keep the values at import time.
     """
 
     __slots__ = [
@@ -423,7 +470,13 @@ class FxImporter:
         "_m",
         "_m_ip",
         "_py_attr_tracker",
+        "_content_tracker",
         "_hooks",
+        "_shared_tensors",
+        "_literal_op_counts",
+        "_op_dispatch_records",
+        "_stats",
+        "_unique_literals",
         "symbol_table",
     ]
 
@@ -435,6 +488,10 @@ class FxImporter:
         config_check: bool = True,
         py_attr_tracker: Optional["RefTracker"] = None,
         hooks: Optional[FxImporterHooks] = None,
+        deduplicate_literals: bool = False,
+        unique_literals: bool = True,
+        location_mode: str = "first_frame",
+        collect_stats: bool = False,
     ):
         if module is not None:
             assert context is None, "If configuring with a Module, context must be None"
@@ -447,12 +504,39 @@ class FxImporter:
             # Production code can disable this for a bit of a boost.
             self._config_check()
         self._py_attr_tracker = py_attr_tracker or RefTracker()
-        self._cc = ContextCache(self._c, py_attr_tracker=self._py_attr_tracker)
+        self._content_tracker = ContentTracker() if deduplicate_literals else None
+        self._literal_op_counts = {"requested": 0, "emitted": 0}
+        self._stats = (
+            ImportStats(literal_op_counts=self._literal_op_counts)
+            if collect_stats
+            else None
+        )
+        self._cc = ContextCache(
+            self._c,
+            py_attr_tracker=self._py_attr_tracker,
+            content_tracker=self._content_tracker,
+            location_mode=location_mode,
+            stats=self._stats,
+        )
         self._m_ip = InsertionPoint(self._m.body)
         self._hooks = hooks or FxImporterHooks()
+        self._unique_literals = unique_literals
+        # While importing several entry points, the first tensor seen for each
+        # distinct view of a storage. See `import_programs`.
+        self._shared_tensors: Optional[Dict[Tuple, torch.Tensor]] = None
+        # Schema-derived import information, memoized per OpOverload.
+        self._op_dispatch_records: Dict[TorchOpOverload, OpDispatchRecord] = {}
         self.symbol_table = SymbolTable(self._m.operation)
         self._hooks.prepare_module(self._m.operation)
 
+    def get_op_dispatch_record(self, target: TorchOpOverload) -> "OpDispatchRecord":
+        """Returns the (memoized) dispatch record for an OpOverload."""
+        record = self._op_dispatch_records.get(target)
+        if record is None:
+            record = OpDispatchRecord(target, self._c)
+            self._op_dispatch_records[target] = record
+        return record
+
     def _config_check(self):
         for dname in REQUIRED_DIALCTS:
             try:
@@ -471,6 +555,26 @@ class FxImporter:
     def module_op(self) -> Operation:
         return self._m.operation
 
+    @property
+    def literal_op_counts(self) -> Dict[str, int]:
+        """Number of scalar/list literal ops requested vs actually emitted.
+
+        Without literal uniquing, these are equal.
+        """
+        return dict(self._literal_op_counts)
+
+    @property
+    def stats(self) -> Optional["ImportStats"]:
+        """Import statistics, if the importer was created with `collect_stats`."""
+        return self._stats
+
+    @property
+    def deduplicated_literal_bytes(self) -> int:
+        """Number of literal payload bytes elided by content deduplication."""
+        if self._content_tracker is None:
+            return 0
+        return self._content_tracker.bytes_saved
+
     def import_program(
         self,
         prog: torch.export.ExportedProgram,
@@ -710,6 +814,9 @@ class FxImporter:
         frozen, and this entry-point preserves this behavior, treating each distinct
         torch.Tensor encountered in such a way as a `torch.vtensor.literal` (or
         delegating to the literal_resolver_callback to make a policy decision).
+        The literals borrow the storage of the tensors rather than copying it
+        (see `FxImporter`), so the tensors must not be updated in place while
+        the module is in use.
 
         As we anticipate more nuanced treatment options in the future, we name this
         method to indicate that it is producing "frozen" modules. Additional top-level
@@ -772,6 +879,62 @@ class FxImporter:
             g, func_name=func_name, func_visibility=func_visibility
         )
 
+    def import_programs(
+        self,
+        progs: Mapping[str, torch.export.ExportedProgram],
+        *,
+        frozen: bool = True,
+        func_visibility: Optional[str] = None,
+    ) -> Dict[str, Operation]:
+        """Imports several ExportedPrograms as entry points of the module.
+
+        Each program is imported as a `func.func` named by its key (via
+        `import_frozen_program`, or `import_program` if not `frozen`). This is
+        intended for related programs over the same state, such as the
+        prefill and decode graphs of a model or several specializations of
+        one graph.
+
+        Parameters, buffers and constants are materialized once for the whole
+        module: tensors are matched by identity and, since separately exported
+        programs do not necessarily share tensor objects, by being the same
+        view of the same storage. If the importer was created with
+        `deduplicate_literals`, they are additionally matched by content. Each
+        function refers to the shared resource via its own
+        `torch.vtensor.literal`, so the weight payload in memory and in the
+        serialized module does not grow with the number of entry points.
+        """
+        funcs: Dict[str, Operation] = {}
+        self._shared_tensors = {}
+        try:
+            for func_name, prog in progs.items():
+                if frozen:
+                    funcs[func_name] = self.import_frozen_program(
+                        prog, func_name=func_name, func_visibility=func_visibility
+                    )
+                else:
+                    funcs[func_name] = self.import_program(
+                        prog, func_name=func_name, func_visibility=func_visibility
+                    )
+        finally:
+            self._shared_tensors = None
+        return funcs
+
+    def _share_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
+        """Returns the canonical tensor for the storage view of `tensor`."""
+        if type(tensor) not in (torch.Tensor, torch.nn.Parameter):
+            # Subclasses (i.e. fake or functional tensors) have no storage.
+            return tensor
+        key = (
+            tensor.device,
+            tensor.untyped_storage().data_ptr(),
+            tensor.storage_offset(),
+            tensor.dtype,
+            tuple(tensor.shape),
+            tuple(tensor.stride()),
+        )
+        # Retaining the tensor also keeps the storage address from being reused.
+        return self._shared_tensors.setdefault(key, tensor)
+
     def import_graph_module(self, gm: GraphModule) -> Operation:
         """Low-level import of a GraphModule assuming that it has been functionalized.
 
@@ -836,9 +999,7 @@ class FxImporter:
                 # always be "boxed" as a tuple, which we emit as multi-results.
                 for result_node in node.args[0]:
                     if result_node is None:
-                        result_types.append(
-                            IrType.parse("!torch.none", context=self._c)
-                        )
+                        result_types.append(self._cc.torch_none_type)
                     else:
                         result_types.append(self._cc.node_val_to_type(result_node))
         return (
@@ -853,8 +1014,14 @@ class ContextCache:
     __slots__ = [
         "_c",
         "_dtype_to_type",
-        "_tensor_metadata_cache",
+        "_asm_type_cache",
+        "_vtensor_type_cache",
+        "_vtensor_type_cache_limit",
         "_py_attr_tracker",
+        "_content_tracker",
+        "_location_mode",
+        "_stack_trace_locations",
+        "_stats",
         # Types.
         "torch_bool_type",
         "torch_float_type",
@@ -865,23 +1032,48 @@ class ContextCache:
     ]
 
     def __init__(
-        self, context: Context, *, py_attr_tracker: Optional["RefTracker"] = None
+        self,
+        context: Context,
+        *,
+        py_attr_tracker: Optional["RefTracker"] = None,
+        content_tracker: Optional["ContentTracker"] = None,
+        vtensor_type_cache_limit: int = 16384,
+        location_mode: str = "first_frame",
+        stats: Optional["ImportStats"] = None,
     ):
+        if location_mode not in LOCATION_MODES:
+            raise ValueError(
+                f"Unknown location_mode '{location_mode}' (expected one of "
+                f"{', '.join(LOCATION_MODES)})"
+            )
         self._c = context
         self._dtype_to_type: Dict[TorchDtype, IrType] = {}
-        self._tensor_metadata_cache: Dict[
-            Tuple[torch.Size, torch.dtype, Optional[SparsityMeta], bool], IrType
-        ] = {}
+        # Non-tensor types are drawn from a small, closed set of asm strings.
+        self._asm_type_cache: Dict[str, IrType] = {}
+        # Tensor types are keyed structurally. Symbolic dimensions are all
+        # erased to -1 (dynamic), so the set of keys is bounded by the distinct
+        # static shapes in the program. It is further bounded (LRU) to avoid
+        # unbounded growth across many imports sharing a context.
+        # Keys are (sizes, dtype, sparsity, mutable).
+        self._vtensor_type_cache: OrderedDict = OrderedDict()
+        self._vtensor_type_cache_limit = vtensor_type_cache_limit
         self._py_attr_tracker = py_attr_tracker or RefTracker()
+        # If present, literals are additionally uniqued by content.
+        self._content_tracker = content_tracker
+        self._location_mode = location_mode
+        # Stack traces are long but highly repetitive across nodes, so the
+        # derived location is memoized by trace string.
+        self._stack_trace_locations: Dict[str, Location] = {}
+        # If present, cache hit rates and literal sizes are recorded here.
+        self._stats = stats
 
         # Common types.
-        with context:
-            self.torch_bool_type = IrType.parse("!torch.bool")
-            self.torch_float_type = IrType.parse("!torch.float")
-            self.torch_int_type = IrType.parse("!torch.int")
-            self.torch_none_type = IrType.parse("!torch.none")
-            self.torch_str_type = IrType.parse("!torch.str")
-            self.torch_device_type = IrType.parse("!torch.Device")
+        self.torch_bool_type = self.get_type_from_asm("!torch.bool")
+        self.torch_float_type = self.get_type_from_asm("!torch.float")
+        self.torch_int_type = self.get_type_from_asm("!torch.int")
+        self.torch_none_type = self.get_type_from_asm("!torch.none")
+        self.torch_str_type = self.get_type_from_asm("!torch.str")
+        self.torch_device_type = self.get_type_from_asm("!torch.Device")
 
     def integer_attr(self, value: int, bits: int) -> Attribute:
         c = self._c
@@ -891,6 +1083,16 @@ class ContextCache:
         """Strips symbolic elements from a torch.Size object and returns shape asm"""
         return ",".join("?" if is_symbolic(d) else str(d) for d in list(shape))
 
+    def get_type_from_asm(self, asm: str) -> IrType:
+        """Returns the (cached) IrType for a fixed, non-tensor type asm string."""
+        t = self._asm_type_cache.get(asm)
+        if self._stats is not None:
+            self._stats.record_type_lookup(t is not None)
+        if t is None:
+            t = IrType.parse(asm, context=self._c)
+            self._asm_type_cache[asm] = t
+        return t
+
     def get_vtensor_type(
         self,
         shape: torch.Size,
@@ -900,19 +1102,40 @@ class ContextCache:
         mutable: bool = False,
     ):
         """Return IrType for !torch.vtensor with the given shape and dtype"""
-        stem = "torch.tensor" if mutable else "torch.vtensor"
-        shape_asm = self.format_asm_shape(shape)
-        mlir_dtype = str(self.dtype_to_type(dtype))
+        sizes = tuple(-1 if is_symbolic(d) else int(d) for d in shape)
+        key = (sizes, dtype, sparsity, mutable)
+        cache = self._vtensor_type_cache
+        t = cache.get(key)
+        if self._stats is not None:
+            self._stats.record_type_lookup(t is not None)
+        if t is not None:
+            cache.move_to_end(key)
+            return t
+
         if sparsity is not None:
+            # There is no structured builder for encoded tensor types.
+            stem = "torch.tensor" if mutable else "torch.vtensor"
+            shape_asm = self.format_asm_shape(shape)
+            mlir_dtype = str(self.dtype_to_type(dtype))
             encoding = sparsity_encoding(shape, sparsity)
             assert encoding is not None
-            return IrType.parse(
-                f"!{stem}<[{shape_asm}],{str(mlir_dtype)},{encoding}>",
+            t = IrType.parse(
+                f"!{stem}<[{shape_asm}],{mlir_dtype},{encoding}>",
                 context=self._c,
             )
-        return IrType.parse(
-            f"!{stem}<[{shape_asm}],{str(mlir_dtype)}>", context=self._c
-        )
+        elif mutable:
+            t = torch_d.get_non_value_tensor_type(
+                self._c, list(sizes), self.dtype_to_type(dtype)
+            )
+        else:
+            t = torch_d.get_value_tensor_type(
+                self._c, list(sizes), self.dtype_to_type(dtype)
+            )
+
+        cache[key] = t
+        if len(cache) > self._vtensor_type_cache_limit:
+            cache.popitem(last=False)
+        return t
 
     def node_val_to_type(self, node: torch_fx.Node, *, mutable: bool = False) -> IrType:
         try:
@@ -959,7 +1182,7 @@ class ContextCache:
         # is always checked as the last fallback.
         t = SCALAR_TYPE_TO_TORCH_MLIR_TYPE.get(type(val))
         if t is not None:
-            return IrType.parse(t, self._c)
+            return self.get_type_from_asm(t)
 
         raise NotImplementedError(
             f"Could not deduce type from value info: "
@@ -973,19 +1196,10 @@ class ContextCache:
         sparsity: Optional[SparsityMeta] = None,
         mutable: bool = False,
     ) -> IrType:
-        tm_shape = tuple(
-            item.node if is_symbolic(item) else item for item in list(tm.shape)
+        return self.get_vtensor_type(
+            tm.shape, tm.dtype, sparsity=sparsity, mutable=mutable
         )
 
-        key = (tm_shape, tm.dtype, sparsity, mutable)
-        t = self._tensor_metadata_cache.get(key)
-        if t is None:
-            t = self.get_vtensor_type(
-                tm.shape, tm.dtype, sparsity=sparsity, mutable=mutable
-            )
-            self._tensor_metadata_cache[key] = t
-        return t
-
     def dtype_to_type(self, dtype: TorchDtype) -> IrType:
         t = self._dtype_to_type.get(dtype)
         if t is None:
@@ -993,27 +1207,50 @@ class ContextCache:
                 asm = TORCH_DTYPE_TO_MLIR_TYPE_ASM[dtype]
             except IndexError:
                 raise ValueError(f"Unknown conversion from {dtype} to IREE type")
-            t = IrType.parse(asm, self._c)
+            t = self.get_type_from_asm(asm)
             self._dtype_to_type[dtype] = t
         return t
 
     def tensor_to_vtensor_type(self, tensor: torch.Tensor) -> IrType:
-        dtype_asm = str(self.dtype_to_type(tensor.dtype))
-        return IrType.parse(f"!torch.vtensor<{list(tensor.size())},{dtype_asm}>")
+        return self.get_vtensor_type(tensor.size(), tensor.dtype)
 
     def get_node_location(self, node: torch_fx.Node) -> Optional[Location]:
+        if self._location_mode == "none":
+            return None
         stack_trace = node.meta.get("stack_trace")
         if stack_trace is None:
             return None
+        loc = self._stack_trace_locations.get(stack_trace)
+        if self._stats is not None:
+            self._stats.record_location_lookup(loc is not None)
+        if loc is None:
+            loc = self._stack_trace_to_location(stack_trace)
+            self._stack_trace_locations[stack_trace] = loc
+        return loc
+
+    def _stack_trace_to_location(self, stack_trace: str) -> Location:
         # Ugh.
         # TODO: Avoid needing to regex match this.
         # https://github.com/pytorch/pytorch/issues/91000
-        stack_trace = node.stack_trace
         if stack_trace:
-            m = re.search(r"""File "([^"]+)", line ([0-9]+),""", stack_trace)
-            if m:
-                filename, line = m.group(1), int(m.group(2))
-                return Location.file(filename, line, col=0, context=self._c)
+            if self._location_mode == "full":
+                frames = [
+                    Location.file(filename, int(line), col=0, context=self._c)
+                    for filename, line in _STACK_FRAME_RE.findall(stack_trace)
+                ]
+                if len(frames) == 1:
+                    return frames[0]
+                elif frames:
+                    # Frames are listed outermost first: the innermost frame is
+                    # the callee and the rest are its callers.
+                    return Location.callsite(
+                        frames[-1], frames[-2::-1], context=self._c
+                    )
+            else:
+                m = _STACK_FRAME_RE.search(stack_trace)
+                if m:
+                    filename, line = m.group(1), int(m.group(2))
+                    return Location.file(filename, line, col=0, context=self._c)
         return Location.unknown(context=self._c)
 
 
@@ -1027,6 +1264,8 @@ class GraphNodeImporter:
         "_b",
         "_c",
         "_cc",
+        "_last_literal_op",
+        "_literal_values",
         "_on_node_produced",
         "_v",
         "_multi_result_nodes",
@@ -1052,6 +1291,13 @@ class GraphNodeImporter:
         # Statically multi-result nodes which we have de-tupled are noted here.
         # They will have their getitem calls short-circuited.
         self._multi_result_nodes: Set[torch_fx.Node] = set()
+        # If uniquing literals, map of literal key (see `_literal_key`) to the
+        # value materialized for it at the top of the block.
+        self._literal_values: Optional[Dict[Any, Value]] = (
+            {} if fx_importer._unique_literals else None
+        )
+        # The last hoisted literal op. New literals are placed after it.
+        self._last_literal_op: Optional[Operation] = None
 
     def bind_node_value(
         self,
@@ -1171,11 +1417,19 @@ class GraphNodeImporter:
     def import_nodes(
         self, nodes: Iterable[Node], *, skip_placeholders_outputs: bool = False
     ):
-        with InsertionPoint(self._b):
+        stats = self.fx_importer._stats
+        # Call targets are dispatched by identity and then by type.
+        target_handlers = CALL_FUNCTION_TARGET_HANDLERS
+        type_handlers = CALL_FUNCTION_TYPE_HANDLERS
+        with InsertionPoint(self._b), (
+            stats.time_import() if stats is not None else contextlib.nullcontext()
+        ):
             loc = Location.unknown()
             num_placeholders = 0
             for node in nodes:
                 op = node.op
+                if stats is not None:
+                    node_start = time.perf_counter()
                 # Attempt to extract locations. Not everything has them,
                 # so we do our best.
                 new_loc = self._cc.get_node_location(node)
@@ -1188,49 +1442,58 @@ class GraphNodeImporter:
                     num_placeholders += 1
                 elif op == "call_function":
                     target = node.target
-                    if target == operator.getitem:
-                        # Special case handling of getitem for when it is resolving
-                        # against a function call that we know has returned multiple
-                        # results. We short-circuit this case because we have modeled
-                        # function calls to natively return multiple results vs tupling.
-                        getitem_ref, getitem_index = node.args
-                        if getitem_ref in self._multi_result_nodes:
-                            try:
-                                self.bind_node_value(
-                                    node,
-                                    self.resolve_node_value(getitem_ref, getitem_index),
-                                )
-                            except IndexError:
-                                raise RuntimeError(
-                                    f"getitem de-aliasing failed. This likely "
-                                    f"indicates a programmer error that usually "
-                                    f"would have happened at runtime. Please "
-                                    f"notify developers if this case happens "
-                                    f"(at {loc})."
-                                )
-                        else:
-                            raise NotImplementedError(
-                                f"General getitem access to non-multi-result ops"
-                            )
-                    elif target in SYMBOLIC_TORCH_OPS or (
-                        is_symbolic(node.meta.get("val"))
-                        and is_builtin_function_or_method(target)
-                    ):
-                        self._import_symbolic_torch_op(loc, node, target)
-                    elif isinstance(target, TorchOpOverload):
-                        # Dispatch to an ATen op.
-                        self._import_torch_op_overload(loc, node, target)
-                    elif isinstance(target, HigherOrderOperator):
-                        self._import_hop(loc, node, target)
-                    else:
-                        raise NotImplementedError(
-                            f"FIX ME: Unimplemented call_function: target={node.target}, {node.meta}"
-                        )
+                    try:
+                        handler = target_handlers.get(target)
+                    except TypeError:
+                        # Unhashable target.
+                        handler = None
+                    if handler is None:
+                        handler = type_handlers.lookup(type(target))
+                        if handler is None:
+                            _raise_unimplemented_call_function(node)
+                    handler(self, loc, node, target)
                 elif op == "output" and not skip_placeholders_outputs:
                     # args[0] is a singleton tuple that we flatten into multiple
                     # results.
                     operands = [self._import_argument(loc, arg) for arg in node.args[0]]
                     func_dialect.ReturnOp(operands, loc=loc)
+                if stats is not None:
+                    stats.record_node(
+                        node.target if op == "call_function" else op,
+                        time.perf_counter() - node_start,
+                    )
+
+    def _import_getitem(self, loc: Location, node: torch_fx.Node, target: Callable):
+        # Special case handling of getitem for when it is resolving
+        # against a function call that we know has returned multiple
+        # results. We short-circuit this case because we have modeled
+        # function calls to natively return multiple results vs tupling.
+        getitem_ref, getitem_index = node.args
+        if getitem_ref not in self._multi_result_nodes:
+            raise NotImplementedError(f"General getitem access to non-multi-result ops")
+        try:
+            value = self._v[(getitem_ref, getitem_index)]
+        except KeyError:
+            raise RuntimeError(
+                f"getitem de-aliasing failed. This likely "
+                f"indicates a programmer error that usually "
+                f"would have happened at runtime. Please "
+                f"notify developers if this case happens "
+                f"(at {loc})."
+            )
+        self.bind_node_value(node, value)
+
+    def _import_builtin_call(
+        self,
+        loc: Location,
+        node: torch_fx.Node,
+        target: BuiltinFunctionType,
+    ):
+        # Python builtins (i.e. `operator.add`) only appear in graphs as
+        # computations on symbolic scalars.
+        if not is_symbolic(node.meta.get("val")):
+            _raise_unimplemented_call_function(node)
+        self._import_symbolic_torch_op(loc, node, target)
 
     def _promote_symbolic_scalar_int_float(self, loc, graph, param):
         temp_target = torch.ops.aten.Float.Scalar
@@ -1251,9 +1514,7 @@ class GraphNodeImporter:
         self,
         loc: Location,
         node: torch_fx.Node,
-        target: Union[
-            torch._ops.OpOverloadPacket, BuiltinMethodType, BuiltinFunctionType
-        ],
+        target: Union[torch._ops.OpOverloadPacket, BuiltinFunctionType],
     ):
         # parse builtin operations like add, sub, mul, etc. because dynamo captures these
         # operations on symbolic arguments as regular python expressions rather than as torch ops
@@ -1339,9 +1600,8 @@ class GraphNodeImporter:
         # be used here as they use a special encoding for everything.
         # See: torch/_higher_order_ops/auto_functionalize.py
         (op_overload,) = node.args
-        schema = op_overload._schema
-        assert isinstance(schema, FunctionSchema)
-        mlir_op_name = _get_mlir_op_name_for_schema(schema)
+        record = self.fx_importer.get_op_dispatch_record(op_overload)
+        schema = record.schema
 
         # Functionalization transforms the results to (*actual, *aliased).
         # If the schema is actually zero return, then the first "val"
@@ -1364,17 +1624,16 @@ class GraphNodeImporter:
         # The auto_functionalized ops maps all arguments by name (as opposed
         # to mixed for generic OpOverload). Linearize them.
         operands = []
-        for parameter in schema.arguments:
-            operand = self._import_argument(
-                loc, node.kwargs[parameter.name], parameter.type
-            )
+        for name, jit_type, _ in record.arguments:
+            operand = self._import_argument(loc, node.kwargs[name], jit_type)
             operands.append(operand)
 
         operation = _emit_operation(
-            mlir_op_name,
+            record.mlir_op_name,
             result_types=ir_result_types,
             operands=operands,
             loc=loc,
+            is_registered=record.is_registered,
         )
 
         # Special case: if declared_result_types was empty, then we bind a
@@ -1424,54 +1683,45 @@ class GraphNodeImporter:
             # TODO: A more suitable op to replace it?
             return
 
-        schema = target._schema
-        assert isinstance(schema, FunctionSchema)
-        mlir_op_name = _get_mlir_op_name_for_schema(schema)
+        record = self.fx_importer.get_op_dispatch_record(target)
 
         # Intervening to use Scalar ops due to incorrect ops from AOT-autograd with scalar arguments.
-        if mlir_op_name in TENSOR_SCALAR_OP_CONVERTER and (
+        if record.scalar_overload is not None and (
             isinstance(node.args[1], float) or isinstance(node.args[1], int)
         ):
-            mlir_op_name = TENSOR_SCALAR_OP_CONVERTER[mlir_op_name]
             # we are dynamically changing which op is emitted here due to an issue in
             # torch dynamo where it emits the Tensor variant of ops even when processing
-            # scalar arguments, therefore we retrieve the schema as well so that we
-            # consume the correct typing information when subsequently importing the
-            # function arguments and result types
-            # i.e. the code below is basically doing `schema = torch.ops.aten.my_op.Scalar._schema`
-            op_attrs = mlir_op_name.split(".")
-            op_overload = getattr(torch, "ops")
-            for i in range(1, len(op_attrs)):
-                op_overload = getattr(op_overload, op_attrs[i])
-            schema = op_overload._schema
+            # scalar arguments, therefore we use the record (and schema) of the Scalar
+            # variant so that we consume the correct typing information when
+            # subsequently importing the function arguments and result types
+            record = self.fx_importer.get_op_dispatch_record(record.scalar_overload)
 
         # Convert result types.
-        result_types = self._unpack_node_result_types(node, schema)
+        result_types = self._unpack_node_result_types(node, record.schema)
         if len(result_types) > 1:
             self._multi_result_nodes.add(node)
 
         # Unroll operands from formal parameters, args and kwargs.
         operands = []
-        for i, parameter in enumerate(schema.arguments):
-            if i < len(node.args):
-                operands.append(
-                    self._import_argument(loc, node.args[i], parameter.type)
-                )
-            elif parameter.name in node.kwargs:
-                operands.append(
-                    self._import_argument(
-                        loc, node.kwargs[parameter.name], parameter.type
-                    )
-                )
+        node_args = node.args
+        node_kwargs = node.kwargs
+        num_args = len(node_args)
+        for i, (name, jit_type, default_value) in enumerate(record.arguments):
+            if i < num_args:
+                operands.append(self._import_argument(loc, node_args[i], jit_type))
+            elif name in node_kwargs:
+                operands.append(self._import_argument(loc, node_kwargs[name], jit_type))
             else:
                 operands.append(
-                    self._import_default_value(
-                        loc, parameter.default_value, parameter.type
-                    )
+                    self._import_default_value(loc, default_value, jit_type)
                 )
 
         operation = _emit_operation(
-            mlir_op_name, result_types=result_types, operands=operands, loc=loc
+            record.mlir_op_name,
+            result_types=result_types,
+            operands=operands,
+            loc=loc,
+            is_registered=record.is_registered,
         )
 
         # Record value mapping.
@@ -1537,6 +1787,11 @@ class GraphNodeImporter:
             ).result
 
     def _import_literal(self, py_value: Any) -> Value:
+        if self.fx_importer._shared_tensors is not None and isinstance(
+            py_value, torch.Tensor
+        ):
+            py_value = self.fx_importer._share_tensor(py_value)
+
         # Apply the conversion callback.
         user_value = self.fx_importer._hooks.resolve_literal(self, py_value)
         if user_value is not None:
@@ -1549,9 +1804,47 @@ class GraphNodeImporter:
             raise TypeError(
                 f"Unsupported argument -> literal conversion for {py_value.__class__}"
             )
-        return converter(py_value, self, self._cc)
+        return self._get_or_create_literal(
+            _literal_key(py_value), lambda: converter(py_value, self, self._cc)
+        )
+
+    def _get_or_create_literal(
+        self, key: Optional[Any], create: Callable[[], Value]
+    ) -> Value:
+        """Returns the uniqued value for a literal `key`, creating it if needed.
+
+        Uniqued literals are hoisted to the top of the block (in creation
+        order) so that they dominate every later use. If uniquing is disabled
+        or the literal has no key, this just calls `create`.
+        """
+        counts = self.fx_importer._literal_op_counts
+        counts["requested"] += 1
+        if key is None or self._literal_values is None:
+            counts["emitted"] += 1
+            return create()
+        value = self._literal_values.get(key)
+        if value is not None:
+            return value
+
+        counts["emitted"] += 1
+        value = create()
+        op = value.owner
+        if self._last_literal_op is None:
+            first_op = self._b.operations[0]
+            if first_op != op:
+                op.move_before(first_op)
+        else:
+            op.move_after(self._last_literal_op)
+        self._last_literal_op = op
+        self._literal_values[key] = value
+        return value
 
     def _import_input(self, py_value: Any, info: InputInfo) -> Value:
+        if self.fx_importer._shared_tensors is not None and isinstance(
+            py_value, torch.Tensor
+        ):
+            py_value = self.fx_importer._share_tensor(py_value)
+
         # Try the hook.
         user_value = self.fx_importer._hooks.resolve_input(self, py_value, info)
         if user_value is not None:
@@ -1568,8 +1861,7 @@ class GraphNodeImporter:
     def _import_scalar_as_tensor(self, loc: Location, arg: NodeArgument) -> Value:
         tensor_arg = torch.tensor(arg)
         result_type = self._cc.get_vtensor_type(tensor_arg.size(), tensor_arg.dtype)
-        with loc:
-            constant_arg = LITERAL_CONVERTER_MAP.lookup(type(arg))(arg, self, self._cc)
+        constant_arg = self._import_default_value(loc, arg, None)
 
         return Operation.create(
             name="torch.prim.NumToTensor.Scalar",
@@ -1606,6 +1898,34 @@ class GraphNodeImporter:
                 element_jit_type = element_jit_type.getElementType()
             element_type = TORCH_TYPE_TO_PY_TYPE[type(element_jit_type)]
 
+        # construct list type
+        if is_optional_type:
+            list_type = PY_TYPE_TO_TORCH_OPTIONAL_LIST_TYPE[element_type]
+        else:
+            list_type = PY_TYPE_TO_TORCH_LIST_TYPE[element_type]
+
+        # Lists made up entirely of literals are themselves literals.
+        element_keys = [_literal_key(operand) for operand in arg]
+        if None in element_keys:
+            list_key = None
+        else:
+            list_key = (list_type, tuple(element_keys))
+        return self._get_or_create_literal(
+            list_key,
+            lambda: self._create_list_construct(
+                loc, arg, list_type, element_type, element_jit_type, is_optional_type
+            ),
+        )
+
+    def _create_list_construct(
+        self,
+        loc: Location,
+        arg: Sequence[NodeArgument],
+        list_type: str,
+        element_type,
+        element_jit_type,
+        is_optional_type: bool,
+    ) -> Value:
         # create list operands
         list_operands = []
 
@@ -1634,12 +1954,7 @@ class GraphNodeImporter:
             list_operands.append(val)
 
         # construct list op
-        if is_optional_type:
-            list_type = PY_TYPE_TO_TORCH_OPTIONAL_LIST_TYPE[element_type]
-        else:
-            list_type = PY_TYPE_TO_TORCH_LIST_TYPE[element_type]
-
-        result_type = IrType.parse(list_type, context=self._c)
+        result_type = self._cc.get_type_from_asm(list_type)
         operation = Operation.create(
             "torch.prim.ListConstruct",
             results=[result_type],
@@ -1661,7 +1976,9 @@ class GraphNodeImporter:
         if cvt is None:
             raise RuntimeError(f"Unhandled default value ({arg.__class__}): {arg})")
         with loc:
-            return cvt(arg, self, self._cc)
+            return self._get_or_create_literal(
+                _literal_key(arg), lambda: cvt(arg, self, self._cc)
+            )
 
     def _unpack_node_result_types(
         self, node: torch.fx.Node, schema: FunctionSchema
@@ -1707,8 +2024,50 @@ def create_mlir_tensor_type(tensor: torch.Tensor) -> IrType:
         raise TypeError(f"Could not map Torch dtype {dtype} to an MLIR type")
 
 
+def _tensor_to_ndarray(tensor: torch.Tensor, npy_dtype) -> np.ndarray:
+    """Returns a host ndarray of `npy_dtype` holding the contents of `tensor`.
+
+    Where possible, the result aliases the tensor's storage directly (via
+    the array interface of a detached, contiguous CPU tensor) so that large
+    parameters are not copied or boxed element-wise. This runs with dispatch
+    modes disabled so that it also works for real tensors captured while a
+    FakeTensorMode is active (where `detach()` would otherwise raise).
+
+    Tensors that cannot be exported this way (i.e. tensor subclasses, or
+    dtypes that do not round-trip through numpy) fall back to the slow
+    Tensor -> list -> ndarray conversion.
+    """
+    try:
+        with no_dispatch():
+            t = tensor.detach()
+            if t.device.type != "cpu":
+                t = t.cpu()
+            # Conjugate and negative bit views cannot be exported to numpy
+            # without materializing.
+            t = t.resolve_conj().resolve_neg().contiguous()
+            if t.dtype == torch.bfloat16:
+                # numpy has no native bfloat16: reinterpret the raw bits and
+                # view them as the ml_dtypes type.
+                return t.view(torch.int16).numpy().view(npy_dtype)
+            np_tensor = t.numpy()
+        if np_tensor.dtype != npy_dtype:
+            np_tensor = np_tensor.astype(npy_dtype)
+        return np_tensor
+    except (RuntimeError, TypeError) as e:
+        logging.debug(
+            "Falling back to list conversion for tensor literal (%s): %s",
+            tensor.dtype,
+            e,
+        )
+        return np.array(tensor.tolist()).astype(npy_dtype)
+
+
 def _make_vtensor_literal_op(
-    tensor: torch.Tensor, vtensor_type: IrType, py_attr_tracker: "RefTracker"
+    tensor: torch.Tensor,
+    vtensor_type: IrType,
+    py_attr_tracker: "RefTracker",
+    content_tracker: Optional["ContentTracker"] = None,
+    stats: Optional["ImportStats"] = None,
 ) -> Operation:
     mapping = py_attr_tracker.track(tensor)
     if mapping.is_empty:
@@ -1721,13 +2080,9 @@ def _make_vtensor_literal_op(
         assert (
             npy_dtype is not None
         ), f"Can not create literal tensor for unsupported datatype: {tensor.dtype}"
-        # We need a raw buffer of data in order to create an ElementsAttr for the invocation of torch.vtensor.literal,
-        # but torch.Tensor does not fulfill the python buffer/array interface hence we must convert to a numpy array to get
-        # a raw buffer of our data. We can't call torch.Tensor.numpy() directly because this internally forces a call to
-        # detach() which throws an error as we are operating in a FakeTensorMode, hence the simplest way to get this raw
-        # buffer is via the indirection: Tensor -> list -> numpy array. This allows us to create a vtensor literal as
-        # desired, but also limits which data types we can support in this function (see TORCH_DTYPE_TO_NPY_TYPE above)
-        np_tensor = np.array(tensor.tolist()).astype(npy_dtype)
+        np_tensor = _tensor_to_ndarray(tensor, npy_dtype)
+        if stats is not None:
+            stats.record_tensor_literal(np_tensor.nbytes)
         # One element constants are more optimizable as splat DenseElementsAttr. DenseResourceElementsAttr does not
         # support splats, so don't use it for that case. In addition, at the time of writing, it has bugs with handling
         # 0d tensors.
@@ -1741,15 +2096,25 @@ def _make_vtensor_literal_op(
                 type=element_type, array=np_tensor, shape=np_tensor.shape
             )
         else:
-            bytes_view = np_tensor.view(npy_dtype)
-            tensor_type = create_mlir_tensor_type(tensor)
-            shape_desc = "_".join([str(d) for d in tensor.shape])
-            blob_name = f"torch_tensor_{shape_desc}_{str(tensor.dtype)}"
-            elements_attr = DenseResourceElementsAttr.get_from_buffer(
-                bytes_view,
-                blob_name,
-                tensor_type,
+            content_mapping = (
+                content_tracker.track(np_tensor) if content_tracker else None
             )
+            if content_mapping is not None and not content_mapping.is_empty:
+                elements_attr = content_mapping.value
+            else:
+                # Note that the resource blob borrows the ndarray (and through
+                # it, the tensor storage) rather than copying it.
+                bytes_view = np_tensor.view(npy_dtype)
+                tensor_type = create_mlir_tensor_type(tensor)
+                shape_desc = "_".join([str(d) for d in tensor.shape])
+                blob_name = f"torch_tensor_{shape_desc}_{str(tensor.dtype)}"
+                elements_attr = DenseResourceElementsAttr.get_from_buffer(
+                    bytes_view,
+                    blob_name,
+                    tensor_type,
+                )
+                if content_mapping is not None:
+                    content_mapping.value = elements_attr
         mapping.value = elements_attr
     else:
         elements_attr = mapping.value
@@ -1806,6 +2171,32 @@ class TypeSubclassMap:
 ###############################################################################
 
 
+def _literal_key(py_value: Any) -> Optional[Any]:
+    """Returns a key under which a scalar literal can be uniqued, or None.
+
+    Keys are normalized to the constant op that the value materializes as
+    (i.e. dtypes are keyed as the ints that they lower to) and include the
+    Python type, since `True == 1 == 1.0`.
+    """
+    t = type(py_value)
+    if t is float:
+        # Distinguishes -0.0 and compares NaNs by representation.
+        return (float, py_value.hex())
+    if t in (NoneType, bool, int, str):
+        return (t, py_value)
+    if t is torch.device:
+        return (t, str(py_value))
+    if t is torch.dtype:
+        v = TORCH_DTYPE_TO_INT.get(py_value)
+    elif t is torch.layout:
+        v = TORCH_LAYOUT_TO_INT.get(py_value)
+    elif t is torch.memory_format:
+        v = TORCH_MEMORY_FORMAT_TO_INT.get(py_value)
+    else:
+        return None
+    return None if v is None else (int, v)
+
+
 def _get_mlir_op_name_for_schema(schema: FunctionSchema) -> str:
     # Returns a fully-qualified MLIR operation name (i.e. 'torch.foobar')
     # for a function schema.
@@ -1818,13 +2209,18 @@ def _get_mlir_op_name_for_schema(schema: FunctionSchema) -> str:
 
 
 def _emit_operation(
-    mlir_op_name: str, result_types: List[IrType], operands: List[Value], loc: Location
+    mlir_op_name: str,
+    result_types: List[IrType],
+    operands: List[Value],
+    loc: Location,
+    is_registered: Optional[bool] = None,
 ) -> Operation:
     # Support unregistered torch ops using torch.operator.
     # torch.operator is used to represent ops from registry
     # which haven't been generated by torch_ods_gen.py.
-    context = loc.context
-    if not context.is_registered_operation(mlir_op_name):
+    if is_registered is None:
+        is_registered = loc.context.is_registered_operation(mlir_op_name)
+    if not is_registered:
         operation = Operation.create(
             "torch.operator",
             attributes={"name": StringAttr.get(mlir_op_name)},
@@ -1842,6 +2238,45 @@ def _emit_operation(
     return operation
 
 
+class OpDispatchRecord:
+    """Schema-derived information needed to import an OpOverload.
+
+    Deriving these from the schema for every node is comparatively expensive,
+    so they are computed once per OpOverload (see
+    `FxImporter.get_op_dispatch_record`).
+    """
+
+    __slots__ = [
+        "arguments",
+        "is_registered",
+        "mlir_op_name",
+        "scalar_overload",
+        "schema",
+    ]
+
+    def __init__(self, target: TorchOpOverload, context: Context):
+        schema = target._schema
+        assert isinstance(schema, FunctionSchema)
+        self.schema = schema
+        self.mlir_op_name = _get_mlir_op_name_for_schema(schema)
+        self.is_registered = context.is_registered_operation(self.mlir_op_name)
+        # Tuple of (name, jit_type, default_value) for each formal parameter.
+        self.arguments: Tuple[Tuple[str, Any, Any], ...] = tuple(
+            (p.name, p.type, p.default_value) for p in schema.arguments
+        )
+        # If this is a Tensor variant that may need to be swapped for its
+        # Scalar variant, this is the OpOverload of the latter.
+        self.scalar_overload: Optional[TorchOpOverload] = None
+        scalar_op_name = TENSOR_SCALAR_OP_CONVERTER.get(self.mlir_op_name)
+        if scalar_op_name is not None:
+            # i.e. `torch.ops.aten.my_op.Scalar` for 'torch.aten.my_op.Scalar'.
+            op_attrs = scalar_op_name.split(".")
+            op_overload = getattr(torch, "ops")
+            for i in range(1, len(op_attrs)):
+                op_overload = getattr(op_overload, op_attrs[i])
+            self.scalar_overload = op_overload
+
+
 ###############################################################################
 # Reference mapping
 ###############################################################################
@@ -1898,6 +2333,209 @@ class RefTracker:
         del self._refs[ref_id]
 
 
+class ContentTracker:
+    """Tracks array payloads by content to symbolic associations.
+
+    Whereas the RefTracker uniques by Python identity, this uniques by the
+    bytes of the payload. Arrays are bucketed by a fast digest of their bytes
+    and a hit is only reported when the full payload compares equal, so
+    digest collisions can never alias distinct literals.
+    """
+
+    def __init__(self):
+        self._entries: Dict[
+            Tuple[str, Tuple[int, ...], bytes], List[Tuple[np.ndarray, RefMapping]]
+        ] = {}
+        self.bytes_saved = 0
+
+    def track(self, array: np.ndarray) -> RefMapping:
+        flat = array.reshape(-1).view(np.uint8)
+        digest = hashlib.blake2b(flat, digest_size=16).digest()
+        key = (str(array.dtype), array.shape, digest)
+        candidates = self._entries.setdefault(key, [])
+        for existing, mapping in candidates:
+            if np.array_equal(existing, flat):
+                self.bytes_saved += flat.nbytes
+                return mapping
+        info = RefMapping(Empty)
+        # Retain the payload for verification of future digest hits.
+        candidates.append((flat, info))
+        return info
+
+
+################################################################################
+# Import statistics
+################################################################################
+
+
+class ImportStats:
+    """Records where time goes while importing into an FxImporter.
+
+    Nodes are counted (and timed) per call target for `call_function` nodes
+    and per op kind (i.e. "placeholder", "output") otherwise. Node time is
+    inclusive of any literals, types and locations that the node needed.
+
+    The collected data is available as a JSON-compatible dict (`as_dict`),
+    as JSON (`to_json`) or as a human readable table (`format_table`).
+    """
+
+    __slots__ = [
+        "_import_depth",
+        "import_seconds",
+        "literal_op_counts",
+        "literal_tensor_bytes",
+        "literal_tensor_count",
+        "location_cache_hits",
+        "location_cache_misses",
+        "node_counts",
+        "node_seconds",
+        "type_cache_hits",
+        "type_cache_misses",
+    ]
+
+    def __init__(self, *, literal_op_counts: Optional[Dict[str, int]] = None):
+        self.import_seconds = 0.0
+        self._import_depth = 0
+        # Keyed by the raw target (or op kind): names are only derived when
+        # reporting.
+        self.node_counts: Dict[Any, int] = {}
+        self.node_seconds: Dict[Any, float] = {}
+        self.literal_tensor_count = 0
+        self.literal_tensor_bytes = 0
+        # Shared with the importer, which maintains it regardless of stats.
+        self.literal_op_counts = (
+            literal_op_counts
+            if literal_op_counts is not None
+            else {"requested": 0, "emitted": 0}
+        )
+        self.type_cache_hits = 0
+        self.type_cache_misses = 0
+        self.location_cache_hits = 0
+        self.location_cache_misses = 0
+
+    @contextlib.contextmanager
+    def time_import(self):
+        """Adds the time spent in the block to `import_seconds`.
+
+        Imports may nest (e.g. a node that imports a subgraph), in which case
+        only the outermost import is timed, so that no time is counted twice.
+        """
+        self._import_depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._import_depth -= 1
+            if self._import_depth == 0:
+                self.import_seconds += time.perf_counter() - start
+
+    def record_node(self, target: Any, seconds: float):
+        self.node_counts[target] = self.node_counts.get(target, 0) + 1
+        self.node_seconds[target] = self.node_seconds.get(target, 0.0) + seconds
+
+    def record_tensor_literal(self, num_bytes: int):
+        self.literal_tensor_count += 1
+        self.literal_tensor_bytes += num_bytes
+
+    def record_type_lookup(self, hit: bool):
+        if hit:
+            self.type_cache_hits += 1
+        else:
+            self.type_cache_misses += 1
+
+    def record_location_lookup(self, hit: bool):
+        if hit:
+            self.location_cache_hits += 1
+        else:
+            self.location_cache_misses += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the statistics as a JSON-compatible dict.
+
+        Nodes are listed by descending cumulative time.
+        """
+        nodes: Dict[str, Dict[str, Any]] = {}
+        for target, count in self.node_counts.items():
+            entry = nodes.setdefault(
+                _stats_target_name(target), {"count": 0, "seconds": 0.0}
+            )
+            entry["count"] += count
+            entry["seconds"] += self.node_seconds[target]
+        return {
+            "import_seconds": self.import_seconds,
+            "nodes": dict(
+                sorted(nodes.items(), key=lambda item: item[1]["seconds"], reverse=True)
+            ),
+            "literals": {
+                "tensor_count": self.literal_tensor_count,
+                "tensor_bytes": self.literal_tensor_bytes,
+                "ops_requested": self.literal_op_counts["requested"],
+                "ops_emitted": self.literal_op_counts["emitted"],
+            },
+            "type_cache": _hit_rate_dict(self.type_cache_hits, self.type_cache_misses),
+            "location_cache": _hit_rate_dict(
+                self.location_cache_hits, self.location_cache_misses
+            ),
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.as_dict(), indent=indent)
+
+    def format_table(self, limit: Optional[int] = 25) -> str:
+        """Formats the statistics as a table of the `limit` slowest targets."""
+        d = self.as_dict()
+        nodes = list(d["nodes"].items())
+        total_seconds = d["import_seconds"]
+        lines = [
+            f"FX import: {sum(e['count'] for _, e in nodes)} nodes in "
+            f"{total_seconds * 1e3:.3f} ms",
+            f"{'target':<48} {'count':>8} {'ms':>10} {'us/node':>10} {'%':>6}",
+        ]
+        shown = nodes if limit is None else nodes[:limit]
+        for name, entry in shown:
+            count, seconds = entry["count"], entry["seconds"]
+            percent = 100.0 * seconds / total_seconds if total_seconds else 0.0
+            lines.append(
+                f"{name:<48} {count:>8} {seconds * 1e3:>10.3f} "
+                f"{seconds * 1e6 / count:>10.2f} {percent:>6.1f}"
+            )
+        if len(shown) < len(nodes):
+            lines.append(f"... ({len(nodes) - len(shown)} more targets)")
+        literals = d["literals"]
+        lines.append(
+            f"tensor literals: {literals['tensor_count']} "
+            f"({literals['tensor_bytes']} bytes); "
+            f"literal ops: {literals['ops_emitted']} emitted of "
+            f"{literals['ops_requested']} requested"
+        )
+        for cache in ("type_cache", "location_cache"):
+            c = d[cache]
+            lines.append(
+                f"{cache.replace('_', ' ')}: {c['hits']} hits, {c['misses']} misses "
+                f"({100.0 * c['hit_rate']:.1f}%)"
+            )
+        return "\n".join(lines)
+
+
+def _stats_target_name(target: Any) -> str:
+    if isinstance(target, str):
+        return target
+    if isinstance(target, HigherOrderOperator):
+        return f"{target.namespace}.{target.name()}"
+    if isinstance(target, TorchOpOverload):
+        return str(target)
+    return getattr(target, "__name__", str(target))
+
+
+def _hit_rate_dict(hits: int, misses: int) -> Dict[str, Any]:
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / lookups if lookups else 0.0,
+    }
+
+
 ################################################################################
 # Mappings
 ################################################################################
@@ -1936,7 +2574,11 @@ LITERAL_CONVERTER_MAP.map(
 LITERAL_CONVERTER_MAP.map(
     torch.Tensor,
     lambda arg, gni, cc: _make_vtensor_literal_op(
-        arg, cc.tensor_to_vtensor_type(arg), cc._py_attr_tracker
+        arg,
+        cc.tensor_to_vtensor_type(arg),
+        cc._py_attr_tracker,
+        cc._content_tracker,
+        cc._stats,
     ).result,
 )
 LITERAL_CONVERTER_MAP.map(
@@ -1964,6 +2606,28 @@ LITERAL_CONVERTER_MAP.map(
     ),
 )
 
+# Handlers for `call_function` nodes, as unbound GraphNodeImporter methods
+# taking (loc, node, target). Targets are looked up by identity first and then
+# by type (including super-types).
+CALL_FUNCTION_TARGET_HANDLERS: Dict[Any, Callable] = {
+    operator.getitem: GraphNodeImporter._import_getitem,
+}
+for _symbolic_op in SYMBOLIC_TORCH_OPS:
+    CALL_FUNCTION_TARGET_HANDLERS[_symbolic_op] = (
+        GraphNodeImporter._import_symbolic_torch_op
+    )
+del _symbolic_op
+
+CALL_FUNCTION_TYPE_HANDLERS = TypeSubclassMap()
+CALL_FUNCTION_TYPE_HANDLERS.map(
+    TorchOpOverload, GraphNodeImporter._import_torch_op_overload
+)
+CALL_FUNCTION_TYPE_HANDLERS.map(HigherOrderOperator, GraphNodeImporter._import_hop)
+# Also covers `BuiltinMethodType`, which is the same type.
+CALL_FUNCTION_TYPE_HANDLERS.map(
+    BuiltinFunctionType, GraphNodeImporter._import_builtin_call
+)
+
 TORCH_TYPE_TO_PY_TYPE = {
     torch.IntType: int,
     torch.FloatType: float,
@@ -3,23 +3,39 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 # Also available under a BSD-style license. See LICENSE.
 
-from typing import Optional, Union, Dict, Tuple, Any, Callable
+from typing import (
+    Optional,
+    Union,
+    Dict,
+    Tuple,
+    Any,
+    Callable,
+    List,
+    NamedTuple,
+    Sequence,
+)
 
 import warnings
 
 import torch
 import torch.export
 import torch.nn as nn
+import torch.nn.functional as F
 from torch.export import ExportedProgram
 
 from torch_mlir.extras.fx_importer import FxImporter, FxImporterHooks
 from torch_mlir import ir
 from torch_mlir.dialects import torch as torch_d
 from torch_mlir.extras.fx_decomp_util import get_decomposition_table
+from torch_mlir.compile_cache import CompileCache, code_and_state, fingerprint
 from torch_mlir.compiler_utils import (
+    BACKEND_PIPELINES,
+    OutputFile,
     OutputType,
+    PassReport,
     run_pipeline_with_repro_report,
     lower_mlir_module,
+    write_bytecode,
 )
 
 
@@ -29,11 +45,16 @@ def _module_lowering(
     torch_mod,
     backend_legal_ops=None,
     extra_library_file_name=None,
+    fuse_pipelines=False,
+    pass_report=None,
+    output_file=None,
 ):
 
     if output_type == OutputType.TORCH:
         if verbose:
             print(torch_mod)
+        if output_file is not None:
+            write_bytecode(torch_mod, output_file)
         return torch_mod
     # TODO: pass backend_legal_ops/extra_library_file_name by caller
     if backend_legal_ops is None:
@@ -47,13 +68,108 @@ def _module_lowering(
         + extra_library_file_name
         + "}"
     )
+    torch_backend_pipeline = f"torch-function-to-torch-backend-pipeline{option_string}"
+    # Printing the IR between stages requires running them separately.
+    if fuse_pipelines and not verbose and output_type in BACKEND_PIPELINES:
+        # Lower to the backend with a single PassManager, so that the module is
+        # only verified (and threading is only set up) once.
+        backend_pipeline, backend_ir_name, _ = BACKEND_PIPELINES[output_type]
+        run_pipeline_with_repro_report(
+            torch_mod,
+            f"builtin.module({torch_backend_pipeline},{backend_pipeline})",
+            f"Lowering TorchFX IR -> {backend_ir_name}",
+            pass_report=pass_report,
+        )
+        if output_file is not None:
+            write_bytecode(torch_mod, output_file)
+        return torch_mod
     run_pipeline_with_repro_report(
         torch_mod,
-        f"builtin.module(torch-function-to-torch-backend-pipeline{option_string})",
+        f"builtin.module({torch_backend_pipeline})",
         "Lowering TorchFX IR -> Torch Backend IR",
         enable_ir_printing=verbose,
+        pass_report=pass_report,
+    )
+    return lower_mlir_module(
+        verbose,
+        output_type,
+        torch_mod,
+        pass_report=pass_report,
+        output_file=output_file,
+    )
+
+
+def _print_import_stats(fx_importer: FxImporter):
+    if fx_importer.stats is None:
+        warnings.warn(
+            "Import stats requested but the given FxImporter was not created "
+            "with collect_stats=True"
+        )
+        return
+    print(fx_importer.stats.format_table())
+
+
+def _new_context() -> ir.Context:
+    context = ir.Context()
+    torch_d.register_dialect(context)
+    return context
+
+
+def _check_cacheable(cache, fx_importer, hooks):
+    if cache is not None and (fx_importer is not None or hooks is not None):
+        raise ValueError(
+            "A compile cache cannot be combined with a custom fx_importer or "
+            "hooks, which may change the imported module"
+        )
+
+
+def _input_spec(value: Any) -> Any:
+    # Only the properties of example inputs that can affect the exported
+    # graph contribute to the key, not their values.
+    if isinstance(value, torch.Tensor):
+        return ("tensor", value.dtype, tuple(value.shape), tuple(value.stride()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_input_spec(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _input_spec(v) for k, v in value.items()}
+    return value
+
+
+def _program_key(prog: ExportedProgram) -> Optional[Tuple[Any, ...]]:
+    """Returns the part of the cache key that identifies `prog`.
+
+    Returns None if `prog` holds a constant whose contents cannot be
+    fingerprinted.
+    """
+    constants = {}
+    for name, value in prog.constants.items():
+        # Tensors are hashed by content by `fingerprint`, but script objects
+        # (e.g. packed params) only by their state.
+        if isinstance(value, torch.ScriptObject):
+            if not hasattr(value, "__getstate__"):
+                return None
+            value = (str(value._type()), value.__getstate__())
+        constants[name] = value
+    return (
+        prog.graph_module.code,
+        str(prog.graph),
+        str(prog.graph_signature),
+        str(prog.range_constraints),
+        dict(prog.state_dict),
+        constants,
     )
-    return lower_mlir_module(verbose, output_type, torch_mod)
+
+
+def _get_cached(
+    cache: CompileCache,
+    key: str,
+    context: ir.Context,
+    output_file: Optional[OutputFile],
+) -> Optional[ir.Module]:
+    module = cache.get(key, context)
+    if module is not None and output_file is not None:
+        write_bytecode(module, output_file)
+    return module
 
 
 def export_and_import(
@@ -68,21 +184,84 @@ def export_and_import(
     func_name: str = "main",
     enable_graph_printing: bool = False,
     enable_ir_printing: bool = False,
+    enable_import_stats: bool = False,
+    fuse_pipelines: bool = False,
+    pass_report: Optional[PassReport] = None,
+    cache: Optional[CompileCache] = None,
+    context: Optional[ir.Context] = None,
+    output_file: Optional[OutputFile] = None,
     **kwargs,
 ):
-    context = ir.Context()
-    torch_d.register_dialect(context)
+    """Exports `f`, imports it and lowers it to `output_type`.
+
+    If a `cache` is given, a previously compiled module with the same key is
+    returned without exporting, importing or lowering `f`. The key covers the
+    code of `f` and the code that it calls, its parameters, buffers and other
+    state (see `compile_cache.code_and_state`), or the graph and state of an
+    `ExportedProgram`, as well as the decomposition table, the input specs,
+    `dynamic_shapes`, the options that affect the result and the torch and
+    torch-mlir versions. If `f` or the decomposition table use objects that
+    cannot be fingerprinted, the key covers the exported and decomposed
+    program instead, so a hit then only skips import and lowering.
+
+    The module is created in `context` (which must have the torch dialect
+    registered, e.g. one from a `ContextPool`) or in a new context. If an
+    `output_file` (a path or binary stream) is given, the module is also
+    streamed to it as MLIR bytecode.
+
+    The weights of `f` are borrowed rather than copied by the tensor literals
+    of the module (see `FxImporter`), so they must not be updated in place
+    while the module is in use.
+    """
+    _check_cacheable(cache, fx_importer, hooks)
+    context = _new_context() if context is None else context
+
+    if decomposition_table is None:
+        decomposition_table = get_decomposition_table()
+
+    cache_key = None
+    if cache is not None:
+        options = (
+            _input_spec(args),
+            _input_spec(kwargs),
+            dynamic_shapes,
+            str(OutputType.get(output_type)),
+            experimental_support_mutation,
+            func_name,
+            fuse_pipelines,
+        )
+        # Computed before exporting, so that a hit skips `torch.export`.
+        source_key = (
+            _program_key(f) if isinstance(f, ExportedProgram) else code_and_state(f)
+        )
+        decomposition_key = code_and_state(decomposition_table)
+        if source_key is not None and decomposition_key is not None:
+            cache_key = fingerprint("source", source_key, decomposition_key, options)
+            module = _get_cached(cache, cache_key, context, output_file)
+            if module is not None:
+                return module
 
-    if fx_importer is None:
-        fx_importer = FxImporter(context=context, hooks=hooks)
     if isinstance(f, ExportedProgram):
         prog = f
     else:
         prog = torch.export.export(f, args, kwargs, dynamic_shapes=dynamic_shapes)
-    if decomposition_table is None:
-        decomposition_table = get_decomposition_table()
     if decomposition_table:
         prog = prog.run_decompositions(decomposition_table)
+
+    if cache is not None and cache_key is None:
+        # Fall back to keying on the program that is imported, which reflects
+        # everything that `f` and the decompositions do.
+        program_key = _program_key(prog)
+        if program_key is not None:
+            cache_key = fingerprint("program", program_key, options)
+            module = _get_cached(cache, cache_key, context, output_file)
+            if module is not None:
+                return module
+
+    if fx_importer is None:
+        fx_importer = FxImporter(
+            context=context, hooks=hooks, collect_stats=enable_import_stats
+        )
     if enable_graph_printing:
         prog.graph_module.print_readable()
     if experimental_support_mutation:
@@ -91,12 +270,177 @@ def export_and_import(
         fx_importer.import_program(prog, func_name=func_name)
     else:
         fx_importer.import_frozen_program(prog, func_name=func_name)
+    if enable_import_stats:
+        _print_import_stats(fx_importer)
+
+    module = _module_lowering(
+        enable_ir_printing,
+        OutputType.get(output_type),
+        fx_importer.module,
+        fuse_pipelines=fuse_pipelines,
+        pass_report=pass_report,
+        output_file=output_file,
+    )
+    if cache_key is not None:
+        cache.put(cache_key, module)
+    return module
+
+
+def import_programs(
+    progs: Dict[str, ExportedProgram],
+    *,
+    output_type: Union[str, OutputType] = OutputType.TORCH,
+    fx_importer: Optional[FxImporter] = None,
+    experimental_support_mutation: bool = False,
+    hooks: Optional[FxImporterHooks] = None,
+    decomposition_table: Optional[Dict[torch._ops.OperatorBase, Callable]] = None,
+    enable_graph_printing: bool = False,
+    enable_ir_printing: bool = False,
+    enable_import_stats: bool = False,
+    fuse_pipelines: bool = False,
+    pass_report: Optional[PassReport] = None,
+    context: Optional[ir.Context] = None,
+    output_file: Optional[OutputFile] = None,
+):
+    """Imports several programs into one module, keyed by function name.
+
+    Parameters and buffers shared between the programs are materialized once
+    (see `FxImporter.import_programs`).
+    """
+    context = _new_context() if context is None else context
+
+    if fx_importer is None:
+        fx_importer = FxImporter(
+            context=context, hooks=hooks, collect_stats=enable_import_stats
+        )
+    if decomposition_table is None:
+        decomposition_table = get_decomposition_table()
+    decomposed_progs = {}
+    for func_name, prog in progs.items():
+        if decomposition_table:
+            prog = prog.run_decompositions(decomposition_table)
+        if enable_graph_printing:
+            prog.graph_module.print_readable()
+        decomposed_progs[func_name] = prog
+    if experimental_support_mutation:
+        if torch.__version__ < "2.3.0.dev20240207":
+            warnings.warn("Mutable program import only supported on PyTorch 2.3+")
+    fx_importer.import_programs(
+        decomposed_progs, frozen=not experimental_support_mutation
+    )
+    if enable_import_stats:
+        _print_import_stats(fx_importer)
 
     return _module_lowering(
-        enable_ir_printing, OutputType.get(output_type), fx_importer.module
+        enable_ir_printing,
+        OutputType.get(output_type),
+        fx_importer.module,
+        fuse_pipelines=fuse_pipelines,
+        pass_report=pass_report,
+        output_file=output_file,
     )
 
 
+class ShapeBucket(NamedTuple):
+    """A static specialization of a `BucketedModule`."""
+
+    func_name: str
+    # Example arguments that the function was exported with.
+    args: Tuple[Any, ...]
+
+
+class BucketedModule:
+    """A module with one function per shape bucket, and their dispatcher.
+
+    Buckets are ordered from smallest to largest (by the number of elements of
+    their tensor arguments). `dispatch` selects the smallest bucket that fits
+    the given arguments and pads them to its shapes, so that dynamic shapes
+    can be served by static specializations.
+    """
+
+    def __init__(self, module: ir.Module, buckets: List[ShapeBucket]):
+        self.module = module
+        self.buckets = buckets
+
+    @staticmethod
+    def _fits(bucket: ShapeBucket, args: Sequence[Any]) -> bool:
+        if len(args) != len(bucket.args):
+            return False
+        for arg, bucket_arg in zip(args, bucket.args):
+            if isinstance(bucket_arg, torch.Tensor):
+                if (
+                    not isinstance(arg, torch.Tensor)
+                    or arg.dtype != bucket_arg.dtype
+                    or arg.dim() != bucket_arg.dim()
+                    or any(a > b for a, b in zip(arg.shape, bucket_arg.shape))
+                ):
+                    return False
+            elif arg != bucket_arg:
+                return False
+        return True
+
+    def select(self, *args) -> ShapeBucket:
+        """Returns the smallest bucket that fits `args`."""
+        for bucket in self.buckets:
+            if self._fits(bucket, args):
+                return bucket
+        raise ValueError(
+            "No shape bucket fits the arguments (shapes "
+            f"{[tuple(a.shape) for a in args if isinstance(a, torch.Tensor)]})"
+        )
+
+    def dispatch(self, *args, pad_value: float = 0) -> Tuple[str, List[Any]]:
+        """Returns the function to call for `args` and the padded arguments.
+
+        Tensors are padded at the end of each dimension with `pad_value`. This
+        is only correct for models whose results along the padded dimensions
+        are independent (such as a batch dimension): the caller is
+        responsible for slicing the padding off of the results.
+        """
+        bucket = self.select(*args)
+        padded = []
+        for arg, bucket_arg in zip(args, bucket.args):
+            if isinstance(arg, torch.Tensor) and arg.shape != bucket_arg.shape:
+                pad = []
+                for size, bucket_size in reversed(
+                    list(zip(arg.shape, bucket_arg.shape))
+                ):
+                    pad += [0, bucket_size - size]
+                arg = F.pad(arg, pad, value=pad_value)
+            padded.append(arg)
+        return bucket.func_name, padded
+
+
+def export_and_import_buckets(
+    f: nn.Module,
+    bucket_args: Sequence[Tuple[Any, ...]],
+    *,
+    output_type: Union[str, OutputType] = OutputType.TORCH,
+    func_name: str = "main",
+    **kwargs,
+) -> BucketedModule:
+    """Exports and lowers `f` once per bucket of example arguments.
+
+    Each bucket is exported with static shapes and imported as the function
+    `{func_name}_{index}` of a single module (see `import_programs`), so the
+    parameters of `f` are shared between the buckets. Other keyword arguments
+    are passed to `import_programs`.
+    """
+
+    def numel(args):
+        return sum(a.numel() for a in args if isinstance(a, torch.Tensor))
+
+    buckets = [
+        ShapeBucket(f"{func_name}_{i}", tuple(args))
+        for i, args in enumerate(sorted(bucket_args, key=numel))
+    ]
+    progs = {
+        bucket.func_name: torch.export.export(f, bucket.args) for bucket in buckets
+    }
+    module = import_programs(progs, output_type=output_type, **kwargs)
+    return BucketedModule(module, buckets)
+
+
 def stateless_fx_import(
     gm: torch.fx.GraphModule,
     output_type: Union[str, OutputType] = OutputType.TORCH,
@@ -105,14 +449,51 @@ def stateless_fx_import(
     model_name: str = "main",
     enable_graph_printing: bool = False,
     enable_ir_printing: bool = False,
+    enable_import_stats: bool = False,
+    fuse_pipelines: bool = False,
+    pass_report: Optional[PassReport] = None,
+    cache: Optional[CompileCache] = None,
+    context: Optional[ir.Context] = None,
+    output_file: Optional[OutputFile] = None,
 ):
+    _check_cacheable(cache, fx_importer, hooks)
     if enable_graph_printing:
         gm.print_readable()
-    context = ir.Context()
-    torch_d.register_dialect(context)
+    context = _new_context() if context is None else context
+    cache_key = None
+    if cache is not None:
+        cache_key = fingerprint(
+            gm.code,
+            [
+                _input_spec(node.meta.get("val"))
+                for node in gm.graph.nodes
+                if node.op == "placeholder"
+            ],
+            gm.state_dict(),
+            str(OutputType.get(output_type)),
+            model_name,
+            fuse_pipelines,
+        )
+        module = cache.get(cache_key, context)
+        if module is not None:
+            if output_file is not None:
+                write_bytecode(module, output_file)
+            return module
     if fx_importer is None:
-        fx_importer = FxImporter(context=context, hooks=hooks)
+        fx_importer = FxImporter(
+            context=context, hooks=hooks, collect_stats=enable_import_stats
+        )
     fx_importer.import_stateless_graph(gm.graph, func_name=model_name)
-    return _module_lowering(
-        enable_ir_printing, OutputType.get(output_type), fx_importer.module
+    if enable_import_stats:
+        _print_import_stats(fx_importer)
+    module = _module_lowering(
+        enable_ir_printing,
+        OutputType.get(output_type),
+        fx_importer.module,
+        fuse_pipelines=fuse_pipelines,
+        pass_report=pass_report,
+        output_file=output_file,
     )
+    if cache is not None:
+        cache.put(cache_key, module)
+    return module
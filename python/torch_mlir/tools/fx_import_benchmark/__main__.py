@@ -0,0 +1,368 @@
+# Part of the LLVM Project, under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+# Also available under a BSD-style license. See LICENSE.
+
+"""Micro-benchmarks for the FX importer.
+
+Each scenario is run in a fresh subprocess so that peak RSS numbers are
+attributable to a single measurement. Invoke as:
+
+  python -m torch_mlir.tools.fx_import_benchmark literals --sizes-mb 1 64 512
+  python -m torch_mlir.tools.fx_import_benchmark nodes --num-nodes 100000 \
+      --graphs transformer rnn moe
+  python -m torch_mlir.tools.fx_import_benchmark contexts --num-imports 1000
+  python -m torch_mlir.tools.fx_import_benchmark serialize --sizes-mb 64 1024
+"""
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+from torch.fx.experimental.proxy_tensor import make_fx
+
+from ... import fx
+from ...compiler_utils import write_bytecode
+from ...context_pool import ContextPool
+from ...dialects import torch as torch_d
+from ...extras.fx_importer import FxImporter
+from ...ir import Context
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss is reported in KiB on Linux and bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return rss / (1024 * 1024)
+    return rss / 1024
+
+
+def _new_importer(**kwargs) -> FxImporter:
+    context = Context()
+    torch_d.register_dialect(context)
+    return FxImporter(context=context, **kwargs)
+
+
+def _measure(setup: Callable[[], Callable[[], None]]) -> Dict[str, float]:
+    """Runs `setup()` and then times the callable that it returns."""
+    body = setup()
+    start = time.perf_counter()
+    body()
+    elapsed = time.perf_counter() - start
+    return {
+        "seconds": elapsed,
+        "peak_rss_mb": _max_rss_mb(),
+    }
+
+
+def _run_isolated(fn, *args) -> Dict[str, float]:
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        return pool.apply(fn, args)
+
+
+################################################################################
+# Scenarios
+################################################################################
+
+
+def _literals_case(size_mb: int, dtype_name: str) -> Dict[str, float]:
+    dtype = getattr(torch, dtype_name)
+    numel = size_mb * 1024 * 1024 // torch.empty((), dtype=dtype).element_size()
+
+    class Weights(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.w = nn.Parameter(torch.ones(numel, dtype=dtype))
+
+        def forward(self, x):
+            return x + self.w
+
+    def setup():
+        prog = torch.export.export(Weights(), (torch.ones(numel, dtype=dtype),))
+
+        def body():
+            _new_importer().import_frozen_program(prog)
+
+        return body
+
+    return _measure(setup)
+
+
+def _serialize_case(size_mb: int, fmt: str) -> Dict[str, float]:
+    numel = size_mb * 1024 * 1024 // 4
+
+    class Weights(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.w = nn.Parameter(torch.ones(numel))
+
+        def forward(self, x):
+            return x + self.w
+
+    result = {}
+
+    def setup():
+        prog = torch.export.export(Weights(), (torch.ones(numel),))
+        importer = _new_importer()
+        importer.import_frozen_program(prog)
+        del prog
+        # Peak RSS before serializing, which is the baseline for the
+        # serialization overhead.
+        result["import_rss_mb"] = _max_rss_mb()
+
+        def body():
+            with tempfile.TemporaryFile() as f:
+                if fmt == "bytecode":
+                    write_bytecode(importer.module, f)
+                else:
+                    f.write(str(importer.module).encode())
+                result["file_mb"] = os.fstat(f.fileno()).st_size / (1024 * 1024)
+
+        return body
+
+    result.update(_measure(setup))
+    return result
+
+
+def run_literals(args: argparse.Namespace):
+    print(f"{'dtype':>10} {'size_mb':>10} {'seconds':>10} {'peak_rss_mb':>12}")
+    for dtype_name in args.dtypes:
+        for size_mb in args.sizes_mb:
+            r = _run_isolated(_literals_case, size_mb, dtype_name)
+            print(
+                f"{dtype_name:>10} {size_mb:>10} {r['seconds']:>10.3f} "
+                f"{r['peak_rss_mb']:>12.1f}"
+            )
+
+
+def run_serialize(args: argparse.Namespace):
+    print(
+        f"{'format':>10} {'size_mb':>10} {'seconds':>10} {'file_mb':>10} "
+        f"{'import_rss_mb':>14} {'peak_rss_mb':>12} {'overhead_mb':>12}"
+    )
+    for size_mb in args.sizes_mb:
+        for fmt in args.formats:
+            r = _run_isolated(_serialize_case, size_mb, fmt)
+            overhead = r["peak_rss_mb"] - r["import_rss_mb"]
+            print(
+                f"{fmt:>10} {size_mb:>10} {r['seconds']:>10.3f} "
+                f"{r['file_mb']:>10.1f} {r['import_rss_mb']:>14.1f} "
+                f"{r['peak_rss_mb']:>12.1f} {overhead:>12.1f}"
+            )
+
+
+class _UncachedRecords(dict):
+    """Stand-in for the importer's dispatch record memo that never retains."""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def _unrolled_graph(block, num_nodes: int) -> torch.fx.GraphModule:
+    """Traces `block` unrolled into a graph of ~num_nodes nodes."""
+    probe = make_fx(block, tracing_mode="fake")(torch.ones(4, 16))
+    nodes_per_block = len(probe.graph.nodes) - 2
+    num_blocks = max(1, num_nodes // nodes_per_block)
+
+    def model(x):
+        for _ in range(num_blocks):
+            x = block(x)
+        return x
+
+    return make_fx(model, tracing_mode="fake")(torch.ones(4, 16))
+
+
+def _transformer_block(x):
+    # Attention-like block of single result ops.
+    h = torch.matmul(x, x.transpose(-1, -2))
+    h = torch.softmax(h * 0.125, dim=-1)
+    h = torch.matmul(h, x)
+    x = F.layer_norm(x + h, x.shape[-1:])
+    return F.gelu(x) + x
+
+
+def _rnn_block(x):
+    # LSTM-like cell step: gates are projected out of a multi-result split.
+    i, f, g, o = torch.split(torch.matmul(x, x.transpose(-1, -2)), 1, dim=-1)
+    c = torch.sigmoid(f) * x + torch.sigmoid(i) * torch.tanh(g)
+    return torch.sigmoid(o) * torch.tanh(c)
+
+
+def _moe_block(x):
+    # Top-2 router: multi-result topk/max followed by gathers.
+    logits = torch.matmul(x, x.transpose(-1, -2))
+    weights, experts = torch.topk(torch.softmax(logits, dim=-1), 2, dim=-1)
+    best, _ = torch.max(weights, dim=-1, keepdim=True)
+    routed = torch.gather(x, -1, experts) * (weights / best)
+    return x + routed.sum(-1, keepdim=True)
+
+
+_GRAPH_BLOCKS = {
+    "transformer": _transformer_block,
+    "rnn": _rnn_block,
+    "moe": _moe_block,
+}
+
+
+def _nodes_case(
+    graph_name: str, num_nodes: int, cache_dispatch: bool
+) -> Dict[str, float]:
+    def setup():
+        gm = _unrolled_graph(_GRAPH_BLOCKS[graph_name], num_nodes)
+
+        def body():
+            importer = _new_importer()
+            if not cache_dispatch:
+                importer._op_dispatch_records = _UncachedRecords()
+            importer.import_stateless_graph(gm.graph)
+
+        return body
+
+    result = _measure(setup)
+    result["num_nodes"] = num_nodes
+    return result
+
+
+def run_nodes(args: argparse.Namespace):
+    print(
+        f"{'graph':>12} {'cached':>8} {'num_nodes':>10} {'seconds':>10} "
+        f"{'us/node':>10}"
+    )
+    for graph_name in args.graphs:
+        for cache_dispatch in (False, True):
+            for num_nodes in args.num_nodes:
+                r = _run_isolated(_nodes_case, graph_name, num_nodes, cache_dispatch)
+                per_node = r["seconds"] * 1e6 / num_nodes
+                print(
+                    f"{graph_name:>12} {str(cache_dispatch):>8} {num_nodes:>10} "
+                    f"{r['seconds']:>10.3f} {per_node:>10.2f}"
+                )
+
+
+def _contexts_case(
+    mode: str, num_imports: int, max_uses: int, lower: bool
+) -> Dict[str, float]:
+    def setup():
+        gm = make_fx(_transformer_block, tracing_mode="fake")(torch.ones(4, 16))
+        pool = ContextPool(max_uses=max_uses)
+        output_type = "torch" if lower else "raw"
+
+        def body():
+            for _ in range(num_imports):
+                if mode == "fresh":
+                    fx.stateless_fx_import(gm, output_type=output_type)
+                elif mode == "thread":
+                    fx.stateless_fx_import(
+                        gm, output_type=output_type, context=pool.thread_context()
+                    )
+                else:
+                    with pool.checkout() as context:
+                        fx.stateless_fx_import(
+                            gm, output_type=output_type, context=context
+                        )
+
+        return body
+
+    return _measure(setup)
+
+
+def run_contexts(args: argparse.Namespace):
+    print(
+        f"{'mode':>10} {'lower':>6} {'num_imports':>12} {'seconds':>10} "
+        f"{'us/import':>10} {'peak_rss_mb':>12}"
+    )
+    for lower in (False, True):
+        for mode in args.modes:
+            r = _run_isolated(
+                _contexts_case, mode, args.num_imports, args.max_uses, lower
+            )
+            per_import = r["seconds"] * 1e6 / args.num_imports
+            print(
+                f"{mode:>10} {str(lower):>6} {args.num_imports:>12} "
+                f"{r['seconds']:>10.3f} {per_import:>10.1f} "
+                f"{r['peak_rss_mb']:>12.1f}"
+            )
+
+
+################################################################################
+# Main
+################################################################################
+
+
+def _cli_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="fx_import_benchmark", description="FX importer micro-benchmarks"
+    )
+    subparsers = parser.add_subparsers(dest="scenario", required=True)
+
+    literals = subparsers.add_parser(
+        "literals",
+        help="Import time and peak RSS of frozen tensor literals vs tensor size",
+    )
+    literals.add_argument(
+        "--sizes-mb", type=int, nargs="+", default=[1, 16, 64, 256, 1024]
+    )
+    literals.add_argument(
+        "--dtypes", nargs="+", default=["float32", "bfloat16", "int8"]
+    )
+    literals.set_defaults(func=run_literals)
+
+    nodes = subparsers.add_parser(
+        "nodes",
+        help="Per-node import overhead on large unrolled graphs",
+    )
+    nodes.add_argument("--num-nodes", type=int, nargs="+", default=[100000])
+    nodes.add_argument(
+        "--graphs",
+        nargs="+",
+        choices=sorted(_GRAPH_BLOCKS),
+        default=["transformer", "rnn", "moe"],
+    )
+    nodes.set_defaults(func=run_nodes)
+
+    contexts = subparsers.add_parser(
+        "contexts",
+        help="Per-import overhead of fresh vs pooled contexts on a small graph",
+    )
+    contexts.add_argument("--num-imports", type=int, default=1000)
+    contexts.add_argument("--max-uses", type=int, default=64)
+    contexts.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["fresh", "thread", "checkout"],
+        default=["fresh", "thread", "checkout"],
+    )
+    contexts.set_defaults(func=run_contexts)
+
+    serialize = subparsers.add_parser(
+        "serialize",
+        help="Time and peak RSS of writing a module as bytecode vs as text",
+    )
+    serialize.add_argument(
+        "--sizes-mb", type=int, nargs="+", default=[16, 256, 1024, 4096]
+    )
+    serialize.add_argument(
+        "--formats",
+        nargs="+",
+        choices=["bytecode", "asm"],
+        default=["bytecode", "asm"],
+    )
+    serialize.set_defaults(func=run_serialize)
+    return parser
+
+
+def _main(argv: List[str]):
+    args = _cli_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    _main(sys.argv[1:])
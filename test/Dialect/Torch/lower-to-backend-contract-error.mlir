@@ -1,4 +1,5 @@
 // RUN: torch-mlir-opt -torch-lower-to-backend-contract -split-input-file -verify-diagnostics %s
+// RUN: torch-mlir-opt -torch-lower-to-backend-contract="incremental=true" -split-input-file -verify-diagnostics %s
 
 torch.global_slot.module_initializer {
   %0 = torch.constant.int 1
@@ -54,6 +55,22 @@ func.func @f(%arg0: !torch.vtensor<[?,?,?],f32>) -> !torch.vtensor<[?,?,?],f32>
 
 // -----
 
+// In incremental mode, only @f is simplified after the first iteration, and
+// its illegal op is still reported.
+func.func @legal(%arg0: !torch.vtensor<[3,4],f32>) -> !torch.vtensor<[3,4],f32> {
+  %0 = torch.aten.tanh %arg0 : !torch.vtensor<[3,4],f32> -> !torch.vtensor<[3,4],f32>
+  return %0 : !torch.vtensor<[3,4],f32>
+}
+
+func.func @f(%arg0: !torch.vtensor<[?,?,?],f32>) -> !torch.vtensor<[?,?,?],f32> {
+  // expected-error @+2 {{found an op that was marked as backend illegal}}
+  // expected-note @+1 {{this is likely due to}}
+  %t = torch.aten.t %arg0 : !torch.vtensor<[?,?,?],f32> -> !torch.vtensor<[?,?,?],f32>
+  return %t : !torch.vtensor<[?,?,?],f32>
+}
+
+// -----
+
 // Test case: checking of op results.
 // TODO: In theory we could diagnose every single value, but for now we bail out on the first one.
 
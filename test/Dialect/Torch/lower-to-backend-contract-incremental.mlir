@@ -0,0 +1,45 @@
+// RUN: torch-mlir-opt -pass-pipeline='builtin.module(torch-function-to-torch-backend-pipeline{backend-legal-ops=aten.square})' %s | FileCheck %s
+// RUN: torch-mlir-opt -pass-pipeline='builtin.module(torch-function-to-torch-backend-pipeline{backend-legal-ops=aten.square incremental=true})' %s | FileCheck %s
+
+// In incremental mode, the functions that already satisfy the backend
+// contract after the first iteration are not simplified again. The result
+// must be the same as when simplifying the whole module in every iteration.
+
+// CHECK-LABEL: func.func @already_legal(
+// CHECK-SAME:      %[[ARG:.*]]: !torch.vtensor<[3,4],f32>) -> !torch.vtensor<[3,4],f32> {
+// CHECK:         %[[TANH:.*]] = torch.aten.tanh %[[ARG]] : !torch.vtensor<[3,4],f32> -> !torch.vtensor<[3,4],f32>
+// CHECK:         return %[[TANH]] : !torch.vtensor<[3,4],f32>
+func.func @already_legal(%arg0: !torch.vtensor<[3,4],f32>) -> !torch.vtensor<[3,4],f32> {
+  %0 = torch.aten.tanh %arg0 : !torch.vtensor<[3,4],f32> -> !torch.vtensor<[3,4],f32>
+  return %0 : !torch.vtensor<[3,4],f32>
+}
+
+// CHECK-LABEL: func.func @backend_legal(
+// CHECK:         torch.aten.square
+// CHECK-SAME:      !torch.vtensor<[?,?,?],f32> -> !torch.vtensor<[?,?,?],f32>
+func.func @backend_legal(%arg0: !torch.vtensor<[?,?,?],f32>) -> !torch.vtensor<[?,?,?],f32> {
+  %0 = torch.aten.square %arg0 : !torch.vtensor<[?,?,?],f32> -> !torch.vtensor<[?,?,?],f32>
+  return %0 : !torch.vtensor<[?,?,?],f32>
+}
+
+// CHECK-LABEL: func.func @needs_refinement(
+// CHECK-SAME:      %{{.*}}: !torch.vtensor<[3,4],f32>) -> !torch.vtensor<[12],f32> {
+// CHECK-NOT:     torch.aten.reshape
+// CHECK:         torch.aten.view
+// CHECK-SAME:      -> !torch.vtensor<[12],f32>
+func.func @needs_refinement(%arg0: !torch.tensor {torch.type_bound = !torch.vtensor<[3,4],f32>}) -> !torch.tensor {
+  %int12 = torch.constant.int 12
+  %0 = torch.prim.ListConstruct %int12 : (!torch.int) -> !torch.list<int>
+  %1 = torch.aten.reshape %arg0, %0 : !torch.tensor, !torch.list<int> -> !torch.tensor
+  return %1 : !torch.tensor
+}
+
+// CHECK-LABEL: func.func @needs_decomposition(
+// CHECK-SAME:      %{{.*}}: !torch.vtensor<[3,4],f32>) -> !torch.vtensor<[4,3],f32> {
+// CHECK-NOT:     torch.aten.t{{ }}
+// CHECK:         torch.aten.transpose.int
+// CHECK-SAME:      -> !torch.vtensor<[4,3],f32>
+func.func @needs_decomposition(%arg0: !torch.tensor {torch.type_bound = !torch.vtensor<[3,4],f32>}) -> !torch.tensor {
+  %0 = torch.aten.t %arg0 : !torch.tensor -> !torch.tensor
+  return %0 : !torch.tensor
+}
@@ -36,3 +36,47 @@ def test_enable_ir_printing():
 
 # CHECK: // -----// IR Dump Before Canonicalizer (canonicalize)
 # CHECK-NEXT: module attributes {torch.debug_module_name = "TinyModel"} {
+
+
+# CHECK-LABEL: TEST: test_import_cache
+# CHECK: hits: 0 misses: 1
+# CHECK: hits: 1 misses: 1
+# CHECK: hits: 1 misses: 2
+# CHECK: hits: 1 misses: 3
+@run_test
+def test_import_cache():
+    cache = torchscript.ImportCache()
+    model = TinyModel()
+
+    def compile_model(*shape, output_type):
+        torchscript.compile(
+            model, torch.ones(*shape), output_type=output_type, import_cache=cache
+        )
+        print("hits:", cache.hits, "misses:", cache.misses, file=sys.stderr)
+
+    compile_model(1, 20, output_type="torch")
+    # Only the output type changed, so the imported module is reused.
+    compile_model(1, 20, output_type="linalg-on-tensors")
+    # The shapes changed, so the (already scripted) model is imported again.
+    compile_model(4, 20, output_type="torch")
+    # The weights were updated in place, so the model is imported again.
+    with torch.no_grad():
+        model.linear.weight.add_(1)
+    compile_model(4, 20, output_type="torch")
+
+
+# CHECK-LABEL: TEST: test_import_cache_releases_models
+# CHECK: entries: 2
+# CHECK: entries: 0
+@run_test
+def test_import_cache_releases_models():
+    cache = torchscript.ImportCache()
+    model = TinyModel()
+    scripted = torch.jit.script(TinyModel())
+    for m in (model, scripted):
+        torchscript.compile(m, torch.ones(1, 20), import_cache=cache)
+    print("entries:", len(cache._entries), file=sys.stderr)
+    # The cache does not keep the models, including ScriptModules, alive.
+    del model, scripted, m
+    gc.collect()
+    print("entries:", len(cache._entries), file=sys.stderr)
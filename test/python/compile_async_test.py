@@ -0,0 +1,116 @@
+# Part of the LLVM Project, under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+# Also available under a BSD-style license. See LICENSE.
+
+# RUN: %PYTHON %s | FileCheck %s
+
+import time
+
+import torch
+
+from torch_mlir import fx, ir
+from torch_mlir.compile_async import compile_async, new_executor
+from torch_mlir.compiler_utils import PassReport
+from torch_mlir.dialects import torch as torch_d
+
+
+def run(f):
+    print(f"{f.__name__}")
+    print("-" * len(f.__name__))
+    f()
+    print()
+
+
+class Tanh(torch.nn.Module):
+    def forward(self, x):
+        return torch.tanh(x)
+
+
+class Sigmoid(torch.nn.Module):
+    def forward(self, x):
+        return torch.sigmoid(x)
+
+
+# CHECK-LABEL: test_compile_async
+# CHECK: func.func @main(%arg0: !torch.vtensor<[3,4],f32>)
+# CHECK: torch.aten.tanh
+# CHECK: func.func @main(%arg0: !torch.vtensor<[5],f32>)
+# CHECK: torch.aten.sigmoid
+# CHECK: in caller context: True
+# CHECK: stages: ['Lowering TorchFX IR -> Torch Backend IR']
+def test_compile_async():
+    context = ir.Context()
+    torch_d.register_dialect(context)
+    report = PassReport()
+    with new_executor(max_workers=2) as executor:
+        futures = [
+            compile_async(
+                fx.export_and_import,
+                Tanh(),
+                torch.randn(3, 4),
+                output_type="torch",
+                pass_report=report,
+                executor=executor,
+                context=context,
+            ),
+            compile_async(
+                fx.export_and_import,
+                Sigmoid(),
+                torch.randn(5),
+                executor=executor,
+                context=context,
+            ),
+        ]
+        modules = [f.result() for f in futures]
+    for m in modules:
+        print(m)
+    print("in caller context:", all(m.context is context for m in modules))
+    print("stages:", [stage["description"] for stage in report.stages])
+
+
+# CHECK-LABEL: test_compile_async_error
+# CHECK: raised: ValueError: For output_type= argument, expected one of:
+def test_compile_async_error():
+    with new_executor(max_workers=1) as executor:
+        future = compile_async(
+            fx.export_and_import,
+            Tanh(),
+            torch.randn(3),
+            output_type="bogus",
+            executor=executor,
+        )
+        try:
+            future.result()
+        except Exception as e:
+            print(f"raised: {type(e).__name__}: {e}")
+
+
+def _slow_export_and_import(*args, **kwargs):
+    time.sleep(2)
+    return fx.export_and_import(*args, **kwargs)
+
+
+# CHECK-LABEL: test_compile_async_cancel
+# CHECK: cancel: True cancelled: True
+# CHECK: first done: True
+def test_compile_async_cancel():
+    with new_executor(max_workers=1) as executor:
+        first = compile_async(
+            _slow_export_and_import, Tanh(), torch.randn(3), executor=executor
+        )
+        # Queued behind `first` in the single worker, so it has not started.
+        second = compile_async(
+            fx.export_and_import, Sigmoid(), torch.randn(3), executor=executor
+        )
+        print(f"cancel: {second.cancel()} cancelled: {second.cancelled()}")
+        first.result()
+        print("first done:", first.done())
+
+
+# Workers are spawned and re-import this file, so only run the tests in the
+# parent.
+if __name__ == "__main__":
+    run(test_compile_async)
+    run(test_compile_async_error)
+    run(test_compile_async_cancel)
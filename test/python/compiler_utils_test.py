@@ -0,0 +1,119 @@
+# Part of the LLVM Project, under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+# Also available under a BSD-style license. See LICENSE.
+
+# RUN: %PYTHON %s | FileCheck %s
+
+import json
+import os
+import tempfile
+
+from torch_mlir import ir
+from torch_mlir.compiler_utils import (
+    PassReport,
+    TorchMlirCompilerError,
+    run_pipeline_with_repro_report,
+)
+from torch_mlir.dialects import torch as torch_d
+
+
+def run(f):
+    print(f"{f.__name__}")
+    print("-" * len(f.__name__))
+    f()
+    print()
+
+
+TORCH_MODULE_ASM = """
+module attributes {torch.debug_module_name = "ReproReportTest"} {
+  func.func @main(%arg0: !torch.vtensor<[2],f32>) -> !torch.vtensor<[2],f32> {
+    return %arg0 : !torch.vtensor<[2],f32>
+  }
+}
+"""
+
+# Fails on any module that still has torch types.
+FAILING_PIPELINE = "builtin.module(torch-verify-linalg-on-tensors-backend-contract)"
+
+
+def run_failing_pipeline(repro_mode: str):
+    context = ir.Context()
+    torch_d.register_dialect(context)
+    module = ir.Module.parse(TORCH_MODULE_ASM, context)
+    try:
+        run_pipeline_with_repro_report(
+            module, FAILING_PIPELINE, "Verify", repro_mode=repro_mode
+        )
+    except TorchMlirCompilerError as e:
+        message = str(e)
+        print(message[message.index("python exception") :])
+
+
+@run
+# CHECK-LABEL: test_repro_mode
+# CHECK: eager:
+# CHECK: $ torch-mlir-opt -pass-pipeline='builtin.module(torch-verify-linalg-on-tensors-backend-contract)' {{.*}}ReproReportTest.mlir
+# CHECK: lazy:
+# CHECK: $ torch-mlir-opt -pass-pipeline='builtin.module(torch-verify-linalg-on-tensors-backend-contract)' {{.*}}ReproReportTest.mlir
+# CHECK: lazy repro: func.func @main(%arg0: !torch.vtensor<[2],f32>)
+# CHECK: off:
+# CHECK: No reproducer was captured
+def test_repro_mode():
+    for repro_mode in ["eager", "lazy", "off"]:
+        print(f"{repro_mode}:")
+        run_failing_pipeline(repro_mode)
+        if repro_mode == "lazy":
+            filename = os.path.join(tempfile.gettempdir(), "ReproReportTest.mlir")
+            with open(filename) as f:
+                repro = f.read()
+            print("lazy repro:", repro[repro.index("func.func") :].splitlines()[0])
+
+
+@run
+# CHECK-LABEL: test_pass_report
+# CHECK: stages: ['Canonicalize']
+# CHECK: canonicalize: count=1 timed=True has_statistics=True
+# CHECK: Canonicalize: {{[0-9.]+}} ms
+# CHECK: canonicalize
+def test_pass_report():
+    context = ir.Context()
+    torch_d.register_dialect(context)
+    module = ir.Module.parse(TORCH_MODULE_ASM, context)
+    report = PassReport(timing=True, pass_statistics=True)
+    run_pipeline_with_repro_report(
+        module,
+        "builtin.module(func.func(canonicalize))",
+        "Canonicalize",
+        pass_report=report,
+    )
+    stages = json.loads(report.to_json())["stages"]
+    print("stages:", [stage["description"] for stage in stages])
+    for p in stages[0]["passes"]:
+        if p["pass"] == "canonicalize":
+            print(
+                f"canonicalize: count={p['count']} timed={'seconds' in p} "
+                f"has_statistics={'statistics' in p}"
+            )
+    print(report.format_table())
+
+
+@run
+# CHECK-LABEL: test_failure_diagnostics
+# CHECK: Verify failed with the following diagnostics:
+# CHECK: reports contract error: True
+def test_failure_diagnostics():
+    context = ir.Context()
+    torch_d.register_dialect(context)
+    module = ir.Module.parse(TORCH_MODULE_ASM, context)
+    try:
+        run_pipeline_with_repro_report(
+            module, FAILING_PIPELINE, "Verify", repro_mode="off"
+        )
+    except TorchMlirCompilerError as e:
+        message = str(e)
+        print(message.splitlines()[0])
+        print(
+            "reports contract error:",
+            "does not conform to the linalg-on-tensors backend contract" in message,
+        )
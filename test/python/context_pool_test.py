@@ -0,0 +1,112 @@
+# Part of the LLVM Project, under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+# Also available under a BSD-style license. See LICENSE.
+
+# RUN: %PYTHON %s | FileCheck %s
+
+import gc
+import threading
+
+import torch
+
+from torch_mlir import fx, ir
+from torch_mlir.compiler_utils import PassReport
+from torch_mlir.context_pool import ContextPool, pass_manager_cache
+
+
+def run(f):
+    print(f"{f.__name__}")
+    print("-" * len(f.__name__))
+    f()
+    print()
+
+
+class Basic(torch.nn.Module):
+    def forward(self, x):
+        return torch.tanh(x)
+
+
+@run
+# CHECK-LABEL: test_thread_context
+# CHECK: same context: True
+# CHECK: created: 2
+# CHECK: other thread: True
+# CHECK: created after retirement: 3
+def test_thread_context():
+    pool = ContextPool(max_uses=2)
+    m1 = fx.export_and_import(Basic(), torch.randn(3, 4), context=pool.thread_context())
+    m2 = fx.export_and_import(Basic(), torch.randn(3, 4), context=pool.thread_context())
+    print("same context:", m1.context is m2.context)
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.thread_context()))
+    thread.start()
+    thread.join()
+    print("created:", pool.created)
+    print("other thread:", other[0] is not m1.context)
+
+    pool.thread_context()
+    print("created after retirement:", pool.created)
+
+
+@run
+# CHECK-LABEL: test_checkout
+# CHECK: func.func @main(%arg0: !torch.vtensor<[3,4],f32>)
+# CHECK: reused: True
+# CHECK: concurrent distinct: True
+# CHECK: created: 2
+def test_checkout():
+    pool = ContextPool()
+    with pool.checkout() as context:
+        print(fx.export_and_import(Basic(), torch.randn(3, 4), context=context))
+    first = context
+    with pool.checkout() as context:
+        print("reused:", context is first)
+        with pool.checkout() as nested:
+            print("concurrent distinct:", nested is not context)
+    print("created:", pool.created)
+
+
+@run
+# CHECK-LABEL: test_checkout_with_live_module
+# CHECK: reused while module alive: False
+# CHECK: reused after module released: True
+def test_checkout_with_live_module():
+    pool = ContextPool()
+    with pool.checkout() as context:
+        m = fx.export_and_import(Basic(), torch.randn(3, 4), context=context)
+    # The module of the previous owner keeps its context out of the pool.
+    with pool.checkout() as context:
+        print("reused while module alive:", context is m.context)
+    first = m.context
+    del m
+    gc.collect()
+    with pool.checkout() as context:
+        print("reused after module released:", context is first)
+
+
+@run
+# CHECK-LABEL: test_pass_manager_cache
+# CHECK: unpooled: None
+# CHECK: cached pipelines: 2
+# CHECK: reused: True
+# CHECK: instrumented runs cached: False
+def test_pass_manager_cache():
+    print("unpooled:", pass_manager_cache(ir.Context()))
+    pool = ContextPool()
+    context = pool.thread_context()
+
+    def compile(x, **kwargs):
+        fx.export_and_import(
+            Basic(), x, output_type="linalg-on-tensors", context=context, **kwargs
+        )
+
+    compile(torch.randn(3, 4))
+    cache = pass_manager_cache(context)
+    print("cached pipelines:", len(cache))
+    pass_managers = list(cache.values())
+    compile(torch.randn(2, 4))
+    print("reused:", all(a is b for a, b in zip(cache.values(), pass_managers)))
+    compile(torch.randn(3, 4), pass_report=PassReport())
+    print("instrumented runs cached:", len(cache) > 2)
@@ -5,11 +5,15 @@
 
 # RUN: %PYTHON %s | FileCheck %s
 
+import io
+import json
+import operator
 from typing import List
 
 import torch
 import torch.nn as nn
 from torch.export import Dim
+from torch.fx.passes.shape_prop import _extract_tensor_metadata
 from torch._dynamo.backends.common import aot_autograd
 from torch._functorch.aot_autograd import (
     make_boxed_compiler,
@@ -17,8 +21,11 @@ from torch._functorch.aot_autograd import (
     set_model_name,
 )
 
-from torch_mlir import fx
+from torch_mlir import fx, ir
+from torch_mlir.dialects import torch as torch_d
 from torch_mlir.compiler_utils import run_pipeline_with_repro_report
+from torch_mlir.extras import fx_importer as fx_importer_module
+from torch_mlir.extras.fx_importer import FxImporter, ImportStats
 
 
 def run(f):
@@ -183,3 +190,292 @@ def test_full():
         "torch-simplification-pipeline",
     )
     print(m)
+
+
+@run
+# CHECK-LABEL: test_import_non_contiguous_literal
+# CHECK: torch.vtensor.literal(dense_resource<torch_tensor_3_2_torch.int64> : tensor<3x2xsi64>) : !torch.vtensor<[3,2],si64>
+# CHECK: dialect_resources:
+# CHECK: torch_tensor_3_2_torch.int64: "0x{{[0-9A-F]{8}}}0000000000000000030000000000000001000000000000000400000000000000020000000000000005000000000000"
+def test_import_non_contiguous_literal():
+    # Literals are read directly from the tensor storage. Strided views must
+    # still be materialized in logical (row-major) order.
+    class Basic(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.b = torch.arange(6).reshape(2, 3).t()
+
+        def forward(self, x):
+            return x + self.b
+
+    m = fx.export_and_import(Basic(), torch.ones(3, 2, dtype=torch.int64))
+    print(m)
+
+
+@run
+# CHECK-LABEL: test_import_literal_aliases_tensor
+# CHECK: dialect_resources:
+# CHECK: torch_tensor_2_2_torch.float32: "0x{{[0-9A-F]{8}}}0000803F0000803F0000803F0000803F"
+# CHECK: dialect_resources:
+# CHECK: torch_tensor_2_2_torch.float32: "0x{{[0-9A-F]{8}}}00000040000000400000004000000040"
+def test_import_literal_aliases_tensor():
+    # Literals borrow the tensor storage instead of copying it, so in-place
+    # updates of the tensor after import are visible in the module.
+    class Basic(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.weight = nn.Parameter(torch.ones(2, 2))
+
+        def forward(self, x):
+            return x * self.weight
+
+    prog = torch.export.export(Basic(), (torch.randn(2, 2),))
+    context = ir.Context()
+    torch_d.register_dialect(context)
+    fx_importer = FxImporter(context=context)
+    fx_importer.import_frozen_program(prog)
+    print(fx_importer.module)
+    with torch.no_grad():
+        prog.state_dict["weight"].fill_(2.0)
+    print(fx_importer.module)
+
+
+@run
+# CHECK-LABEL: test_deduplicate_literals
+# CHECK-DAG: torch.vtensor.literal(dense_resource<[[R:torch_tensor_3_4_torch.float32]]> : tensor<3x4xf32>)
+# CHECK-DAG: torch.vtensor.literal(dense_resource<[[R]]> : tensor<3x4xf32>)
+# CHECK: dialect_resources:
+# CHECK-NOT: torch_tensor_3_4_torch.float32_
+# CHECK: deduplicated bytes: 48
+def test_deduplicate_literals():
+    class Basic(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.a = torch.randn(3, 4)
+            self.b = self.a.clone()
+
+        def forward(self, x):
+            return x * self.a + self.b
+
+    context = ir.Context()
+    torch_d.register_dialect(context)
+    fx_importer = FxImporter(context=context, deduplicate_literals=True)
+    m = fx.export_and_import(Basic(), torch.randn(3, 4), fx_importer=fx_importer)
+    print(m)
+    print("deduplicated bytes:", fx_importer.deduplicated_literal_bytes)
+
+
+@run
+# CHECK-LABEL: test_unique_literals
+# CHECK:     func.func @main
+# CHECK-DAG: %[[INT1:.+]] = torch.constant.int 1
+# CHECK-DAG: %[[FALSE:.+]] = torch.constant.bool false
+# CHECK-DAG: %[[NONE:.+]] = torch.constant.none
+# CHECK:     %[[DIMS:.+]] = torch.prim.ListConstruct %[[INT1]]
+# CHECK-NOT: torch.constant.int 1
+# CHECK-NOT: torch.constant.bool false
+# CHECK-NOT: torch.prim.ListConstruct
+# CHECK:     torch.aten.sum.dim_IntList %{{.+}}, %[[DIMS]], %[[FALSE]], %[[NONE]]
+# CHECK:     torch.aten.sum.dim_IntList %{{.+}}, %[[DIMS]], %[[FALSE]], %[[NONE]]
+# CHECK:     return
+# CHECK:     literals emitted < requested: True
+def test_unique_literals():
+    class Basic(nn.Module):
+        def forward(self, x):
+            y = torch.sum(x, dim=[1])
+            return torch.sum(torch.tanh(x), dim=[1]) + y
+
+    context = ir.Context()
+    torch_d.register_dialect(context)
+    fx_importer = FxImporter(context=context)
+    m = fx.export_and_import(Basic(), torch.randn(3, 4), fx_importer=fx_importer)
+    print(m)
+    counts = fx_importer.literal_op_counts
+    print("literals emitted < requested:", counts["emitted"] < counts["requested"])
+
+
+@run
+# CHECK-LABEL: test_location_mode
+# CHECK: first_frame:
+# CHECK: loc("{{.*}}basic_test.py":{{[0-9]+}}:0)
+# CHECK: none: unknown_only=True
+def test_location_mode():
+    class Basic(nn.Module):
+        def forward(self, x):
+            return torch.tanh(x)
+
+    for location_mode in ["first_frame", "none"]:
+        context = ir.Context()
+        torch_d.register_dialect(context)
+        fx_importer = FxImporter(context=context, location_mode=location_mode)
+        m = fx.export_and_import(Basic(), torch.randn(3, 4), fx_importer=fx_importer)
+        asm = m.operation.get_asm(enable_debug_info=True)
+        if location_mode == "none":
+            print(f"{location_mode}: unknown_only={'.py' not in asm}")
+        else:
+            print(f"{location_mode}: {asm}")
+
+
+@run
+# CHECK-LABEL: test_import_stats
+# CHECK: FX import: {{[0-9]+}} nodes in
+# CHECK: aten.tanh.default {{ +}}2
+# CHECK: tensor literals: 1 (48 bytes)
+# CHECK: type cache:
+# CHECK: location cache:
+# CHECK: json tanh count: 2
+def test_import_stats():
+    class Basic(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.a = torch.nn.Parameter(torch.randn(3, 4))
+
+        def forward(self, x):
+            return torch.tanh(torch.tanh(x) * self.a)
+
+    context = ir.Context()
+    torch_d.register_dialect(context)
+    fx_importer = FxImporter(context=context, collect_stats=True)
+    fx.export_and_import(
+        Basic(),
+        torch.randn(3, 4),
+        fx_importer=fx_importer,
+        enable_import_stats=True,
+    )
+    stats = json.loads(fx_importer.stats.to_json())
+    print("json tanh count:", stats["nodes"]["aten.tanh.default"]["count"])
+
+
+@run
+# CHECK-LABEL: test_getitem_of_single_result_node
+# CHECK: NotImplementedError: General getitem access to non-multi-result ops
+def test_getitem_of_single_result_node():
+    # Unsupported getitems are reported when imported, even if unused.
+    g = torch.fx.Graph()
+    x = g.placeholder("x")
+    x.meta["tensor_meta"] = _extract_tensor_metadata(torch.empty(3))
+    g.call_function(operator.getitem, (x, 0))
+    g.output((x,))
+    context = ir.Context()
+    torch_d.register_dialect(context)
+    try:
+        FxImporter(context=context).import_stateless_graph(g)
+    except NotImplementedError as e:
+        print(f"NotImplementedError: {e}")
+
+
+@run
+# CHECK-LABEL: test_import_stats_nested
+# CHECK: import_seconds: 2.0
+def test_import_stats_nested():
+    # A clock that advances by one second per reading: only the outermost
+    # import reads it twice.
+    clock = iter(range(100))
+    perf_counter = fx_importer_module.time.perf_counter
+    fx_importer_module.time.perf_counter = lambda: float(next(clock))
+    try:
+        stats = ImportStats()
+        with stats.time_import():
+            with stats.time_import():
+                pass
+    finally:
+        fx_importer_module.time.perf_counter = perf_counter
+    print("import_seconds:", stats.import_seconds)
+
+
+@run
+# CHECK-LABEL: test_import_programs
+# CHECK:     func.func @prefill(%{{.+}}: !torch.vtensor<[3,4],f32>)
+# CHECK:     torch.vtensor.literal(dense_resource<[[W:torch_tensor_4_4_torch.float32]]> : tensor<4x4xf32>)
+# CHECK:     func.func @decode(%{{.+}}: !torch.vtensor<[1,4],f32>)
+# CHECK:     torch.vtensor.literal(dense_resource<[[W]]> : tensor<4x4xf32>)
+# CHECK-NOT: torch_tensor_4_4_torch.float32_
+# CHECK:     dialect_resources
+def test_import_programs():
+    class Basic(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.w = torch.nn.Parameter(torch.randn(4, 4))
+
+        def forward(self, x):
+            return torch.mm(x, self.w)
+
+    model = Basic()
+    m = fx.import_programs(
+        {
+            "prefill": torch.export.export(model, (torch.randn(3, 4),)),
+            "decode": torch.export.export(model, (torch.randn(1, 4),)),
+        }
+    )
+    print(m)
+
+
+@run
+# CHECK-LABEL: test_fuse_pipelines
+# CHECK:     func.func @main(%{{.+}}: tensor<3x4xf32>) -> tensor<3x4xf32>
+# CHECK:     linalg.generic
+# CHECK-NOT: torch.
+def test_fuse_pipelines():
+    class Basic(nn.Module):
+        def forward(self, x):
+            return torch.tanh(x)
+
+    m = fx.export_and_import(
+        Basic(),
+        torch.randn(3, 4),
+        output_type="linalg-on-tensors",
+        fuse_pipelines=True,
+    )
+    print(m)
+
+
+@run
+# CHECK-LABEL: test_export_and_import_buckets
+# CHECK:     func.func @main_0(%{{.+}}: !torch.vtensor<[2,4],f32>)
+# CHECK:     torch.vtensor.literal(dense_resource<[[W:torch_tensor_4_4_torch.float32]]> : tensor<4x4xf32>)
+# CHECK:     func.func @main_1(%{{.+}}: !torch.vtensor<[8,4],f32>)
+# CHECK:     torch.vtensor.literal(dense_resource<[[W]]> : tensor<4x4xf32>)
+# CHECK:     main_0 (2, 4)
+# CHECK:     main_1 (8, 4) padding: 0.0
+# CHECK:     no bucket: ValueError
+def test_export_and_import_buckets():
+    class Basic(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.w = torch.nn.Parameter(torch.randn(4, 4))
+
+        def forward(self, x):
+            return torch.mm(x, self.w)
+
+    bucketed = fx.export_and_import_buckets(
+        Basic(), [(torch.randn(8, 4),), (torch.randn(2, 4),)]
+    )
+    print(bucketed.module)
+    func_name, (x,) = bucketed.dispatch(torch.ones(2, 4))
+    print(func_name, tuple(x.shape))
+    func_name, (x,) = bucketed.dispatch(torch.ones(5, 4))
+    print(func_name, tuple(x.shape), "padding:", x[5:].abs().sum().item())
+    try:
+        bucketed.dispatch(torch.ones(9, 4))
+    except ValueError as e:
+        print("no bucket:", type(e).__name__)
+
+
+@run
+# CHECK-LABEL: test_output_file
+# CHECK: is bytecode: True
+# CHECK: func.func @main(%{{.+}}: !torch.vtensor<[3,4],f32>)
+# CHECK: torch.aten.tanh
+def test_output_file():
+    class Basic(nn.Module):
+        def forward(self, x):
+            return torch.tanh(x)
+
+    stream = io.BytesIO()
+    fx.export_and_import(Basic(), torch.randn(3, 4), output_file=stream)
+    data = stream.getvalue()
+    # MLIR bytecode starts with the magic number "ML\xefR".
+    print("is bytecode:", data.startswith(b"ML\xefR"))
+    context = ir.Context()
+    torch_d.register_dialect(context)
+    print(ir.Module.parse(data, context))
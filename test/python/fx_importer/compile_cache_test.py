@@ -0,0 +1,130 @@
+# Part of the LLVM Project, under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+# Also available under a BSD-style license. See LICENSE.
+
+# RUN: rm -rf %t && %PYTHON %s %t | FileCheck %s
+
+import os
+import sys
+import threading
+
+import torch
+import torch.nn as nn
+
+from torch_mlir import fx
+from torch_mlir.compile_cache import CompileCache
+
+OUTPUT_DIR = sys.argv[1] if len(sys.argv) > 1 else os.path.dirname(__file__)
+
+
+def run(f):
+    print(f"{f.__name__}")
+    print("-" * len(f.__name__))
+    f()
+    print()
+
+
+class Basic(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.weight = nn.Parameter(torch.ones(3, 4))
+
+    def forward(self, x):
+        return torch.tanh(x) * self.weight
+
+
+@run
+# CHECK-LABEL: test_export_and_import_cache
+# CHECK: hits=0 misses=1
+# CHECK: hits=1 misses=1 same=True
+# CHECK: hits=1 misses=2
+# CHECK: hits=1 misses=3
+def test_export_and_import_cache():
+    cache = CompileCache(os.path.join(OUTPUT_DIR, "export"))
+    m = Basic()
+    first = fx.export_and_import(m, torch.randn(3, 4), cache=cache)
+    print(f"hits={cache.hits} misses={cache.misses}")
+    # Different example values with the same spec hit.
+    second = fx.export_and_import(m, torch.zeros(3, 4), cache=cache)
+    print(f"hits={cache.hits} misses={cache.misses} same={str(first) == str(second)}")
+    # Different output types and weights miss.
+    fx.export_and_import(m, torch.randn(3, 4), output_type="raw", cache=cache)
+    print(f"hits={cache.hits} misses={cache.misses}")
+    with torch.no_grad():
+        m.weight.add_(1.0)
+    fx.export_and_import(m, torch.randn(3, 4), cache=cache)
+    print(f"hits={cache.hits} misses={cache.misses}")
+
+
+OFFSET = 1.0
+
+
+def _shift(x):
+    return x + OFFSET
+
+
+class CallsHelper(nn.Module):
+    def forward(self, x):
+        return _shift(torch.tanh(x))
+
+
+@run
+# CHECK-LABEL: test_cache_key_covers_called_code
+# CHECK: hits=0 misses=1
+# CHECK: hits=1 misses=1
+# CHECK: hits=1 misses=2
+def test_cache_key_covers_called_code():
+    global OFFSET
+    cache = CompileCache(os.path.join(OUTPUT_DIR, "helper"))
+    fx.export_and_import(CallsHelper(), torch.randn(3, 4), cache=cache)
+    print(f"hits={cache.hits} misses={cache.misses}")
+    fx.export_and_import(CallsHelper(), torch.randn(3, 4), cache=cache)
+    print(f"hits={cache.hits} misses={cache.misses}")
+    # Neither the module class nor its source changed, but the graph did.
+    OFFSET = 2.0
+    fx.export_and_import(CallsHelper(), torch.randn(3, 4), cache=cache)
+    print(f"hits={cache.hits} misses={cache.misses}")
+
+
+@run
+# CHECK-LABEL: test_cache_hit_skips_export
+# CHECK: hits=1 misses=1
+def test_cache_hit_skips_export():
+    cache = CompileCache(os.path.join(OUTPUT_DIR, "skip_export"))
+    fx.export_and_import(Basic(), torch.randn(3, 4), cache=cache)
+    export = torch.export.export
+    torch.export.export = None
+    try:
+        fx.export_and_import(Basic(), torch.randn(3, 4), cache=cache)
+    finally:
+        torch.export.export = export
+    print(f"hits={cache.hits} misses={cache.misses}")
+
+
+class HoldsLock(Basic):
+    def __init__(self):
+        super().__init__()
+        # Cannot be fingerprinted, so the exported program is keyed instead.
+        self.lock = threading.Lock()
+
+
+@run
+# CHECK-LABEL: test_cache_fallback_to_program_key
+# CHECK: hits=1 misses=1
+def test_cache_fallback_to_program_key():
+    cache = CompileCache(os.path.join(OUTPUT_DIR, "fallback"))
+    fx.export_and_import(HoldsLock(), torch.randn(3, 4), cache=cache)
+    fx.export_and_import(HoldsLock(), torch.randn(3, 4), cache=cache)
+    print(f"hits={cache.hits} misses={cache.misses}")
+
+
+@run
+# CHECK-LABEL: test_cache_eviction
+# CHECK: entries: 1
+def test_cache_eviction():
+    cache = CompileCache(os.path.join(OUTPUT_DIR, "evict"), max_bytes=1)
+    fx.export_and_import(Basic(), torch.randn(3, 4), cache=cache)
+    fx.export_and_import(Basic(), torch.randn(1, 4), cache=cache)
+    # Only the most recent entry survives, even though it exceeds the bound.
+    print("entries:", len(os.listdir(cache.directory)))
@@ -0,0 +1,108 @@
+# Part of the LLVM Project, under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+# Also available under a BSD-style license. See LICENSE.
+
+# RUN: %PYTHON %s %t | FileCheck %s
+
+import gc
+import os
+import sys
+import tempfile
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from torch_mlir import fx
+from torch_mlir.extras.fx_external_parameters import (
+    ExternalParametersHooks,
+    attach_external_parameters,
+    load_external_parameters,
+)
+
+OUTPUT_DIR = sys.argv[1] if len(sys.argv) > 1 else os.path.dirname(__file__)
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+
+def run(f):
+    print(f"{f.__name__}")
+    print("-" * len(f.__name__))
+    f()
+    print()
+
+
+class Basic(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.weight = nn.Parameter(torch.arange(12, dtype=torch.float32).reshape(3, 4))
+        self.register_buffer("bias", torch.ones(4, dtype=torch.float32))
+
+    def forward(self, x):
+        return x * self.weight + self.bias
+
+
+@run
+# CHECK-LABEL: test_frozen_external_parameters
+# CHECK: module attributes {torch.external_parameter_archive = "{{.*}}frozen.safetensors"}
+# CHECK-DAG: torch.vtensor.literal(dense_resource<[[W:.+]]> : tensor<3x4xf32>) : !torch.vtensor<[3,4],f32>
+# CHECK-DAG: torch.vtensor.literal(dense_resource<[[B:.+]]> : tensor<4xf32>) : !torch.vtensor<[4],f32>
+# CHECK-NOT: dialect_resources
+# CHECK: archive entries: 2
+# CHECK: weight matches: True
+# CHECK: attached: 2
+# CHECK: dialect_resources
+def test_frozen_external_parameters():
+    path = os.path.join(OUTPUT_DIR, "frozen.safetensors")
+    with ExternalParametersHooks(path) as hooks:
+        m = fx.export_and_import(Basic(), torch.randn(3, 4), hooks=hooks)
+    print(m)
+
+    arrays = load_external_parameters(path)
+    print("archive entries:", len(arrays))
+    weight = next(a for a in arrays.values() if a.shape == (3, 4))
+    print("weight matches:", np.array_equal(weight, np.arange(12).reshape(3, 4)))
+    print("attached:", attach_external_parameters(m))
+    print(m)
+
+
+@run
+# CHECK-LABEL: test_program_external_parameters
+# CHECK-DAG: torch.vtensor.literal(dense_resource<weight> : tensor<3x4xf32>)
+# CHECK-DAG: torch.vtensor.literal(dense_resource<bias> : tensor<4xf32>)
+# CHECK: aligned: True
+def test_program_external_parameters():
+    path = os.path.join(OUTPUT_DIR, "program.safetensors")
+    with ExternalParametersHooks(path, alignment=64) as hooks:
+        m = fx.export_and_import(
+            Basic(),
+            torch.randn(3, 4),
+            hooks=hooks,
+            experimental_support_mutation=True,
+        )
+    print(m)
+    arrays = load_external_parameters(path)
+    print(
+        "aligned:",
+        all(a.ctypes.data % 64 == 0 for a in arrays.values()),
+    )
+
+
+@run
+# CHECK-LABEL: test_spill_file_cleanup
+# CHECK: raised: RuntimeError
+# CHECK: leftover files: []
+def test_spill_file_cleanup():
+    directory = tempfile.mkdtemp(dir=OUTPUT_DIR)
+    path = os.path.join(directory, "failed.safetensors")
+    try:
+        with ExternalParametersHooks(path) as hooks:
+            fx.export_and_import(Basic(), torch.randn(3, 4), hooks=hooks)
+            raise RuntimeError("import failed")
+    except RuntimeError as e:
+        print("raised:", type(e).__name__)
+    # Hooks that are never closed remove their data file when collected.
+    hooks = ExternalParametersHooks(os.path.join(directory, "dropped.safetensors"))
+    del hooks
+    gc.collect()
+    print("leftover files:", os.listdir(directory))
@@ -59,14 +59,15 @@ def test_multi_return():
             # certain convolution backwards ops (possibly among others).
             # The FxImporter does not perform special tracking of static None
             # values, instead just materializing a torch.constant.none when
-            # needed. This is an implementation detail: it would be valid to
+            # needed (which is hoisted to the top of the function like other
+            # literals). This is an implementation detail: it would be valid to
             # use the RES:0 result instead of this materialization below.
             # In practice, this doesn't arise in nature and is a by-product
             # of tracing.
+            # CHECK: %[[NONE:.*]] = torch.constant.none
             # CHECK: %[[RES:.*]]:3 = torch.operator "torch.torch_mlir_test.multi_return"(%arg0) :
             # CHECK-SAME: (!torch.vtensor<[3,4],f32>)
             # CHECK-SAME: -> (!torch.none, !torch.vtensor<[3,4],f32>, !torch.vtensor<[3,4],f32>)
-            # CHECK: %[[NONE:.*]] = torch.constant.none
             # CHECK: return %[[NONE]], %[[RES]]#1, %[[RES]]#2
             return torch.ops.torch_mlir_test.multi_return(x)
 
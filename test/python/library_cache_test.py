@@ -0,0 +1,81 @@
+# Part of the LLVM Project, under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+# Also available under a BSD-style license. See LICENSE.
+
+# RUN: %PYTHON %s | FileCheck %s
+
+import os
+import tempfile
+
+from torch_mlir import ir
+from torch_mlir._mlir_libs import _torchMlir
+from torch_mlir.dialects import torch as torch_d
+from torch_mlir.passmanager import PassManager
+
+
+def run(f):
+    print(f"{f.__name__}")
+    print("-" * len(f.__name__))
+    f()
+    print()
+
+
+EXTRA_LIBRARY = """
+module {{
+  func.func @"__torch_mlir_shape_fn.test.{name}"(%arg0: !torch.list<int>) -> !torch.list<int> {{
+    return %arg0 : !torch.list<int>
+  }}
+}}
+"""
+
+
+def reify(context: ir.Context, pass_name: str, extra_library: str = ""):
+    options = f"{{extra-library={extra_library}}}" if extra_library else ""
+    module = ir.Module.parse("module {}", context)
+    pm = PassManager.parse(f"builtin.module({pass_name}{options})", context=context)
+    pm.run(module.operation)
+
+
+@run
+# CHECK-LABEL: test_library_reused
+# CHECK: loads: 0
+# CHECK: loads: 1
+# CHECK: loads: 1
+# CHECK: other context loads: 1
+def test_library_reused():
+    context = ir.Context()
+    torch_d.register_dialect(context)
+    print("loads:", _torchMlir.get_num_library_loads(context))
+    reify(context, "torch-reify-shape-calculations")
+    print("loads:", _torchMlir.get_num_library_loads(context))
+    # Later runs, and the dtype pass, use the library parsed by the first run.
+    reify(context, "torch-reify-shape-calculations")
+    reify(context, "torch-reify-dtype-calculations")
+    print("loads:", _torchMlir.get_num_library_loads(context))
+    other = ir.Context()
+    torch_d.register_dialect(other)
+    reify(other, "torch-reify-shape-calculations")
+    print("other context loads:", _torchMlir.get_num_library_loads(other))
+
+
+@run
+# CHECK-LABEL: test_extra_library_reloaded_when_changed
+# CHECK: loads: 1
+# CHECK: unchanged loads: 1
+# CHECK: changed loads: 2
+def test_extra_library_reloaded_when_changed():
+    context = ir.Context()
+    torch_d.register_dialect(context)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "extra_library.mlir")
+        with open(path, "w") as f:
+            f.write(EXTRA_LIBRARY.format(name="a"))
+        reify(context, "torch-reify-shape-calculations", path)
+        print("loads:", _torchMlir.get_num_library_loads(context))
+        reify(context, "torch-reify-shape-calculations", path)
+        print("unchanged loads:", _torchMlir.get_num_library_loads(context))
+        with open(path, "w") as f:
+            f.write(EXTRA_LIBRARY.format(name="b"))
+        reify(context, "torch-reify-shape-calculations", path)
+        print("changed loads:", _torchMlir.get_num_library_loads(context))